@@ -0,0 +1,99 @@
+"""Benchmark parse_string() and parse_bytes() against the original parser.
+
+Run from the repository root:
+
+    python benchmarks/parse_bench.py [--number 20000]
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from burpr import burpr
+from burpr.models.BurpRequest import BurpRequest
+from burpr.enums.ProtocolEnum import ProtocolEnum
+
+
+def legacy_parse_string(string):
+    """The per-line regex parser parse_string() used before the rewrite."""
+    if isinstance(string, bytes):
+        string = string.decode('latin-1')
+    if not string.strip():
+        raise burpr.BurpParseError("Empty request string")
+
+    lines = string.replace('\r\n', '\n').split('\n')
+    parts = lines[0].split(" ", 2)
+    if len(parts) < 3:
+        raise burpr.BurpParseError(f"Invalid request line: {lines[0]}")
+    method, full_path, protocol = parts[0], parts[1], parts[2]
+    full_path = re.sub(r"\s+", "%20", full_path)
+
+    protocol_enum = ProtocolEnum.HTTP1_1
+    if protocol == "HTTP/2":
+        protocol_enum = ProtocolEnum.HTTP2
+    elif protocol == "HTTP/1.0":
+        protocol_enum = ProtocolEnum.HTTP1_0
+
+    headers = {}
+    body_start_idx = len(lines)
+    for idx, line in enumerate(lines[1:], 1):
+        if line == "":
+            body_start_idx = idx + 1
+            break
+        header_match = re.match(r'^([^:]+):(.*)$', line)
+        if header_match:
+            value = header_match.group(2)
+            if value.startswith(' '):
+                value = value[1:]
+            headers[header_match.group(1)] = value
+        else:
+            raise burpr.BurpParseError(f"Invalid header format: {line}")
+
+    body = '\n'.join(lines[body_start_idx:]) if body_start_idx < len(lines) else ""
+    if "Host" not in headers:
+        raise burpr.BurpParseError("Missing required Host header")
+    return BurpRequest(headers["Host"], full_path, protocol_enum, method, headers, body, "https")
+
+
+def make_request(headers, body_size):
+    lines = ["POST /api/v1/login?next=%2Fhome HTTP/1.1", "Host: app.example.com"]
+    lines.extend(f"X-Header-{i}: value-{i}; q=0.{i % 10}" for i in range(headers))
+    head = "\r\n".join(lines) + "\r\n\r\n"
+    body = "\r\n".join("field=%d&data=%s" % (i, "x" * 40) for i in range(body_size // 50 + 1))
+    return head + body[:body_size]
+
+
+CASES = {
+    "small (5 headers, 64 B body)": make_request(5, 64),
+    "browser (20 headers, 2 KiB body)": make_request(20, 2048),
+    "upload (20 headers, 1 MiB body)": make_request(20, 1024 * 1024),
+}
+
+
+def bench(func, arg, number):
+    return min(timeit.repeat(lambda: func(arg), number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    args = parser.parse_args()
+
+    print(f"{'case':36} {'legacy':>10} {'parse_string':>13} {'parse_bytes':>12} {'speedup':>8}")
+    for name, request in CASES.items():
+        # Large bodies are dominated by copying; fewer calls keep runs short
+        number = max(1, args.number // (1 + len(request) // 65536))
+        data = request.encode('latin-1')
+
+        legacy = bench(legacy_parse_string, request, number)
+        current = bench(burpr.parse_string, request, number)
+        raw = bench(burpr.parse_bytes, data, number)
+        print(f"{name:36} {legacy * 1e6:8.2f}us {current * 1e6:11.2f}us "
+              f"{raw * 1e6:10.2f}us {legacy / current:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
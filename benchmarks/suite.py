@@ -0,0 +1,273 @@
+"""Benchmark the request hot paths and send throughput, with JSON output.
+
+Micro-benchmarks time parse_string, bind, bind_many, render, clone,
+prepare, to_burp_format and to_bytes over four corpora: a small GET, a
+50-header browser request, a 10 MB upload and a 10-placeholder template.
+Macro-benchmarks send batches to the local HTTP/1.1 and HTTP/2 stand-in
+servers from tests/servers.py and report requests per second; they need
+a source checkout, while --only micro runs against an installed burpr.
+
+Run from the repository root:
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --compare results.json [--threshold 0.1]
+
+With --compare, every result is checked against an earlier JSON file and
+the exit status is 1 if any got slower by more than the threshold.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from burpr import burpr
+from burpr.enums.TransportEnum import TransportEnum
+from burpr.runners import run_async, PipelineSender, Http2Sender
+
+
+BROWSER_HEADERS = [
+    ("User-Agent", "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"),
+    ("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"),
+    ("Accept-Language", "en-US,en;q=0.9"),
+    ("Accept-Encoding", "gzip, deflate, br"),
+    ("Cookie", "session=8Wv1cUqvPkq0rfQXcY2b3lBJ3c9gYb3W; tracking=aaaabbbbcccc"),
+    ("Referer", "https://app.example.com/my-account"),
+    ("Sec-Fetch-Site", "same-origin"),
+    ("Sec-Fetch-Mode", "navigate"),
+    ("Sec-Fetch-Dest", "document"),
+    ("Upgrade-Insecure-Requests", "1"),
+]
+
+
+def browser_request():
+    lines = ["GET /my-account?id=%ID% HTTP/1.1", "Host: app.example.com"]
+    lines.extend(f"{key}: {value}" for key, value in BROWSER_HEADERS)
+    # Pad to 50 headers with the kind of noise real browsers and proxies add
+    lines.extend(f"X-Custom-{i}: value-{i}; q=0.{i % 10}" for i in range(50 - 1 - len(BROWSER_HEADERS)))
+    return "\r\n".join(lines) + "\r\n\r\n"
+
+
+def upload_request(size=10 * 1024 * 1024):
+    head = ("POST /upload?name=%NAME% HTTP/1.1\r\nHost: app.example.com\r\n"
+            "Content-Type: application/octet-stream\r\n\r\n")
+    line = "field=%d&data=" + "x" * 40 + "\r\n"
+    body = "".join(line % i for i in range(size // 50 + 1))
+    return head + body[:size]
+
+
+def template_request(placeholders=10):
+    fields = "&".join(f"f{i}=%P{i}%" for i in range(placeholders))
+    return ("POST /api/%P0%/submit HTTP/1.1\r\nHost: app.example.com\r\n"
+            "Content-Type: application/x-www-form-urlencoded\r\nX-Token: %P1%\r\n\r\n" + fields)
+
+
+CORPORA = {
+    "small-get": lambda: "GET /?id=%ID% HTTP/1.1\r\nHost: example.com\r\nAccept: */*\r\n\r\n",
+    "browser-50-headers": browser_request,
+    "upload-10mb": upload_request,
+    "template-10-placeholders": template_request,
+}
+
+# Placeholders bound by the bind/bind_many/render benchmarks of each corpus
+BINDINGS = {
+    "small-get": {"%ID%": "1"},
+    "browser-50-headers": {"%ID%": "1"},
+    "upload-10mb": {"%NAME%": "report.bin"},
+    "template-10-placeholders": {f"%P{i}%": f"value-{i}" for i in range(10)},
+}
+
+
+def time_call(func, repeat):
+    """Per-call seconds of func: best and median over `repeat` timing runs."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    runs = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return min(runs), statistics.median(runs)
+
+
+def micro_benchmarks(repeat, corpora):
+    results = []
+    for corpus in corpora:
+        raw = CORPORA[corpus]()
+        req = burpr.parse_string(raw)
+        template = burpr.compile(req)
+        mapping = BINDINGS[corpus]
+        placeholder, value = next(iter(mapping.items()))
+
+        operations = {
+            "parse_string": lambda: burpr.parse_string(raw),
+            "bind": lambda: burpr.clone(req).bind(placeholder, value),
+            "bind_many": lambda: burpr.clone(req).bind_many(mapping),
+            "render": lambda: template.render(mapping),
+            "clone": lambda: burpr.clone(req),
+            "prepare": lambda: burpr.prepare(req),
+            "to_burp_format": lambda: burpr.to_burp_format(req),
+            "to_bytes": lambda: burpr.to_bytes(req),
+        }
+        for operation, func in operations.items():
+            best, median = time_call(func, repeat)
+            results.append({
+                "name": f"{operation}/{corpus}",
+                "kind": "micro",
+                "unit": "s/call",
+                "better": "lower",
+                "value": best,
+                "median": median,
+            })
+            print(f"  {operation + '/' + corpus:48} {best * 1e6:12.2f}us", file=sys.stderr)
+    return results
+
+
+SEND_TEMPLATE = """POST /login?pin=%PIN% HTTP/1.1
+Host: %HOST%
+Content-Type: application/x-www-form-urlencoded
+
+mfa-code=%PIN%"""
+
+
+def local_template(server, protocol="HTTP/1.1"):
+    req = burpr.parse_string(SEND_TEMPLATE.replace("HTTP/1.1", protocol, 1)).bind("%HOST%", server.host)
+    req.transport = TransportEnum.HTTP
+    return burpr.compile(req)
+
+
+async def drain(results):
+    count = 0
+    async for _ in results:
+        count += 1
+    return count
+
+
+async def macro_benchmarks(count, concurrency, repeat):
+    import httpx
+    # The stand-in servers live with the tests, in a source checkout only,
+    # so micro-benchmarks run without them
+    from tests.servers import H1Server, H2Server
+
+    def payloads():
+        return ({"%PIN%": f"{pin:04d}"} for pin in range(count))
+
+    async def run_h1(server):
+        return await drain(run_async(local_template(server), payloads(), concurrency=concurrency))
+
+    async def run_h1_pipeline(server):
+        return await drain(PipelineSender(connections=4).run(local_template(server), payloads()))
+
+    async def run_h2(server):
+        # Cleartext HTTP/2 with prior knowledge
+        async with httpx.AsyncClient(http1=False, http2=True) as client:
+            template = local_template(server, "HTTP/2")
+            return await drain(run_async(template, payloads(), concurrency=concurrency, client=client))
+
+    async def run_h2_multiplexed(server):
+        return await drain(Http2Sender(connections=1).run(local_template(server, "HTTP/2"), payloads()))
+
+    cases = [
+        ("send/h1/run_async", H1Server, run_h1),
+        ("send/h1/pipeline", H1Server, run_h1_pipeline),
+        ("send/h2/run_async", lambda: H2Server(delay=0), run_h2),
+        ("send/h2/multiplexed", lambda: H2Server(delay=0), run_h2_multiplexed),
+    ]
+    results = []
+    for name, server_factory, run in cases:
+        rates = []
+        # A fresh server per run, so no run inherits warm connections
+        for _ in range(repeat):
+            async with server_factory() as server:
+                started = time.perf_counter()
+                sent = await run(server)
+                rates.append(sent / (time.perf_counter() - started))
+        results.append({
+            "name": name,
+            "kind": "macro",
+            "unit": "req/s",
+            "better": "higher",
+            "value": max(rates),
+            "median": statistics.median(rates),
+            "requests": sent,
+        })
+        print(f"  {name:48} {max(rates):10.0f} req/s", file=sys.stderr)
+    return results
+
+
+def environment():
+    try:
+        from importlib.metadata import version
+        burpr_version = version("burpr")
+    except Exception:
+        burpr_version = None
+    return {
+        "burpr": burpr_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print each result against a baseline run; return the regressed names."""
+    previous = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    print(f"{'benchmark':48} {'change':>9}")
+    for result in results:
+        old = previous.get(result["name"])
+        if old is None:
+            continue
+        # Positive change is always a slowdown
+        if result["better"] == "lower":
+            change = result["value"] / old["value"] - 1
+        else:
+            change = old["value"] / result["value"] - 1
+        flag = " REGRESSION" if change > threshold else ""
+        print(f"{result['name']:48} {change * 100:+8.1f}%{flag}")
+        if flag:
+            regressions.append(result["name"])
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write results as JSON to this file (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown flagged as a regression (default: 0.1)")
+    parser.add_argument("--only", choices=("micro", "macro"), help="run one kind of benchmark")
+    parser.add_argument("--corpus", action="append", choices=sorted(CORPORA), help="limit micro-benchmarks to a corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per micro-benchmark (default: 5)")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per send benchmark run (default: 1000)")
+    parser.add_argument("--send-repeat", type=int, default=3, help="runs per send benchmark (default: 3)")
+    parser.add_argument("--concurrency", type=int, default=50, help="run_async concurrency (default: 50)")
+    args = parser.parse_args()
+
+    results = []
+    if args.only != "macro":
+        print("micro-benchmarks", file=sys.stderr)
+        results += micro_benchmarks(args.repeat, args.corpus or list(CORPORA))
+    if args.only != "micro":
+        print("send benchmarks", file=sys.stderr)
+        results += asyncio.run(macro_benchmarks(args.requests, args.concurrency, args.send_repeat))
+
+    report = {"environment": environment(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
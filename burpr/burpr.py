@@ -1,5 +1,8 @@
 import re
+import base64
 from burpr.models.BurpRequest import BurpRequest
+from burpr.models.BurpItem import BurpItem
+from burpr.models.BurpTemplate import BurpTemplate
 from burpr.enums.TransportEnum import TransportEnum
 from burpr.enums.ProtocolEnum import ProtocolEnum
 
@@ -8,55 +11,62 @@ class BurpParseError(Exception):
     pass
 
 
-def parse_string(string: str | bytes) -> BurpRequest:
-    """Parse a Burp Suite HTTP request string into a BurpRequest object."""
-    # Convert bytes to string using latin-1 if needed
-    if isinstance(string, bytes):
-        string = string.decode('latin-1')
-    
-    if not string.strip():
-        raise BurpParseError("Empty request string")
-    
-    lines = string.replace('\r\n', '\n').split('\n')
-    if not lines:
-        raise BurpParseError("Invalid request format")
+# End of the header block: the first empty line, with or without CR
+HEAD_END = re.compile(r"\r?\n\r?\n")
+HEAD_END_BYTES = re.compile(rb"\r?\n\r?\n")
+NON_SPACE = re.compile(r"\S")
+NON_SPACE_BYTES = re.compile(rb"\S")
+WHITESPACE = re.compile(r"\s+")
+
+PROTOCOLS = {
+    "HTTP/2": ProtocolEnum.HTTP2,
+    "HTTP/1.0": ProtocolEnum.HTTP1_0,
+}
+
+
+def _parse_head(head):
+    """Parse the request line and headers of a header block in one pass.
     
+    Returns:
+        (method, path, protocol, headers) tuple
+    """
+    lines = head.replace('\r\n', '\n').split('\n')
     parts = lines[0].split(" ", 2)
     
     if len(parts) < 3:
       raise BurpParseError(f"Invalid request line: {lines[0]}")
     
-    method, full_path, protocol = parts[0], parts[1], parts[2]
+    method, full_path, protocol = parts
     
-    full_path = re.sub(r"\s+", "%20", full_path)
+    if not full_path.isprintable() or " " in full_path:
+        full_path = WHITESPACE.sub("%20", full_path)
     
-    # Convert protocol string to enum
-    protocol_enum = ProtocolEnum.HTTP1_1  # Default
-    if protocol == "HTTP/2":
-        protocol_enum = ProtocolEnum.HTTP2
-    elif protocol == "HTTP/1.0":
-        protocol_enum = ProtocolEnum.HTTP1_0
+    # Anything unrecognised is treated as HTTP/1.1
+    protocol_enum = PROTOCOLS.get(protocol, ProtocolEnum.HTTP1_1)
     
     # Parse headers
     headers = {}
-    body_start_idx = len(lines)
     
-    for idx, line in enumerate(lines[1:], 1):
-        if line == "":
-            body_start_idx = idx + 1
+    for line in lines[1:]:
+        # A trailing line break without a blank line leaves an empty last line
+        if not line:
             break
         
         # Handle headers with or without space after colon
-        header_match = re.match(r'^([^:]+):(.*)$', line)
-        if header_match:
-            # Strip only one leading space if present (common in HTTP)
-            value = header_match.group(2)
-            if value.startswith(' '):
-                value = value[1:]
-            headers[header_match.group(1)] = value
-        else:
+        key, colon, value = line.partition(":")
+        if not colon or not key:
             raise BurpParseError(f"Invalid header format: {line}")
+        
+        # Strip only one leading space if present (common in HTTP)
+        if value[:1] == " ":
+            value = value[1:]
+        headers[key] = value
     
+    return method, full_path, protocol_enum, headers
+
+
+def _build_request(method, full_path, protocol_enum, headers, body) -> BurpRequest:
+    """Create a BurpRequest from parsed parts, detecting the transport."""
     # Determine transport based on Host header and common patterns
     host = headers.get("Host", "")
     transport = TransportEnum.HTTPS  # Default to HTTPS
@@ -66,12 +76,6 @@ def parse_string(string: str | bytes) -> BurpRequest:
                         not headers.get("Referer", "").startswith("https://")):
         transport = TransportEnum.HTTP
     
-    # Get raw body content as string
-    body = ""
-    if body_start_idx < len(lines):
-        body_lines = lines[body_start_idx:]
-        body = '\n'.join(body_lines)
-    
     if "Host" not in headers:
         raise BurpParseError("Missing required Host header")
     
@@ -84,35 +88,215 @@ def parse_string(string: str | bytes) -> BurpRequest:
         body,
         transport
     )
-  
-def parse_file(file: str) -> BurpRequest:
-    """Parse a Burp Suite HTTP request from a file."""
+
+
+def parse_string(string: str | bytes) -> BurpRequest:
+    """Parse a Burp Suite HTTP request string into a BurpRequest object."""
+    # Convert bytes to string using latin-1 if needed
+    if isinstance(string, bytes):
+        string = string.decode('latin-1')
+    
+    if not NON_SPACE.search(string):
+        raise BurpParseError("Empty request string")
+    
+    # Only the header block is normalised; the body is kept verbatim
+    match = HEAD_END.search(string)
+    if match:
+        head, body = string[:match.start()], string[match.end():]
+    else:
+        head, body = string, ""
+    
+    method, full_path, protocol_enum, headers = _parse_head(head)
+    
+    return _build_request(method, full_path, protocol_enum, headers, body)
+
+
+def parse_bytes(data: bytes) -> BurpRequest:
+    """Parse a raw HTTP request into a BurpRequest that keeps its body as bytes.
+    
+    Only the request line and headers are decoded. The body is kept
+    byte-for-byte as `raw_body` (a memoryview input stays zero-copy) and
+    the str `body` view is only built if it is accessed.
+    
+    Args:
+        data: Request bytes, bytearray or memoryview
+        
+    Returns:
+        BurpRequest object
+    """
+    if not NON_SPACE_BYTES.search(data):
+        raise BurpParseError("Empty request string")
+    
+    match = HEAD_END_BYTES.search(data)
+    if match:
+        head, body = data[:match.start()], data[match.end():]
+    else:
+        head, body = data, b""
+    
+    method, full_path, protocol_enum, headers = _parse_head(str(head, 'latin-1'))
+    
+    return _build_request(method, full_path, protocol_enum, headers, body)
+
+
+def parse_file(file: str, use_mmap: bool = False) -> BurpRequest:
+    """Parse a Burp Suite HTTP request from a file.
+    
+    Args:
+        file: Path to the request file
+        use_mmap: Memory-map the file instead of reading it. Only the request
+                  line and headers are decoded; the body is a zero-copy
+                  memoryview into the mapping (default: False)
+        
+    Returns:
+        BurpRequest object with the body kept as raw bytes
+    """
     with open(file, "rb") as f:
-        # Read as bytes and decode with latin-1 to preserve all byte values
-        return parse_string(f.read().decode('latin-1'))
+        if not use_mmap:
+            # Read as bytes so that every byte value is preserved
+            return parse_bytes(f.read())
+        
+        import os
+        import mmap
+        
+        if os.fstat(f.fileno()).st_size == 0:
+            raise BurpParseError("Empty request string")
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    # The memoryview keeps the mapping alive after the file is closed
+    return parse_bytes(memoryview(mapping))
+
+
+def _int_or_none(value):
+    return int(value) if value and value.strip().isdigit() else None
+
+
+def iter_burp_xml(source):
+    """Stream requests from a Burp Suite "Save items" XML export.
+    
+    The export is parsed incrementally and every item is discarded once
+    yielded, so memory use does not grow with the size of the export.
+    
+    Args:
+        source: Path or binary file object of the XML export
+        
+    Yields:
+        (BurpRequest, BurpItem) tuples, in export order
+        
+    Example:
+        for req, item in iter_burp_xml("history.xml"):
+            print(item.status, req.method, req.url)
+    """
+    from xml.etree.ElementTree import iterparse
+    
+    root = None
+    for event, elem in iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            continue
+        if elem.tag != "item":
+            continue
+        
+        fields = {child.tag: child for child in elem}
+        
+        def text(tag):
+            child = fields.get(tag)
+            return child.text or "" if child is not None else ""
+        
+        def is_base64(tag):
+            child = fields.get(tag)
+            return child is not None and child.get("base64") == "true"
+        
+        raw_request = text("request")
+        if is_base64("request"):
+            raw_request = base64.b64decode(raw_request)
+        req = parse_string(raw_request)
+        
+        protocol = text("protocol")
+        port = _int_or_none(text("port"))
+        if protocol in (TransportEnum.HTTP, TransportEnum.HTTPS):
+            req.transport = TransportEnum(protocol)
+            
+            # Keep non-default ports the Host header does not mention
+            default = 443 if req.transport == TransportEnum.HTTPS else 80
+            if port and port != default and ":" not in req.host:
+                req.host = f"{req.host}:{port}"
+        
+        host = fields.get("host")
+        item = BurpItem(
+            url=text("url"),
+            host=text("host"),
+            ip=host.get("ip", "") if host is not None else "",
+            port=port,
+            protocol=protocol,
+            method=text("method"),
+            path=text("path"),
+            extension=text("extension"),
+            time=text("time"),
+            status=_int_or_none(text("status")),
+            response_length=_int_or_none(text("responselength")),
+            mime_type=text("mimetype"),
+            comment=text("comment"),
+            raw_response=text("response") or None,
+            response_base64=is_base64("response")
+        )
+        
+        # Drop the parsed item so the tree never grows
+        root.clear()
+        
+        yield req, item
 
 
 def clone(req: BurpRequest) -> BurpRequest:
-    """Create a deep copy of a BurpRequest object."""
-    import copy
+    """Create an independent copy of a BurpRequest object in O(1).
+    
+    Headers are copy-on-write and the body is immutable (or copied, for a
+    bytearray), so the copy shares storage with the original until either
+    one is modified.
+    """
+    # str, bytes and stream bodies are immutable and can be shared by the copy
+    body = req._body_source()
+    if isinstance(body, bytearray):
+        body = bytearray(body)
+    
     return BurpRequest(
         req.host,
         req.path,
         req.protocol,
         req.method,
-        copy.deepcopy(req.headers),
-        copy.deepcopy(req.body),
+        req.headers.copy(),
+        body,
         req.transport
     )
 
 
+def compile(req: BurpRequest, placeholders=None) -> BurpTemplate:
+    """Compile a request into a reusable BurpTemplate.
+    
+    Placeholder positions are located once in the host, path, headers and
+    body, so each subsequent render only splices in the new values.
+    
+    Args:
+        req: BurpRequest containing placeholders
+        placeholders: Optional list of placeholder strings to look for.
+                      Defaults to every %NAME% token in the request, which
+                      also catches URL escapes such as %E9%; render() still
+                      binds names hidden behind them, with a full scan.
+        
+    Returns:
+        BurpTemplate object
+        
+    Example:
+        template = compile(parse_string(burp_request))
+        req = template.render({"%MFA_CODE%": "1234"})
+    """
+    return BurpTemplate(req, placeholders)
+
+
 def prepare(req: BurpRequest) -> None:
     """Prepare request by setting appropriate headers."""
     # Set Content-Length based on body bytes (latin-1 encoding)
-    if req.body:
-        req.set_header("Content-Length", str(len(req.body.encode('latin-1'))))
-    else:
-        req.set_header("Content-Length", "0")
+    req.set_header("Content-Length", str(req.content_length))
 
 
 def to_burp_format(req: BurpRequest) -> str:
@@ -136,6 +320,32 @@ def to_burp_format(req: BurpRequest) -> str:
     return "\n".join(lines)
 
 
+def to_bytes(req: BurpRequest) -> bytes:
+    """Serialise a BurpRequest to HTTP/1.x wire bytes.
+    
+    Unlike to_burp_format(), lines are terminated with CRLF and the body is
+    appended verbatim. HTTP/2 requests are written with an HTTP/1.1 request
+    line, since HTTP/2 has no textual wire format.
+    
+    Args:
+        req: BurpRequest object
+        
+    Returns:
+        Request bytes ready to be written to a socket
+    """
+    protocol = req.protocol
+    if protocol == ProtocolEnum.HTTP2 or not protocol:
+        protocol = ProtocolEnum.HTTP1_1
+    
+    head = [f"{req.method} {req.path} {protocol}"]
+    head.extend(f"{key}: {value}" for key, value in req.headers.items())
+    head.append("\r\n")
+    
+    # Raw sockets need the whole request, so streamed bodies are read here
+    body = req.raw_body.load() if req.is_streaming else req.raw_body
+    return b"".join(("\r\n".join(head).encode('latin-1'), body))
+
+
 def from_curl(curl_command: str) -> BurpRequest:
     """Convert a curl command to BurpRequest.
     
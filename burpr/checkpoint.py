@@ -0,0 +1,145 @@
+import json
+import os
+import time
+from burpr.runners.async_runner import run_async
+
+STATE_VERSION = 1
+
+
+class Checkpoint:
+    """Small JSON state file holding the progress of an attack run.
+
+    Saves are atomic: the state is written to a temporary file, fsynced
+    and renamed over the previous one, so a crash mid-save leaves the last
+    good checkpoint in place.
+    """
+
+    def __init__(self, path, interval=1.0, clock=time.monotonic):
+        """
+        Args:
+            path: State file, created on the first save
+            interval: Seconds between periodic saves; 0 saves after every
+                      completed attempt (default: 1.0)
+            clock: Monotonic time source (default: time.monotonic)
+        """
+        self.path = os.fspath(path)
+        self.interval = interval
+        self.clock = clock
+        self._saved_at = clock()
+
+    def load(self):
+        """Return the saved state, or None if there is no checkpoint yet."""
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def due(self):
+        """Whether a periodic save is due."""
+        return self.clock() - self._saved_at >= self.interval
+
+    def save(self, state):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self._saved_at = self.clock()
+
+    def clear(self):
+        """Delete the state file, so the next run starts from the beginning."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self):
+        return f"Checkpoint('{self.path}', interval={self.interval})"
+
+
+def _fingerprint(attack):
+    return {"template": attack.template.id, "mode": attack.mode, "positions": attack.positions}
+
+
+async def resume(attack, checkpoint, concurrency=10, **kwargs):
+    """Run an attack with run_async(), continuing from its checkpoint if there is one.
+
+    The state file holds the attack cursor (the next position in every
+    payload source) and the payloads in flight, so restarting costs O(1)
+    however many attempts already ran: the in-flight payloads are re-sent
+    first, then the attack continues from the cursor. A final checkpoint is
+    saved when the run ends, is stopped early or fails, so those restarts
+    are exact. After a hard crash, attempts completed since the last
+    periodic save are sent again.
+
+    Payload values must be JSON-serialisable (str, int, ...).
+
+    Args:
+        attack: Attack to run
+        checkpoint: Checkpoint, or path of the state file
+        concurrency: Maximum number of requests in flight (default: 10)
+        **kwargs: Additional arguments to pass to run_async (client,
+                  return_exceptions, limiter, matcher, instrument, ...)
+
+    Yields:
+        (payload, response) tuples as requests complete, like run_async()
+
+    Example:
+        async for payload, res in burpr.resume(attack, "mfa.state", concurrency=50):
+            if res.status_code == 302:
+                print("found", payload)
+                break
+    """
+    if not isinstance(checkpoint, Checkpoint):
+        checkpoint = Checkpoint(checkpoint)
+
+    fingerprint = _fingerprint(attack)
+    saved = checkpoint.load()
+    if saved is not None:
+        if saved.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported checkpoint version in {checkpoint.path}")
+        if saved["attack"] != fingerprint:
+            raise ValueError(f"Checkpoint {checkpoint.path} belongs to a different attack")
+        if saved["done"]:
+            return
+
+    cursor = attack.cursor(saved["cursor"] if saved else None)
+    retry = saved["in_flight"] if saved else []
+    completed = saved["completed"] if saved else 0
+    # id(payload) -> payload, for every payload not yet completed that the
+    # cursor is already past. Saved ones count from the start: they may not
+    # all be pulled again before this run stops too.
+    in_flight = {id(payload): payload for payload in retry}
+
+    def payloads():
+        yield from retry
+        for payload in cursor:
+            in_flight[id(payload)] = payload
+            yield payload
+
+    def snapshot(done=False):
+        return {
+            "version": STATE_VERSION,
+            "attack": fingerprint,
+            "cursor": cursor.state(),
+            "in_flight": list(in_flight.values()),
+            "completed": completed,
+            "done": done,
+        }
+
+    results = run_async(attack.template, payloads(), concurrency, **kwargs)
+    done = False
+    try:
+        async for payload, response in results:
+            del in_flight[id(payload)]
+            completed += 1
+            yield payload, response
+            if checkpoint.due():
+                checkpoint.save(snapshot())
+        done = True
+    finally:
+        # Cancel what is still in flight; it stays in the checkpoint and is re-sent
+        await results.aclose()
+        checkpoint.save(snapshot(done))
@@ -0,0 +1,141 @@
+import atexit
+import threading
+from collections import OrderedDict
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+# Pool limits applied to clients created by the registry
+_limits = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 5.0,
+}
+# Most clients kept; the least recently used one is closed beyond this
+_max_clients = 64
+
+# Least recently used first
+_clients = OrderedDict()
+_lock = threading.Lock()
+
+
+def configure_clients(max_connections=None, max_keepalive_connections=None, keepalive_expiry=None,
+                      max_clients=None):
+    """Configure pool limits for clients created by the shared registry.
+
+    Limits apply to clients created afterwards; call close_clients() first
+    to rebuild already cached clients with the new limits.
+
+    Args:
+        max_connections: Maximum number of connections per client
+        max_keepalive_connections: Maximum number of idle connections kept alive per client
+        keepalive_expiry: Seconds an idle connection is kept alive (httpx only)
+        max_clients: Maximum number of clients cached, one per transport,
+                     host and protocol (default: 64). The least recently
+                     used client is closed to make room, so fuzzing the
+                     Host header does not leave a pool open per payload.
+    """
+    global _max_clients
+    if max_clients is not None and max_clients < 1:
+        raise ValueError("max_clients must be at least 1")
+
+    with _lock:
+        if max_clients is not None:
+            _max_clients = max_clients
+        if max_connections is not None:
+            _limits["max_connections"] = max_connections
+        if max_keepalive_connections is not None:
+            _limits["max_keepalive_connections"] = max_keepalive_connections
+        if keepalive_expiry is not None:
+            _limits["keepalive_expiry"] = keepalive_expiry
+
+
+class _RejectCookies(DefaultCookiePolicy):
+    """Cookie policy that stores nothing.
+
+    Registry clients are shared by unrelated requests, so a cookie set by
+    one response must never be sent with the next request to that host.
+    """
+
+    def set_ok(self, cookie, request):
+        return False
+
+
+def _key(backend, req):
+    return (backend, str(req.transport), req.host, req.is_http2)
+
+
+def _get(key, factory):
+    evicted = []
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = factory()
+            _clients[key] = client
+        else:
+            _clients.move_to_end(key)
+        while len(_clients) > _max_clients:
+            evicted.append(_clients.popitem(last=False)[1])
+
+    for old in evicted:
+        old.close()
+    return client
+
+
+def get_session(req):
+    """Return the shared requests.Session for the request's transport and host.
+
+    Args:
+        req: BurpRequest the session will be used for
+
+    Returns:
+        requests.Session object with a pooled HTTPAdapter mounted
+    """
+    def factory():
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.cookies.set_policy(_RejectCookies())
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_limits["max_connections"]
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    return _get(_key("requests", req), factory)
+
+
+def get_httpx_client(req):
+    """Return the shared httpx.Client for the request's transport, host and protocol.
+
+    Args:
+        req: BurpRequest the client will be used for
+
+    Returns:
+        httpx.Client object, using HTTP/2 if the request does
+    """
+    def factory():
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("httpx is required for HTTP/2 support. Install with: pip install httpx")
+
+        limits = httpx.Limits(**_limits)
+        cookies = CookieJar(policy=_RejectCookies())
+        return httpx.Client(http2=req.is_http2, limits=limits, cookies=cookies)
+
+    return _get(_key("httpx", req), factory)
+
+
+def close_clients():
+    """Close every client held by the shared registry."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_clients)
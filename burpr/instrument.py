@@ -0,0 +1,225 @@
+import time
+
+PHASES = ("queue", "connect", "tls", "write", "ttfb", "read", "total")
+
+
+class RequestTiming:
+    """Per-phase timings of one request, in seconds.
+
+    Phases a request did not go through (e.g. connect and tls on a reused
+    keep-alive connection) are None.
+
+    - queue: from submission until the request reached the network
+      (rendering, waiting for a pooled connection)
+    - connect: TCP connection setup
+    - tls: TLS handshake
+    - write: sending the request head and body
+    - ttfb: from the end of the request until the response head arrived
+      (server think-time plus one round trip)
+    - read: reading the response body
+    - total: from submission until the response was read
+    """
+
+    __slots__ = ("payload", "template_id", "status_code", "error") + PHASES
+
+    def __init__(self, payload=None, template_id=None, status_code=None, error=None, **phases):
+        self.payload = payload
+        self.template_id = template_id
+        self.status_code = status_code
+        self.error = error
+        for phase in PHASES:
+            setattr(self, phase, phases.get(phase))
+
+    @property
+    def phases(self):
+        """Mapping of phase name to seconds (or None)."""
+        return {phase: getattr(self, phase) for phase in PHASES}
+
+    def as_dict(self):
+        """Plain dictionary of the tags and phases, e.g. for JSON logging."""
+        return {
+            "payload": self.payload,
+            "template_id": self.template_id,
+            "status_code": self.status_code,
+            "error": None if self.error is None else repr(self.error),
+            **self.phases,
+        }
+
+    def __repr__(self):
+        phases = " ".join(f"{phase}={value * 1000:.2f}ms"
+                          for phase, value in self.phases.items() if value is not None)
+        return f"RequestTiming(status_code={self.status_code}, {phases})"
+
+
+class Trace:
+    """Turn httpx/httpcore trace events of one request into a RequestTiming.
+
+    Passed to httpx as the "trace" request extension. When the request is
+    done, the callback receives the RequestTiming.
+
+    Example:
+        req.make_httpx_request(instrument=lambda timing: print(timing))
+    """
+
+    def __init__(self, callback, payload=None, template_id=None, queued_at=None, clock=time.perf_counter):
+        """
+        Args:
+            callback: Callable receiving the RequestTiming
+            payload: Payload the request was rendered from, for tagging
+            template_id: Id of the template the request was rendered from, for tagging
+            queued_at: Clock value when the request was submitted
+                       (default: when it starts sending)
+            clock: Time source (default: time.perf_counter)
+        """
+        self.callback = callback
+        self.payload = payload
+        self.template_id = template_id
+        self.queued_at = queued_at
+        self.clock = clock
+        self.started = None
+        # "<step>.<started|complete|failed>" -> clock value, e.g. "connect_tcp.started"
+        self.marks = {}
+
+    def __call__(self, name, info):
+        # name is "<connection|http11|http2>.<step>.<state>"
+        self.marks.setdefault(name.partition(".")[2], self.clock())
+
+    async def atrace(self, name, info):
+        """Async variant of the trace extension, for httpx.AsyncClient."""
+        self.marks.setdefault(name.partition(".")[2], self.clock())
+
+    def extensions(self, kwargs, asynchronous=False):
+        """Merge this trace into the httpx extensions of a kwargs dict."""
+        extensions = dict(kwargs.get("extensions") or {})
+        extensions["trace"] = self.atrace if asynchronous else self
+        return {**kwargs, "extensions": extensions}
+
+    def start(self):
+        self.started = self.clock()
+        if self.queued_at is None:
+            self.queued_at = self.started
+
+    def _span(self, start, end):
+        if start in self.marks and end in self.marks:
+            return self.marks[end] - self.marks[start]
+        return None
+
+    def _mark(self, *names):
+        for name in names:
+            if name in self.marks:
+                return self.marks[name]
+        return None
+
+    def finish(self, response=None, error=None):
+        """Build the RequestTiming and hand it to the callback.
+
+        Args:
+            response: Response (anything with a status_code), if one arrived
+            error: Exception the request raised, if any
+
+        Returns:
+            The RequestTiming
+        """
+        end = self.clock()
+        if self.started is None:
+            self.start()
+
+        on_wire = self._mark("connect_tcp.started", "connect_unix_socket.started",
+                             "send_request_headers.started")
+        head_done = self._mark("receive_response_headers.complete")
+        ttfb = self._span("send_request_body.complete", "receive_response_headers.complete")
+        if not self.marks and response is not None:
+            # requests has no trace hooks: only the time to the response head is known
+            elapsed = _elapsed(response)
+            if elapsed is not None:
+                on_wire = self.started
+                head_done = self.started + elapsed
+                ttfb = elapsed
+
+        connect = self._span("connect_tcp.started", "connect_tcp.complete")
+        if connect is None:
+            connect = self._span("connect_unix_socket.started", "connect_unix_socket.complete")
+
+        # An early close (e.g. by a ResponseMatcher) ends the body read as "failed"
+        body_done = self._mark("receive_response_body.complete", "receive_response_body.failed") or end
+        timing = RequestTiming(
+            payload=self.payload,
+            template_id=self.template_id,
+            status_code=getattr(response, "status_code", None),
+            error=error,
+            queue=None if on_wire is None else on_wire - self.queued_at,
+            connect=connect,
+            tls=self._span("start_tls.started", "start_tls.complete"),
+            write=self._span("send_request_headers.started", "send_request_body.complete"),
+            ttfb=ttfb,
+            read=None if head_done is None else max(0.0, body_done - head_done),
+            total=end - self.queued_at,
+        )
+        self.callback(timing)
+        return timing
+
+
+def _elapsed(response):
+    try:
+        return response.elapsed.total_seconds()
+    except (AttributeError, RuntimeError):
+        # RuntimeError: httpx only knows it once the response is closed
+        return None
+
+
+def as_trace(instrument):
+    """Accept a prepared Trace or a plain callback."""
+    return instrument if isinstance(instrument, Trace) else Trace(instrument)
+
+
+class Profile:
+    """Instrumentation callback aggregating timings per phase.
+
+    Example:
+        profile = Profile()
+        async for payload, res in run_async(template, payloads, instrument=profile):
+            ...
+        print(profile.summary())
+    """
+
+    def __init__(self, keep=False):
+        """
+        Args:
+            keep: Also keep every RequestTiming in `timings` (default: False)
+        """
+        self.keep = keep
+        self.timings = []
+        self.count = 0
+        self.errors = 0
+        self._samples = {phase: [] for phase in PHASES}
+
+    def __call__(self, timing):
+        self.count += 1
+        if timing.error is not None:
+            self.errors += 1
+        for phase in PHASES:
+            value = getattr(timing, phase)
+            if value is not None:
+                self._samples[phase].append(value)
+        if self.keep:
+            self.timings.append(timing)
+
+    def summary(self):
+        """Per-phase count, mean, p50, p95 and max, in seconds.
+
+        Returns:
+            Dictionary of phase name to statistics, for phases that were seen
+        """
+        summary = {}
+        for phase, values in self._samples.items():
+            if not values:
+                continue
+            ordered = sorted(values)
+            summary[phase] = {
+                "count": len(ordered),
+                "mean": sum(ordered) / len(ordered),
+                "p50": ordered[(len(ordered) - 1) // 2],
+                "p95": ordered[int(0.95 * (len(ordered) - 1))],
+                "max": ordered[-1],
+            }
+        return summary
@@ -0,0 +1,314 @@
+import re
+from burpr.models.StreamBody import StreamBody
+
+MODES = ("all", "any")
+
+
+def _as_bytes(value):
+    return value.encode('latin-1') if isinstance(value, str) else bytes(value)
+
+
+class Status:
+    """Match the response status code against one or more codes."""
+
+    def __init__(self, *codes):
+        self.codes = frozenset(codes)
+
+    def head(self, status_code, headers):
+        return status_code in self.codes
+
+    def __repr__(self):
+        return f"Status({', '.join(map(str, sorted(self.codes)))})"
+
+
+class Header:
+    """Match a response header, by presence or by a substring of its value."""
+
+    def __init__(self, name, value=None):
+        """
+        Args:
+            name: Header name (case-insensitive)
+            value: Optional substring the header value must contain
+        """
+        self.name = name
+        self.value = value
+
+    def head(self, status_code, headers):
+        # RawResponse headers are lower-cased plain dicts
+        actual = headers.get(self.name)
+        if actual is None:
+            actual = headers.get(self.name.lower())
+        if actual is None:
+            return False
+        return self.value is None or self.value in actual
+
+    def __repr__(self):
+        return f"Header('{self.name}', {self.value!r})"
+
+
+class Contains:
+    """Match a substring of the response body as it streams in."""
+
+    def __init__(self, needle):
+        self.needle = _as_bytes(needle)
+
+    def head(self, status_code, headers):
+        return None
+
+    def body(self, buffer, start, end=False, complete=True):
+        # Back up far enough to catch a needle split across two chunks
+        if buffer.find(self.needle, max(0, start - len(self.needle) + 1)) != -1:
+            return True
+        return False if end else None
+
+    def __repr__(self):
+        return f"Contains({self.needle!r})"
+
+
+class Regex:
+    """Match a regular expression against the response body as it streams in.
+
+    Each chunk is searched together with the last `window` bytes before it,
+    so matches up to that long can span a chunk boundary.
+    """
+
+    def __init__(self, pattern, flags=0, window=1024):
+        if isinstance(pattern, str):
+            pattern = pattern.encode('latin-1')
+        self.pattern = re.compile(pattern, flags)
+        self.window = window
+
+    def head(self, status_code, headers):
+        return None
+
+    def body(self, buffer, start, end=False, complete=True):
+        if self.pattern.search(buffer, max(0, start - self.window)):
+            return True
+        return False if end else None
+
+    def __repr__(self):
+        return f"Regex({self.pattern.pattern!r})"
+
+
+class Length:
+    """Match the body length against an inclusive range.
+
+    Decided from Content-Length when the body is not content-encoded,
+    otherwise by counting bytes as they arrive.
+    """
+
+    def __init__(self, min=None, max=None):
+        self.min = min
+        self.max = max
+
+    def _check(self, length):
+        return (self.min is None or length >= self.min) and (self.max is None or length <= self.max)
+
+    def head(self, status_code, headers):
+        declared = headers.get("content-length")
+        if declared and declared.isdigit() and not headers.get("content-encoding"):
+            return self._check(int(declared))
+        return None
+
+    def body(self, buffer, start, end=False, complete=True):
+        if self.max is not None and len(buffer) > self.max:
+            return False
+        if not end:
+            return None
+        if complete:
+            return self._check(len(buffer))
+        # Cut off at the byte cap: only a lower bound on the length is known
+        return self.max is None and self._check(len(buffer))
+
+    def __repr__(self):
+        return f"Length(min={self.min}, max={self.max})"
+
+
+class MatchResult:
+    """Verdict of a ResponseMatcher, with what was read of the response."""
+
+    __slots__ = ("matched", "status_code", "headers", "body", "complete")
+
+    def __init__(self, matched, status_code, headers, body, complete):
+        self.matched = matched
+        self.status_code = status_code
+        self.headers = headers
+        # At most max_bytes of the body
+        self.body = body
+        # Whether the whole body was read; False when the status or headers
+        # decided the verdict before a non-empty body was read
+        self.complete = complete
+
+    def __bool__(self):
+        return self.matched
+
+    def __repr__(self):
+        return (f"MatchResult(matched={self.matched}, status_code={self.status_code}, "
+                f"body={len(self.body)} bytes, complete={self.complete})")
+
+
+def _empty_body(headers):
+    """Whether the headers announce an empty body, so nothing is left unread."""
+    return headers.get("content-length") == "0"
+
+
+class _Evaluation:
+    """Verdict state of one response run through a ResponseMatcher."""
+
+    def __init__(self, matcher):
+        self.matcher = matcher
+        self.pending = list(matcher.matchers)
+        self.verdict = None
+        self.buffer = bytearray()
+
+    def _settle(self, results):
+        """Fold individual results into the overall verdict; True when decided."""
+        decisive = self.matcher.mode == "all"
+        for item, result in results:
+            if result is None:
+                continue
+            self.pending.remove(item)
+            # all: one False decides; any: one True decides
+            if result is not decisive:
+                self.verdict = result
+                return True
+        if not self.pending:
+            self.verdict = decisive
+            return True
+        return False
+
+    def head(self, status_code, headers):
+        return self._settle([(item, item.head(status_code, headers)) for item in self.pending])
+
+    def feed(self, chunk):
+        start = len(self.buffer)
+        self.buffer += chunk[:self.matcher.max_bytes - start]
+        if self._settle([(item, item.body(self.buffer, start)) for item in self.pending]):
+            return True
+        return len(self.buffer) >= self.matcher.max_bytes
+
+    def finish(self, complete):
+        if self.verdict is None:
+            end = len(self.buffer)
+            self._settle([(item, item.body(self.buffer, end, end=True, complete=complete))
+                          for item in self.pending])
+        return self.verdict
+
+
+class ResponseMatcher:
+    """Decide whether a response matches while it is still streaming in.
+
+    The status and headers are checked first. The body is only read for as
+    long as a body matcher is undecided, and never beyond `max_bytes`. The
+    response is closed as soon as the verdict is known, so large pages are
+    not downloaded just to be searched.
+
+    Example:
+        matcher = ResponseMatcher(Status(200), Contains("Welcome back"), max_bytes=16384)
+        if matcher.match(req):
+            print("logged in")
+    """
+
+    def __init__(self, *matchers, mode="all", max_bytes=65536):
+        """
+        Args:
+            *matchers: Status, Header, Contains, Regex or Length matchers
+            mode: "all" (every matcher must match, default) or "any"
+            max_bytes: Most body bytes read per response (default: 65536)
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown match mode: {mode}. Expected one of {', '.join(MODES)}")
+        if not matchers:
+            raise ValueError("At least one matcher is required")
+
+        self.matchers = list(matchers)
+        self.mode = mode
+        self.max_bytes = max_bytes
+
+    def check(self, response):
+        """Run the matchers over an already downloaded response.
+
+        Args:
+            response: httpx/requests Response or RawResponse
+
+        Returns:
+            MatchResult
+        """
+        evaluation = _Evaluation(self)
+        if evaluation.head(response.status_code, response.headers):
+            complete = not response.content
+        else:
+            evaluation.feed(response.content)
+            complete = len(response.content) <= self.max_bytes
+        matched = evaluation.finish(complete)
+        return MatchResult(matched, response.status_code, response.headers,
+                           bytes(evaluation.buffer), complete)
+
+    @staticmethod
+    def _request_args(req, auto_prepare):
+        if auto_prepare:
+            from burpr import burpr
+            burpr.prepare(req)
+        return {"method": req.method, "url": req.url, "headers": req.headers}
+
+    def match(self, req, client=None, auto_prepare=True, **kwargs):
+        """Send a request with httpx and match the streamed response.
+
+        Args:
+            req: BurpRequest to send
+            client: Optional httpx.Client. Defaults to a shared client from
+                    the burpr client registry.
+            auto_prepare: Whether to automatically calculate Content-Length (default: True)
+            **kwargs: Additional arguments to pass to httpx
+
+        Returns:
+            MatchResult, truthy when the response matched
+        """
+        if client is None:
+            from burpr import clients
+            client = clients.get_httpx_client(req)
+
+        args = self._request_args(req, auto_prepare)
+        evaluation = _Evaluation(self)
+        with client.stream(content=req._content(stream=True), **args, **kwargs) as res:
+            complete = _empty_body(res.headers)
+            if not evaluation.head(res.status_code, res.headers):
+                complete = False
+                for chunk in res.iter_bytes():
+                    if evaluation.feed(chunk):
+                        break
+                else:
+                    complete = True
+            matched = evaluation.finish(complete)
+        return MatchResult(matched, res.status_code, res.headers, bytes(evaluation.buffer), complete)
+
+    async def amatch(self, req, client=None, auto_prepare=True, **kwargs):
+        """Async counterpart of match(), for an httpx.AsyncClient.
+
+        A temporary client is created and closed if none is given.
+        """
+        if client is None:
+            import httpx
+            async with httpx.AsyncClient(http2=req.is_http2) as client:
+                return await self.amatch(req, client, auto_prepare, **kwargs)
+
+        args = self._request_args(req, auto_prepare)
+        content = req._content(stream=True)
+        if isinstance(content, StreamBody):
+            content = content.aiter()
+
+        evaluation = _Evaluation(self)
+        async with client.stream(content=content, **args, **kwargs) as res:
+            complete = _empty_body(res.headers)
+            if not evaluation.head(res.status_code, res.headers):
+                complete = False
+                async for chunk in res.aiter_bytes():
+                    if evaluation.feed(chunk):
+                        break
+                else:
+                    complete = True
+            matched = evaluation.finish(complete)
+        return MatchResult(matched, res.status_code, res.headers, bytes(evaluation.buffer), complete)
+
+    def __repr__(self):
+        return f"ResponseMatcher({', '.join(map(repr, self.matchers))}, mode='{self.mode}')"
@@ -0,0 +1,54 @@
+import base64
+
+
+class BurpItem:
+  """Metadata of one item from a Burp Suite "Save items" XML export.
+
+  The response is kept as exported and only decoded when accessed.
+  """
+
+  def __init__(
+    self,
+    url="",
+    host="",
+    ip="",
+    port=None,
+    protocol="",
+    method="",
+    path="",
+    extension="",
+    time="",
+    status=None,
+    response_length=None,
+    mime_type="",
+    comment="",
+    raw_response=None,
+    response_base64=False
+  ):
+    self.url = url
+    self.host = host
+    self.ip = ip
+    self.port = port
+    self.protocol = protocol
+    self.method = method
+    self.path = path
+    self.extension = extension
+    self.time = time
+    self.status = status
+    self.response_length = response_length
+    self.mime_type = mime_type
+    self.comment = comment
+    self._raw_response = raw_response
+    self._response_base64 = response_base64
+
+  @property
+  def response(self):
+    """Raw response bytes, or None if the item has no response."""
+    if not self._raw_response:
+      return None
+    if self._response_base64:
+      return base64.b64decode(self._raw_response)
+    return self._raw_response.encode('latin-1')
+
+  def __repr__(self):
+    return f"BurpItem(method='{self.method}', url='{self.url}', status={self.status})"
@@ -1,6 +1,32 @@
+import re
+from functools import lru_cache
 from burpr.enums.ProtocolEnum import ProtocolEnum
+from burpr.models.StreamBody import StreamBody
+from burpr.models.Headers import Headers
+
+
+@lru_cache(maxsize=128)
+def placeholder_pattern(placeholders):
+  """Build a single alternation matching exactly the given placeholders."""
+  # Longest first so that %ID% never shadows %ID_2%
+  ordered = sorted(set(placeholders), key=len, reverse=True)
+  return re.compile("(" + "|".join(re.escape(p) for p in ordered) + ")")
+
+
+@lru_cache(maxsize=128)
+def bytes_placeholder_pattern(placeholders):
+  """placeholder_pattern() for latin-1 encoded bodies; raises UnicodeEncodeError."""
+  ordered = sorted(set(placeholders), key=len, reverse=True)
+  return re.compile(b"(" + b"|".join(re.escape(p.encode('latin-1')) for p in ordered) + b")")
+
+
+BYTES_TYPES = (bytes, bytearray, memoryview)
+
 
 class BurpRequest:
+  # Slots keep the many short-lived variants of a batch or race small
+  __slots__ = ("host", "path", "protocol", "method", "_headers", "_body", "_raw_body", "transport")
+
   def __init__(
     self,
     host="",
@@ -15,10 +41,96 @@ class BurpRequest:
     self.path = path
     self.protocol = protocol
     self.method = method
-    self.headers = headers if headers is not None else {}
+    self.headers = headers
     self.body = body
     self.transport = transport
 
+  @property
+  def headers(self):
+    """Copy-on-write header mapping, shared with clones until either side changes."""
+    return self._headers
+
+  @headers.setter
+  def headers(self, headers):
+    if headers is None:
+      headers = Headers()
+    elif not isinstance(headers, Headers):
+      headers = Headers(headers)
+    self._headers = headers
+
+  @property
+  def body(self):
+    """Body as a latin-1 str, decoded from raw_body on first access."""
+    if isinstance(self._raw_body, StreamBody):
+      # Not cached, so the stream is never held in memory past this call
+      return str(self._raw_body.load(), 'latin-1')
+    if self._body is None:
+      self._body = str(self._raw_body, 'latin-1')
+    return self._body
+
+  @body.setter
+  def body(self, body):
+    if body is None:
+      body = ""
+    if isinstance(body, BYTES_TYPES + (StreamBody,)):
+      self._body = None
+      self._raw_body = body
+    else:
+      self._body = body
+      self._raw_body = None
+
+  @property
+  def raw_body(self):
+    """Body as bytes (or a memoryview), encoded from body on first access."""
+    if self._raw_body is None:
+      self._raw_body = self._body.encode('latin-1')
+    return self._raw_body
+
+  @raw_body.setter
+  def raw_body(self, raw_body):
+    if raw_body is None:
+      raw_body = b""
+    self._body = None
+    self._raw_body = raw_body
+
+  @property
+  def content_length(self):
+    """Body length in bytes."""
+    return len(self.raw_body)
+
+  def _body_source(self):
+    """The body in whichever form it is currently held, without converting."""
+    return self._raw_body if self._body is None else self._body
+
+  @property
+  def is_streaming(self):
+    """Whether the body is a StreamBody sent in chunks."""
+    return isinstance(self._raw_body, StreamBody)
+
+  def _content(self, stream=False):
+    """Body as bytes for HTTP clients that do not accept memoryviews.
+
+    With stream=True a StreamBody is returned as-is for clients that can
+    send it chunk by chunk; otherwise it is read into memory.
+    """
+    raw_body = self.raw_body
+    if isinstance(raw_body, StreamBody):
+      return raw_body if stream else raw_body.load() or None
+    if not raw_body:
+      return None
+    return raw_body if isinstance(raw_body, bytes) else bytes(raw_body)
+
+  def _body_contains(self, placeholder):
+    # Streamed bodies are sent verbatim and never scanned for placeholders
+    if self.is_streaming:
+      return False
+    if self._body is not None:
+      return placeholder in self._body
+    raw_body = self._raw_body
+    if not isinstance(raw_body, (bytes, bytearray)):
+      raw_body = bytes(raw_body)
+    return placeholder.encode('latin-1') in raw_body
+
   @property
   def url(self):
     return f'{self.transport}://{self.host}{self.path}'
@@ -36,9 +148,7 @@ class BurpRequest:
 
   
   def set_body(self, body):
-    # Convert bytes to string using latin-1 if needed
-    if isinstance(body, bytes):
-      body = body.decode('latin-1')
+    # Bytes are kept as-is and only decoded if the str view is needed
     self.body = body
   
   
@@ -48,7 +158,7 @@ class BurpRequest:
   def __repr__(self):
     return (f"BurpRequest(host='{self.host}', path='{self.path}', "
             f"protocol='{self.protocol}', method='{self.method}', "
-            f"headers={len(self.headers)} items, body={len(self.body)} items, "
+            f"headers={len(self.headers)} items, body={self.content_length} items, "
             f"transport='{self.transport}')")
   
   def bind(self, placeholder: str, value: str):
@@ -67,15 +177,90 @@ class BurpRequest:
     # Replace in host
     self.host = self.host.replace(placeholder, str(value))
     
-    # Replace in headers
+    # Replace in headers, only writing (and so unsharing) the ones that change
+    for key, header_value in self.headers.items():
+        if placeholder in header_value:
+            self.headers[key] = header_value.replace(placeholder, str(value))
+    
+    # Replace in body, keeping raw bodies as bytes where possible
+    if self._body_contains(placeholder):
+        if self._body is None and isinstance(self._raw_body, bytes):
+            try:
+                self.raw_body = self._raw_body.replace(
+                    placeholder.encode('latin-1'), str(value).encode('latin-1'))
+            except UnicodeEncodeError:
+                self.body = self.body.replace(placeholder, str(value))
+        else:
+            self.body = self.body.replace(placeholder, str(value))
+    
+    return self
+  
+  def bind_many(self, mapping):
+    """Replace several placeholders in a single scan of each component.
+    
+    Covers the method, path, host, headers and body. Every component is
+    scanned once regardless of the number of placeholders, and replaced
+    values are never rescanned, so the result does not depend on order.
+    
+    Args:
+        mapping: Dictionary of placeholder to value (e.g. {"%TOKEN%": "abc"})
+        
+    Returns:
+        Self for method chaining
+    """
+    if not mapping:
+        return self
+    
+    values = {placeholder: str(value) for placeholder, value in mapping.items()}
+    pattern = placeholder_pattern(frozenset(values))
+    
+    def replace(text):
+        return pattern.sub(lambda match: values[match.group(0)], text)
+    
+    self.method = replace(self.method)
+    self.path = replace(self.path)
+    self.host = replace(self.host)
+    
     for key, header_value in self.headers.items():
-        self.headers[key] = header_value.replace(placeholder, str(value))
+        replaced = replace(header_value)
+        if replaced != header_value:
+            self.headers[key] = replaced
     
-    # Replace in body
-    self.body = self.body.replace(placeholder, str(value))
+    # Streamed bodies are sent verbatim and never scanned for placeholders
+    body = self._body_source()
+    if isinstance(body, str):
+        replaced = replace(body)
+        # Keep the cached encoding of an unchanged body
+        if replaced is not body:
+            self.body = replaced
+    elif not self.is_streaming:
+        self._bind_raw_body(values, replace)
     
     return self
   
+  def _bind_raw_body(self, values, replace):
+    """bind_many() over a bytes body, in a single scan that keeps it bytes."""
+    try:
+        pattern = bytes_placeholder_pattern(frozenset(values))
+    except UnicodeEncodeError:
+        # Placeholders outside latin-1 have no bytes form; match the str body
+        self.body = replace(self.body)
+        return
+    
+    try:
+        encoded = {placeholder.encode('latin-1'): value.encode('latin-1')
+                   for placeholder, value in values.items()}
+    except UnicodeEncodeError:
+        # Values outside latin-1 turn the body into a str, as bind() does
+        if pattern.search(self._raw_body):
+            self.body = replace(self.body)
+        return
+    
+    replaced, count = pattern.subn(lambda match: encoded[match.group(0)], self._raw_body)
+    # An unchanged body is kept as-is rather than replaced by a copy
+    if count:
+        self.raw_body = replaced
+  
   def to_request(self, session=None, auto_prepare=True):
     """Convert to a requests.Request or requests.PreparedRequest object.
     
@@ -100,8 +285,8 @@ class BurpRequest:
     req = requests.Request(
         method=self.method,
         url=url,
-        headers=self.headers.copy(),
-        data=self.body.encode('latin-1') if self.body else None
+        headers=dict(self.headers),
+        data=self._content(stream=True)
     )
     
     if session:
@@ -109,22 +294,21 @@ class BurpRequest:
     else:
         return req.prepare()
   
-  def make_request(self, session=None, auto_prepare=True, **kwargs):
+  def make_request(self, session=None, auto_prepare=True, instrument=None, **kwargs):
     """Execute the HTTP request using requests library.
     
     Args:
-        session: Optional requests.Session to use
+        session: Optional requests.Session to use. Defaults to a shared
+                 session from the burpr client registry.
         auto_prepare: Whether to automatically calculate Content-Length (default: True)
+        instrument: Optional callable receiving a burpr.instrument.RequestTiming.
+                    requests has no trace hooks, so only the queue, ttfb, read
+                    and total phases are reported.
         **kwargs: Additional arguments to pass to requests
         
     Returns:
         requests.Response object
     """
-    import requests
-    
-    if session is None:
-        session = requests.Session()
-    
     # Determine if we should use HTTP/2
     if self.is_http2 and 'http2' not in kwargs:
         # Note: requests doesn't support HTTP/2 natively
@@ -132,15 +316,82 @@ class BurpRequest:
         import warnings
         warnings.warn("requests library doesn't support HTTP/2. Consider using httpx instead.")
     
-    prepared = self.to_request(session, auto_prepare=auto_prepare)
-    return session.send(prepared, **kwargs)
+    if session is None:
+        from burpr import clients
+        session = clients.get_session(self)
+    
+    trace = None
+    if instrument is not None:
+        from burpr.instrument import as_trace
+        trace = as_trace(instrument)
+        trace.start()
+    
+    try:
+        response = session.send(self.to_request(session, auto_prepare=auto_prepare), **kwargs)
+    except Exception as exc:
+        if trace is not None:
+            trace.finish(error=exc)
+        raise
+    
+    if trace is not None:
+        trace.finish(response)
+    return response
   
-  def make_httpx_request(self, client=None, auto_prepare=True, **kwargs):
+  def make_httpx_request(self, client=None, auto_prepare=True, instrument=None, **kwargs):
     """Execute the HTTP request using httpx library (supports HTTP/2).
     
     Args:
-        client: Optional httpx.Client to use
+        client: Optional httpx.Client to use. Defaults to a shared client
+                from the burpr client registry.
         auto_prepare: Whether to automatically calculate Content-Length (default: True)
+        instrument: Optional callable receiving a burpr.instrument.RequestTiming
+                    with the connect, TLS, write, TTFB and body read phases
+        **kwargs: Additional arguments to pass to httpx
+        
+    Returns:
+        httpx.Response object
+    """
+    if client is None:
+        from burpr import clients
+        client = clients.get_httpx_client(self)
+    
+    # Auto-prepare if requested
+    if auto_prepare:
+        from burpr import burpr
+        burpr.prepare(self)
+    
+    trace = None
+    if instrument is not None:
+        from burpr.instrument import as_trace
+        trace = as_trace(instrument)
+        kwargs = trace.extensions(kwargs)
+        trace.start()
+    
+    try:
+        response = client.request(
+            method=self.method,
+            url=self.url,
+            headers=self.headers,
+            content=self._content(stream=True),
+            **kwargs
+        )
+    except Exception as exc:
+        if trace is not None:
+            trace.finish(error=exc)
+        raise
+    
+    if trace is not None:
+        trace.finish(response)
+    return response
+  
+  async def amake_request(self, client=None, auto_prepare=True, instrument=None, **kwargs):
+    """Execute the HTTP request asynchronously using httpx (supports HTTP/2).
+    
+    Args:
+        client: Optional httpx.AsyncClient to use
+        auto_prepare: Whether to automatically calculate Content-Length (default: True)
+        instrument: Optional callable receiving a burpr.instrument.RequestTiming
+                    with the connect, TLS, write, TTFB and body read phases
         **kwargs: Additional arguments to pass to httpx
         
     Returns:
@@ -149,20 +400,42 @@ class BurpRequest:
     try:
         import httpx
     except ImportError:
-        raise ImportError("httpx is required for HTTP/2 support. Install with: pip install httpx")
-    
-    if client is None:
-        client = httpx.Client(http2=self.is_http2)
+        raise ImportError("httpx is required for async support. Install with: pip install httpx")
     
     # Auto-prepare if requested
     if auto_prepare:
         from burpr import burpr
         burpr.prepare(self)
     
-    return client.request(
-        method=self.method,
-        url=self.url,
-        headers=self.headers,
-        content=self.body.encode('latin-1') if self.body else None,
-        **kwargs
-    )
\ No newline at end of file
+    if client is None:
+        async with httpx.AsyncClient(http2=self.is_http2) as client:
+            return await self.amake_request(client, auto_prepare=False, instrument=instrument, **kwargs)
+    
+    # httpx picks the sync stream for anything iterable, so hand it the async one
+    content = self._content(stream=True)
+    if isinstance(content, StreamBody):
+        content = content.aiter()
+    
+    trace = None
+    if instrument is not None:
+        from burpr.instrument import as_trace
+        trace = as_trace(instrument)
+        kwargs = trace.extensions(kwargs, asynchronous=True)
+        trace.start()
+    
+    try:
+        response = await client.request(
+            method=self.method,
+            url=self.url,
+            headers=self.headers,
+            content=content,
+            **kwargs
+        )
+    except Exception as exc:
+        if trace is not None:
+            trace.finish(error=exc)
+        raise
+    
+    if trace is not None:
+        trace.finish(response)
+    return response
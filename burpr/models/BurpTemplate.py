@@ -0,0 +1,124 @@
+import hashlib
+import re
+from burpr.models.BurpRequest import BurpRequest, placeholder_pattern
+from burpr.enums.ProtocolEnum import ProtocolEnum
+
+# Default placeholder format, e.g. %TOKEN% or %MFA_CODE%
+PLACEHOLDER_PATTERN = re.compile(r"(%[A-Za-z_][A-Za-z0-9_]*%)")
+
+
+def split_segments(text, pattern):
+  """Split text into alternating literal and placeholder segments.
+
+  Even indices hold literal text, odd indices hold placeholder tokens.
+  A text without placeholders is returned as a single literal segment.
+  """
+  return tuple(pattern.split(text))
+
+
+def render_segments(segments, values):
+  """Splice values into compiled segments, leaving unbound placeholders as-is."""
+  if len(segments) == 1:
+    return segments[0]
+  parts = list(segments)
+  for i in range(1, len(parts), 2):
+    value = values.get(parts[i])
+    if value is not None:
+      parts[i] = value
+  return "".join(parts)
+
+
+class BurpTemplate:
+  """A BurpRequest compiled once into literal segments and placeholder slots.
+
+  Rendering a template splices values between precomputed segments, so the
+  cost of each attempt scales with the number of placeholders instead of
+  the size of the request.
+  """
+
+  def __init__(self, req, placeholders=None):
+    pattern = placeholder_pattern(frozenset(placeholders)) if placeholders else PLACEHOLDER_PATTERN
+
+    self.protocol = req.protocol
+    self.transport = req.transport
+    self._method = split_segments(req.method, pattern)
+    self._host = split_segments(req.host, pattern)
+    self._path = split_segments(req.path, pattern)
+    self._headers = [
+      (key, split_segments(value, pattern)) for key, value in req.headers.items()
+    ]
+    # Streamed bodies are sent verbatim and shared by every render
+    self._body = (req._raw_body,) if req.is_streaming else split_segments(req.body, pattern)
+
+    found = set()
+    for segments in (self._method, self._host, self._path, self._body, *(s for _, s in self._headers)):
+      found.update(segments[1::2])
+    self.placeholders = frozenset(found)
+    # Names the request was scanned for: found ones, and requested ones known to be absent
+    self._scanned = self.placeholders | frozenset(placeholders or ())
+    self.dynamic_headers = frozenset(key for key, segments in self._headers if len(segments) > 1)
+    self._id = None
+
+  @property
+  def method(self):
+    return "".join(self._method)
+
+  @property
+  def is_http2(self):
+    return self.protocol == ProtocolEnum.HTTP2
+
+  @property
+  def id(self):
+    """Short content fingerprint, stable across runs and processes.
+
+    Used to tag results and instrumentation events with the template they came from.
+    """
+    if self._id is None:
+      digest = hashlib.sha1()
+      parts = [self._method, self._host, self._path, *((key, *segments) for key, segments in self._headers)]
+      for segments in parts:
+        digest.update("\x00".join(segments).encode('utf-8', 'surrogateescape') + b"\x01")
+      for segment in self._body:
+        # Streamed bodies are identified by their type only
+        digest.update(segment.encode('utf-8', 'surrogateescape') if isinstance(segment, str)
+                      else type(segment).__name__.encode())
+      self._id = digest.hexdigest()[:12]
+    return self._id
+
+  def covers(self, placeholders):
+    """Whether render() can bind these placeholders without rescanning the request."""
+    return self._scanned.issuperset(placeholders)
+
+  def render(self, values=None):
+    """Build a new BurpRequest with placeholders replaced by values.
+
+    Args:
+        values: Mapping of placeholder (e.g. "%TOKEN%") to replacement value.
+                Placeholders without a value are left untouched. Keys the
+                template was not compiled with (e.g. %USER% hidden behind a
+                %E9% escape) are bound with a full scan, as bind_many() does.
+
+    Returns:
+        A fresh BurpRequest that shares nothing mutable with the template
+    """
+    values = {key: str(value) for key, value in (values or {}).items()}
+    if not self._scanned.issuperset(values):
+      return self.request().bind_many(values)
+
+    return BurpRequest(
+      render_segments(self._host, values),
+      render_segments(self._path, values),
+      self.protocol,
+      render_segments(self._method, values),
+      {key: render_segments(segments, values) for key, segments in self._headers},
+      render_segments(self._body, values),
+      self.transport
+    )
+
+  def request(self):
+    """Return the template as a BurpRequest with all placeholders intact."""
+    return self.render()
+
+  def __repr__(self):
+    return (f"BurpTemplate(method='{self.method}', "
+            f"placeholders={sorted(self.placeholders)})")
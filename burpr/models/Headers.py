@@ -0,0 +1,84 @@
+from collections.abc import MutableMapping
+
+
+class Headers(MutableMapping):
+  """Copy-on-write header mapping.
+
+  copy() is O(1): the copy shares the underlying dict with its parent,
+  and whichever side is written to first takes a private copy of it.
+  Reads go straight to the shared dict.
+
+  It is a MutableMapping, not a dict: use dict(headers) where a real dict
+  is required, e.g. for json.dumps().
+  """
+
+  __slots__ = ("_data", "_shared")
+
+  def __init__(self, data=None):
+    """
+    Args:
+        data: Optional dict of header name to value. It is used as-is, not copied.
+    """
+    self._data = {} if data is None else data
+    self._shared = False
+
+  def _own(self):
+    if self._shared:
+      self._data = dict(self._data)
+      self._shared = False
+
+  def __getitem__(self, key):
+    return self._data[key]
+
+  def __setitem__(self, key, value):
+    self._own()
+    self._data[key] = value
+
+  def __delitem__(self, key):
+    self._own()
+    del self._data[key]
+
+  def __iter__(self):
+    return iter(self._data)
+
+  def __len__(self):
+    return len(self._data)
+
+  def __contains__(self, key):
+    return key in self._data
+
+  # The mixin versions go through __getitem__; the dict ones are much faster
+  def get(self, key, default=None):
+    return self._data.get(key, default)
+
+  def keys(self):
+    return self._data.keys()
+
+  def values(self):
+    return self._data.values()
+
+  def items(self):
+    return self._data.items()
+
+  def clear(self):
+    self._data = {}
+    self._shared = False
+
+  def copy(self):
+    """Return a copy that shares storage until either side is modified."""
+    clone = Headers(self._data)
+    clone._shared = self._shared = True
+    return clone
+
+  def __copy__(self):
+    return self.copy()
+
+  def __eq__(self, other):
+    if isinstance(other, Headers):
+      return self._data == other._data
+    if isinstance(other, dict):
+      return self._data == other
+    return super().__eq__(other)
+
+  def __repr__(self):
+    return f"Headers({self._data!r})"
@@ -0,0 +1,125 @@
+import os
+
+
+class StreamBody:
+  """Base class for request bodies streamed in chunks instead of held in memory.
+
+  A stream body has a known length, so prepare() can still set
+  Content-Length, and it is sent chunk by chunk by the HTTP clients.
+  """
+
+  chunk_size = 65536
+
+  def __len__(self):
+    raise NotImplementedError
+
+  def __iter__(self):
+    raise NotImplementedError
+
+  async def aiter(self):
+    """Iterate over the chunks from async code."""
+    for chunk in self:
+      yield chunk
+
+  def load(self):
+    """Load the whole body into memory."""
+    return b"".join(self)
+
+  def __repr__(self):
+    return f"{type(self).__name__}({len(self)} bytes)"
+
+
+class FileBody(StreamBody):
+  """Body that streams a region of a file from disk on every send.
+
+  Example:
+      req.set_body(FileBody("firmware.bin"))
+      burpr.prepare(req)  # Content-Length from the file size
+      req.make_request()  # streamed, never loaded into memory
+  """
+
+  def __init__(self, path, offset=0, length=None, chunk_size=65536):
+    """
+    Args:
+        path: Path of the file to send
+        offset: Byte offset of the region to send (default: 0)
+        length: Number of bytes to send (default: up to the end of the file)
+        chunk_size: Bytes read per chunk (default: 65536)
+    """
+    self.path = path
+    self.offset = offset
+    self.length = os.path.getsize(path) - offset if length is None else length
+    self.chunk_size = chunk_size
+
+  def __len__(self):
+    return self.length
+
+  def __iter__(self):
+    with open(self.path, "rb") as f:
+      f.seek(self.offset)
+      remaining = self.length
+      while remaining > 0:
+        chunk = f.read(min(self.chunk_size, remaining))
+        if not chunk:
+          raise ValueError(f"{self.path} is shorter than the declared body length")
+        remaining -= len(chunk)
+        yield chunk
+
+  async def aiter(self):
+    import asyncio
+
+    # Read in a worker thread so the event loop never blocks on disk I/O
+    with open(self.path, "rb") as f:
+      f.seek(self.offset)
+      remaining = self.length
+      while remaining > 0:
+        chunk = await asyncio.to_thread(f.read, min(self.chunk_size, remaining))
+        if not chunk:
+          raise ValueError(f"{self.path} is shorter than the declared body length")
+        remaining -= len(chunk)
+        yield chunk
+
+
+class IterBody(StreamBody):
+  """Body produced by an iterator of chunks with a known total length.
+
+  The iterator can only be consumed once, so the request can only be
+  sent once.
+  """
+
+  def __init__(self, chunks, length):
+    """
+    Args:
+        chunks: Iterable (or async iterable) of bytes chunks; str chunks are latin-1 encoded
+        length: Total number of bytes the chunks add up to
+    """
+    self.chunks = chunks
+    self.length = length
+    self._consumed = False
+
+  def __len__(self):
+    return self.length
+
+  def _claim(self):
+    if self._consumed:
+      raise RuntimeError("IterBody chunks have already been consumed")
+    self._consumed = True
+
+  @staticmethod
+  def _encode(chunk):
+    return chunk.encode('latin-1') if isinstance(chunk, str) else bytes(chunk)
+
+  def __iter__(self):
+    self._claim()
+    for chunk in self.chunks:
+      yield self._encode(chunk)
+
+  async def aiter(self):
+    if not hasattr(self.chunks, "__aiter__"):
+      for chunk in self:
+        yield chunk
+      return
+
+    self._claim()
+    async for chunk in self.chunks:
+      yield self._encode(chunk)
@@ -0,0 +1,172 @@
+import mmap
+import os
+
+# Bytes scanned per step when counting lines
+COUNT_CHUNK = 1 << 20
+# Bytes split into lines per step when iterating
+READ_CHUNK = 1 << 18
+
+
+class Wordlist:
+    """Payload source that memory-maps a wordlist and yields one line at a time.
+
+    Lines are decoded one by one as they are read, so the file is never
+    loaded or decoded as a whole. The wordlist is re-iterable and holds
+    no open file between iterations, so it can be used several times by
+    an Attack and handed to worker processes.
+
+    Example:
+        passwords = burpr.Wordlist("rockyou.txt")
+        mine = passwords.shard(worker_id, workers)
+        attack = burpr.Attack(template, ["%PASS%"], [mine])
+    """
+
+    def __init__(self, path, encoding="latin-1", errors="strict", start=0, end=None):
+        """
+        Args:
+            path: Path of the wordlist file, one payload per line
+            encoding: Encoding used to decode each line (default: "latin-1",
+                      which passes the file's bytes through unchanged)
+            errors: Error handler for decoding (default: "strict")
+            start: Byte offset of the first line to yield (default: 0)
+            end: Byte offset at which to stop (default: end of the file)
+        """
+        self.path = path
+        self.encoding = encoding
+        self.errors = errors
+        self.start = start
+        self.end = os.path.getsize(path) if end is None else end
+        self._count = None
+
+    def _map(self):
+        with open(self.path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __iter__(self):
+        return self._read(self.start, False)
+
+    def iter_from(self, position=None):
+        """Iterate from a byte offset, yielding (line, next_offset) pairs.
+
+        next_offset is where the following line starts, so iteration can be
+        resumed from it in O(1), e.g. after a checkpointed attack run stops.
+
+        Args:
+            position: Byte offset of a line start returned by an earlier
+                      iteration (default: the start of this wordlist)
+        """
+        return self._read(self.start if position is None else position, True)
+
+    def _read(self, start, positions):
+        if start >= self.end:
+            return
+
+        mapping = self._map()
+        try:
+            # A line belongs to the shard in which it starts, so finish the last one
+            stop = self.end
+            if mapping[stop - 1] != ord("\n"):
+                newline = mapping.find(b"\n", stop)
+                stop = len(mapping) if newline == -1 else newline + 1
+
+            # Split a block at a time; only the lines themselves are decoded
+            encoding, errors = self.encoding, self.errors
+            carry = b""
+            line_start = start
+            for offset in range(start, stop, READ_CHUNK):
+                lines = (carry + mapping[offset:min(offset + READ_CHUNK, stop)]).split(b"\n")
+                carry = lines.pop()
+                for line in lines:
+                    line_start += len(line) + 1
+                    if line[-1:] == b"\r":
+                        line = line[:-1]
+                    if positions:
+                        yield line.decode(encoding, errors), line_start
+                    else:
+                        yield line.decode(encoding, errors)
+            if carry:
+                if carry[-1:] == b"\r":
+                    carry = carry[:-1]
+                yield (carry.decode(encoding, errors), stop) if positions else carry.decode(encoding, errors)
+        finally:
+            mapping.close()
+
+    def _boundary(self, mapping, offset):
+        """First line start at or after offset, within this wordlist."""
+        if offset <= self.start:
+            return self.start
+        newline = mapping.find(b"\n", offset - 1, self.end)
+        return self.end if newline == -1 else min(newline + 1, self.end)
+
+    def shard(self, index, count):
+        """Return the index-th of count disjoint slices of this wordlist.
+
+        Slices are cut at byte offsets and moved forward to the next line
+        start, so each line lands in exactly one shard. Shards hold similar
+        numbers of bytes, not necessarily of lines.
+
+        Args:
+            index: Shard number, from 0 to count - 1
+            count: Total number of shards
+
+        Returns:
+            A Wordlist covering the shard's byte range
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"Shard index must be between 0 and {count - 1}")
+
+        size = self.end - self.start
+        bounds = [self.start + size * index // count, self.start + size * (index + 1) // count]
+        if size > 0:
+            mapping = self._map()
+            try:
+                bounds = [self._boundary(mapping, offset) for offset in bounds]
+            finally:
+                mapping.close()
+
+        return Wordlist(self.path, self.encoding, self.errors, bounds[0], bounds[1])
+
+    def __len__(self):
+        """Number of lines, counted once in C-speed chunks and cached."""
+        if self._count is None:
+            self._count = self._count_lines()
+        return self._count
+
+    def _count_lines(self):
+        if self.start >= self.end:
+            return 0
+
+        mapping = self._map()
+        try:
+            count = 0
+            for offset in range(self.start, self.end, COUNT_CHUNK):
+                count += mapping[offset:min(offset + COUNT_CHUNK, self.end)].count(b"\n")
+            # A final line without a line break still counts
+            if mapping[self.end - 1] != ord("\n"):
+                count += 1
+            return count
+        finally:
+            mapping.close()
+
+    def estimate(self, sample=65536):
+        """Estimate the number of lines from the first `sample` bytes, in O(1).
+
+        Useful for progress bars on very large wordlists, where even one
+        counting pass over the file is too slow to wait for.
+        """
+        if self._count is not None:
+            return self._count
+
+        size = self.end - self.start
+        if size <= sample:
+            return len(self)
+
+        mapping = self._map()
+        try:
+            lines = mapping[self.start:self.start + sample].count(b"\n")
+        finally:
+            mapping.close()
+        return round(size * lines / sample) if lines else 1
+
+    def __repr__(self):
+        return f"Wordlist(path='{self.path}', start={self.start}, end={self.end})"
@@ -0,0 +1,274 @@
+import hashlib
+import os
+import struct
+import time
+
+MAGIC = b"BURPLOG"
+VERSION = 1
+# Magic, format version and the per-record hash size of the file
+HEADER = struct.Struct("<7sBB")
+# payload id, status, response length, latency (s), flags
+FIELDS = struct.Struct("<QHIfB")
+HASH_SIZES = (0, 8, 16, 32)
+
+VERDICT_KNOWN = 1
+VERDICT_MATCHED = 2
+
+READ_CHUNK = 1 << 16
+
+
+def response_hash(body, size=16):
+    """BLAKE2b digest of a response body, `size` bytes long."""
+    return hashlib.blake2b(body, digest_size=size).digest()
+
+
+def response_body(response):
+    """The whole body of a response or MatchResult, or None if it was not all read.
+
+    A MatchResult decided by its status or headers, or cut short once the
+    verdict was known, holds only part of the body (possibly none of it).
+    """
+    if hasattr(response, "matched"):
+        return response.body if response.complete else None
+    return getattr(response, "content", None)
+
+
+def response_length(response, body=None):
+    """Body length: from the body when it was read, otherwise from Content-Length."""
+    if body is not None:
+        return len(body)
+    return int(response.headers.get("content-length") or 0)
+
+
+class ResultRecord:
+    """One attempt read back from a result log."""
+
+    __slots__ = ("payload_id", "status", "length", "latency", "matched", "hash")
+
+    def __init__(self, payload_id, status, length, latency, matched, hash):
+        self.payload_id = payload_id
+        self.status = status
+        self.length = length
+        # Seconds, stored as a 32-bit float
+        self.latency = latency
+        # True/False, or None when no matcher ran
+        self.matched = matched
+        # Response body digest, or None when the log keeps no hashes
+        self.hash = hash
+
+    def __eq__(self, other):
+        if not isinstance(other, ResultRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return (f"ResultRecord(payload_id={self.payload_id}, status={self.status}, "
+                f"length={self.length}, latency={self.latency:.4f}, matched={self.matched})")
+
+
+def _read_header(f, path):
+    header = f.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"Not a burpr result log (truncated header): {path}")
+    magic, version, hash_size = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"Not a burpr result log: {path}")
+    if version != VERSION:
+        raise ValueError(f"Unsupported result log version {version}: {path}")
+    return hash_size
+
+
+class ResultLog:
+    """Append-only log of fixed-size binary records, one per attempt.
+
+    Each record holds the payload id, status, response length, latency,
+    matcher verdict and, if `hash_size` is set, a digest of the response
+    body: 19 bytes plus the hash. Records are buffered and written in
+    batches of `batch_size`, or once `fsync_interval` seconds have passed,
+    and then fsynced, so a crash loses at most that much. A record torn by
+    a crash is dropped when the log is reopened. Records are fixed-size,
+    so counting them and seeking to the n-th one are O(1).
+
+    Example:
+        with ResultLog("campaign.log", hash_size=16) as log:
+            async for payload, result in run_async(template, pins, matcher=matcher):
+                log.add(int(payload["%PIN%"]), result)
+
+        hits = [r.payload_id for r in iter_results("campaign.log", matched=True)]
+    """
+
+    def __init__(self, path, hash_size=0, batch_size=4096, fsync_interval=1.0, clock=time.monotonic):
+        """
+        Args:
+            path: Log file, created if missing and appended to otherwise
+            hash_size: Bytes of response hash kept per record: 0 (none), 8, 16 or 32.
+                       An existing log keeps the size it was created with.
+            batch_size: Records buffered before a write (default: 4096)
+            fsync_interval: Most seconds records stay buffered before being
+                            written and fsynced, or None to only fsync on
+                            close (default: 1.0)
+            clock: Monotonic time source (default: time.monotonic)
+        """
+        if hash_size not in HASH_SIZES:
+            raise ValueError(f"hash_size must be one of {', '.join(map(str, HASH_SIZES))}")
+
+        self.path = path
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        self.clock = clock
+
+        self._file = open(path, "a+b")
+        self._file.seek(0, os.SEEK_END)
+        size = self._file.tell()
+        if size == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, hash_size))
+            size = HEADER.size
+        else:
+            self._file.seek(0)
+            hash_size = _read_header(self._file, path)
+
+        self.hash_size = hash_size
+        self.record_size = FIELDS.size + hash_size
+        # Drop a record torn by a crash mid-write, so appends stay aligned
+        torn = (size - HEADER.size) % self.record_size
+        if torn:
+            self._file.truncate(size - torn)
+        self._file.seek(0, os.SEEK_END)
+
+        self._count = (self._file.tell() - HEADER.size) // self.record_size
+        self._buffer = bytearray()
+        self._pending = 0
+        self._synced_at = clock()
+
+    def append(self, payload_id, status, length=0, latency=0.0, matched=None, body_hash=None):
+        """Add one record.
+
+        Args:
+            payload_id: Non-negative integer identifying the payload, e.g. its index
+            status: HTTP status code (0 for a failed request)
+            length: Response body length in bytes
+            latency: Seconds from send to response
+            matched: Matcher verdict, or None when no matcher ran
+            body_hash: Response body digest of `hash_size` bytes (see response_hash()),
+                       or None
+        """
+        flags = 0 if matched is None else VERDICT_KNOWN | (VERDICT_MATCHED if matched else 0)
+        self._buffer += FIELDS.pack(payload_id, status, length, latency, flags)
+        if self.hash_size:
+            if body_hash is None:
+                body_hash = bytes(self.hash_size)
+            elif len(body_hash) != self.hash_size:
+                raise ValueError(f"body_hash must be {self.hash_size} bytes")
+            self._buffer += body_hash
+
+        self._pending += 1
+        if self._pending >= self.batch_size or self._sync_due():
+            self.flush()
+
+    def add(self, payload_id, response, latency=0.0, matched=None):
+        """Add a record for a response, an exception or a MatchResult.
+
+        The length and hash are taken from the body only when all of it was
+        read; otherwise the length comes from Content-Length and no hash is
+        stored. A MatchResult supplies its own verdict.
+        """
+        if isinstance(response, BaseException):
+            self.append(payload_id, 0, 0, latency, matched)
+            return
+
+        if matched is None and hasattr(response, "matched"):
+            matched = response.matched
+
+        body = response_body(response)
+        length = response_length(response, body)
+        body_hash = response_hash(body, self.hash_size) if self.hash_size and body is not None else None
+        self.append(payload_id, response.status_code, length, latency, matched, body_hash)
+
+    def _sync_due(self):
+        return self.fsync_interval is not None and self.clock() - self._synced_at >= self.fsync_interval
+
+    def _write(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._count += self._pending
+            self._buffer.clear()
+            self._pending = 0
+        self._file.flush()
+
+    def flush(self):
+        """Write buffered records, fsyncing if fsync_interval has passed."""
+        self._write()
+        if self._sync_due():
+            self.sync()
+
+    def sync(self):
+        """Write buffered records and fsync the file."""
+        self._write()
+        os.fsync(self._file.fileno())
+        self._synced_at = self.clock()
+
+    def close(self):
+        """Write and fsync everything, then close the file."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __len__(self):
+        """Records in the log, including buffered ones."""
+        return self._count + self._pending
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"ResultLog('{self.path}', records={len(self)}, hash_size={self.hash_size})"
+
+
+def iter_results(path, start=0, status=None, matched=None, where=None):
+    """Stream records from a result log without loading it.
+
+    Args:
+        path: Log file written by ResultLog
+        start: Index of the first record to read; seeking there is O(1)
+        status: Only yield records with this status, or one of these statuses
+        matched: Only yield records with this matcher verdict, True or False
+        where: Optional predicate over ResultRecord for any other filter
+
+    Yields:
+        ResultRecord objects in log order. A trailing record torn by a
+        crash is skipped.
+
+    Example:
+        for record in iter_results("campaign.log", status=(200, 302)):
+            print(record.payload_id, record.length)
+    """
+    statuses = None
+    if status is not None:
+        statuses = frozenset((status,) if isinstance(status, int) else status)
+
+    with open(path, "rb") as f:
+        hash_size = _read_header(f, path)
+        record_size = FIELDS.size + hash_size
+        f.seek(HEADER.size + start * record_size)
+
+        unpack = FIELDS.unpack_from
+        # Whole records per read, so none straddles two chunks
+        chunk_size = max(1, READ_CHUNK // record_size) * record_size
+        while True:
+            chunk = f.read(chunk_size)
+            if len(chunk) < record_size:
+                return
+            for offset in range(0, len(chunk) - record_size + 1, record_size):
+                payload_id, code, length, latency, flags = unpack(chunk, offset)
+                if statuses is not None and code not in statuses:
+                    continue
+                verdict = bool(flags & VERDICT_MATCHED) if flags & VERDICT_KNOWN else None
+                if matched is not None and verdict is not matched:
+                    continue
+                digest = chunk[offset + FIELDS.size:offset + record_size] if hash_size else None
+                record = ResultRecord(payload_id, code, length, latency, verdict, digest)
+                if where is None or where(record):
+                    yield record
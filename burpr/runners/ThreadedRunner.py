@@ -0,0 +1,130 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class ThreadedRunner:
+  """Send BurpRequests with the requests library from a pool of worker threads.
+
+  Every worker thread owns a persistent requests.Session, so connections and
+  TLS sessions are reused across attempts instead of being rebuilt per call.
+
+  Example:
+      with burpr.ThreadedRunner(workers=16) as runner:
+          for req, res in runner.run(requests):
+              print(res.status_code, req.body)
+  """
+
+  def __init__(self, workers=8, pool_connections=10, pool_maxsize=2, session_factory=None):
+    """
+    Args:
+        workers: Number of worker threads (default: 8)
+        pool_connections: Number of per-host pools kept by each worker's HTTPAdapter
+        pool_maxsize: Maximum connections kept per host by each worker's HTTPAdapter
+        session_factory: Optional callable returning a configured requests.Session,
+                         e.g. with proxy auth or custom adapters mounted
+    """
+    if workers < 1:
+      raise ValueError("workers must be at least 1")
+
+    self.workers = workers
+    self.pool_connections = pool_connections
+    self.pool_maxsize = pool_maxsize
+    self.session_factory = session_factory or self._default_session
+    self._local = threading.local()
+    self._sessions = []
+    self._lock = threading.Lock()
+    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="burpr")
+
+  def _default_session(self):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+  @property
+  def session(self):
+    """The requests.Session owned by the calling worker thread."""
+    session = getattr(self._local, "session", None)
+    if session is None:
+      session = self.session_factory()
+      self._local.session = session
+      with self._lock:
+        self._sessions.append(session)
+    return session
+
+  def _send(self, req, kwargs):
+    return req.make_request(self.session, **kwargs)
+
+  def run(self, requests, ordered=False, return_exceptions=False, **kwargs):
+    """Send requests from an iterator and stream back the results.
+
+    Requests are pulled lazily, keeping at most two per worker queued.
+
+    Args:
+        requests: Iterable of bound BurpRequest objects
+        ordered: Yield results in submission order instead of completion order
+        return_exceptions: Yield (request, exception) for failed requests
+                           instead of raising (default: False)
+        **kwargs: Additional arguments to pass to BurpRequest.make_request
+
+    Yields:
+        (BurpRequest, requests.Response) tuples
+    """
+    requests = iter(requests)
+    limit = self.workers * 2
+    pending = deque()
+    exhausted = False
+
+    def result(future):
+      try:
+        return future.result()
+      except Exception as exc:
+        if not return_exceptions:
+          raise
+        return exc
+
+    try:
+      while True:
+        # Keep the worker queue topped up without draining the iterator
+        while not exhausted and len(pending) < limit:
+          try:
+            req = next(requests)
+          except StopIteration:
+            exhausted = True
+            break
+          pending.append((self._executor.submit(self._send, req, kwargs), req))
+
+        if not pending:
+          break
+
+        if ordered:
+          future, req = pending.popleft()
+          yield req, result(future)
+          continue
+
+        done, _ = wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+        for future, req in [item for item in pending if item[0] in done]:
+          pending.remove((future, req))
+          yield req, result(future)
+    finally:
+      for future, _ in pending:
+        future.cancel()
+
+  def close(self):
+    """Stop the worker threads and close every worker session."""
+    self._executor.shutdown(wait=True)
+    with self._lock:
+      for session in self._sessions:
+        session.close()
+      self._sessions.clear()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
@@ -0,0 +1,19 @@
+from .async_runner import run_async
+from .ThreadedRunner import ThreadedRunner
+from .pipeline import PipelineSender
+from .http2 import Http2Sender
+from .race import race, arace
+from .limiter import AdaptiveLimiter
+from .coordinator import Coordinator, Outcome
+
+__all__ = [
+    'run_async',
+    'ThreadedRunner',
+    'PipelineSender',
+    'Http2Sender',
+    'race',
+    'arace',
+    'AdaptiveLimiter',
+    'Coordinator',
+    'Outcome'
+]
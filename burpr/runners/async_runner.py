@@ -0,0 +1,158 @@
+import asyncio
+import time
+from burpr.instrument import Trace
+from burpr.models.BurpRequest import BurpRequest
+from burpr.models.BurpTemplate import BurpTemplate
+
+
+def as_template(template, placeholders=None) -> BurpTemplate:
+    """Accept either a compiled BurpTemplate or a plain BurpRequest.
+
+    Args:
+        template: BurpTemplate or BurpRequest
+        placeholders: Optional placeholders that will be bound. A request is
+                      compiled for exactly these, and a template compiled
+                      without one of them is recompiled.
+    """
+    if isinstance(template, BurpRequest):
+        return BurpTemplate(template, placeholders)
+    if placeholders and not template.covers(placeholders):
+        return BurpTemplate(template.request(), placeholders)
+    return template
+
+
+def new_async_client(template: BurpTemplate, concurrency: int):
+    """Create an httpx.AsyncClient sized for the given concurrency."""
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("httpx is required for async support. Install with: pip install httpx")
+
+    limits = httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency
+    )
+    return httpx.AsyncClient(http2=template.is_http2, limits=limits)
+
+
+async def run_async(template, payloads, concurrency=10, client=None,
+                    return_exceptions=False, limiter=None, matcher=None, instrument=None, **kwargs):
+    """Render and send one request per payload, keeping N requests in flight.
+
+    Payloads are pulled lazily, so an arbitrarily long (or infinite)
+    iterable can be used. Results are yielded in completion order.
+
+    Args:
+        template: BurpTemplate (or BurpRequest, compiled on the fly)
+        payloads: Iterable of mappings of placeholder to value
+        concurrency: Maximum number of requests in flight (default: 10)
+        client: Optional httpx.AsyncClient shared by all requests.
+                A client sized for the concurrency is created and closed if omitted.
+        return_exceptions: Yield (payload, exception) for failed requests
+                           instead of raising (default: False)
+        limiter: Optional AdaptiveLimiter pacing sends and adjusting the
+                 number in flight (capped by concurrency) from the responses
+        matcher: Optional ResponseMatcher. Responses are then streamed and
+                 only read until the verdict is known, and MatchResult
+                 objects are yielded in place of responses.
+        instrument: Optional callable receiving a burpr.instrument.RequestTiming
+                    per request, tagged with its payload and the template id
+        **kwargs: Additional arguments to pass to BurpRequest.amake_request
+
+    Yields:
+        (payload, httpx.Response) tuples as requests complete, or
+        (payload, MatchResult) tuples when a matcher is given
+
+    Example:
+        async for payload, res in run_async(template, payloads, concurrency=50):
+            print(res.status_code, payload)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    template = as_template(template)
+    owns_client = client is None
+    if owns_client:
+        client = new_async_client(template, concurrency)
+
+    payloads = iter(payloads)
+    pending = {}
+    exhausted = False
+    loop = asyncio.get_running_loop()
+
+    async def request(payload, queued_at):
+        req = template.render(payload)
+        if instrument is None:
+            if matcher is not None:
+                return await matcher.amatch(req, client, **kwargs)
+            return await req.amake_request(client, **kwargs)
+
+        trace = Trace(instrument, payload, template.id, queued_at)
+        if matcher is None:
+            return await req.amake_request(client, instrument=trace, **kwargs)
+        trace.start()
+        try:
+            result = await matcher.amatch(req, client, **trace.extensions(kwargs, asynchronous=True))
+        except Exception as exc:
+            trace.finish(error=exc)
+            raise
+        trace.finish(result)
+        return result
+
+    async def send(payload):
+        queued_at = time.perf_counter()
+        if limiter is None:
+            return await request(payload, queued_at)
+
+        sent_at = limiter.clock()
+        started = loop.time()
+        try:
+            response = await request(payload, queued_at)
+        except Exception as exc:
+            limiter.record(exc, loop.time() - started, sent_at)
+            raise
+        limiter.record(response, loop.time() - started, sent_at)
+        return response
+
+    try:
+        while True:
+            # Top up the in-flight set from the payload iterator
+            wait = None
+            limit = concurrency if limiter is None else min(concurrency, limiter.concurrency)
+            while not exhausted and len(pending) < limit:
+                if limiter is not None:
+                    wait = limiter.reserve() or None
+                    if wait:
+                        break
+                try:
+                    payload = next(payloads)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(send(payload))] = payload
+
+            if not pending:
+                if wait is None:
+                    break
+                # Paced out with nothing in flight
+                await asyncio.sleep(wait)
+                continue
+
+            done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                payload = pending.pop(task)
+                try:
+                    response = task.result()
+                except Exception as exc:
+                    if not return_exceptions:
+                        raise
+                    response = exc
+                yield payload, response
+    finally:
+        # Cancel whatever is still in flight when stopped early or on error
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if owns_client:
+            await client.aclose()
@@ -0,0 +1,161 @@
+import asyncio
+import ssl as ssl_module
+from collections import deque
+from burpr.enums.TransportEnum import TransportEnum
+from burpr.runners.async_runner import as_template
+
+
+class RawResponse:
+    """A minimal HTTP response read straight from the wire."""
+
+    __slots__ = ("status_code", "reason", "http_version", "headers", "content")
+
+    def __init__(self, status_code, reason, http_version, headers, content=b""):
+        self.status_code = status_code
+        self.reason = reason
+        self.http_version = http_version
+        # Lower-cased header names; repeated headers are joined with ", "
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('latin-1')
+
+    def __repr__(self):
+        return f"RawResponse(status_code={self.status_code}, content={len(self.content)} bytes)"
+
+
+class Campaign:
+    """Payload queue and result channel shared by the connections of a sender.
+
+    Payloads are pulled lazily from the source iterator. Payloads handed
+    back with retry() are served again before any new ones.
+    """
+
+    def __init__(self, template, payloads, max_retries):
+        self.template = template
+        self.max_retries = max_retries
+        self.results = asyncio.Queue()
+        self._payloads = iter(payloads)
+        self._retries = deque()
+        self._exhausted = False
+
+    def next(self):
+        """Return the next (payload, attempts) pair, or None when drained."""
+        if self._retries:
+            return self._retries.popleft()
+        if self._exhausted:
+            return None
+        try:
+            return (next(self._payloads), 0)
+        except StopIteration:
+            self._exhausted = True
+            return None
+
+    def unget(self, item):
+        """Put a (payload, attempts) pair back at the front of the queue."""
+        self._retries.appendleft(item)
+
+    async def retry(self, items):
+        """Requeue unanswered (payload, attempts) pairs, oldest first."""
+        for payload, attempts in reversed(list(items)):
+            if attempts >= self.max_retries:
+                await self.put(payload, ConnectionError("Connection closed before response"))
+            else:
+                self._retries.appendleft((payload, attempts + 1))
+
+    async def put(self, payload, response):
+        await self.results.put((payload, response))
+
+
+class RawSender:
+    """Base class for senders that talk to the target over their own sockets.
+
+    Subclasses implement connection(), which opens one connection, serves
+    payloads from the campaign until it is drained or the connection
+    closes, and hands unanswered payloads back with Campaign.retry().
+    """
+
+    alpn_protocols = None
+
+    def __init__(self, connections=4, ssl=None, max_retries=3, read_size=65536):
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+
+        self.connections = connections
+        self.ssl = ssl
+        self.max_retries = max_retries
+        self.read_size = read_size
+
+    def _ssl_context(self):
+        if self.ssl is not None:
+            return self.ssl
+        context = ssl_module.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl_module.CERT_NONE
+        if self.alpn_protocols:
+            context.set_alpn_protocols(self.alpn_protocols)
+        return context
+
+    @staticmethod
+    def address(req):
+        """Return the (host, port) a request should be sent to."""
+        host, _, port = req.host.rpartition(":")
+        if host and port.isdigit():
+            return host.strip("[]"), int(port)
+        default = 443 if req.transport == TransportEnum.HTTPS else 80
+        return req.host, default
+
+    async def open_connection(self, req):
+        host, port = self.address(req)
+        if req.transport == TransportEnum.HTTPS:
+            return await asyncio.open_connection(
+                host, port, ssl=self._ssl_context(), server_hostname=host
+            )
+        return await asyncio.open_connection(host, port)
+
+    async def connection(self, campaign, auto_prepare):
+        raise NotImplementedError
+
+    async def run(self, template, payloads, auto_prepare=True):
+        """Render and send one request per payload.
+
+        Args:
+            template: BurpTemplate (or BurpRequest, compiled on the fly)
+            payloads: Iterable of mappings of placeholder to value
+            auto_prepare: Whether to automatically calculate Content-Length (default: True)
+
+        Yields:
+            (payload, RawResponse) tuples as responses arrive. A
+            ConnectionError takes the place of the response once a request
+            has gone unanswered more than max_retries times.
+        """
+        campaign = Campaign(as_template(template), payloads, self.max_retries)
+
+        async def worker():
+            while True:
+                item = campaign.next()
+                if item is None:
+                    return
+                # Only connect once there is something to send
+                campaign.unget(item)
+                await self.connection(campaign, auto_prepare)
+
+        async def supervise():
+            try:
+                await asyncio.gather(*(worker() for _ in range(self.connections)))
+            finally:
+                await campaign.results.put(None)
+
+        task = asyncio.ensure_future(supervise())
+        try:
+            while True:
+                item = await campaign.results.get()
+                if item is None:
+                    break
+                yield item
+            await task
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
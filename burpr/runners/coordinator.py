@@ -0,0 +1,240 @@
+import asyncio
+import multiprocessing
+import os
+import queue
+import time
+import traceback
+from itertools import islice
+from burpr.results import response_body, response_length
+from burpr.runners.async_runner import as_template, run_async
+
+
+class Outcome:
+    """Picklable summary of one attempt, reported by a worker process."""
+
+    __slots__ = ("payload", "status_code", "length", "hit", "worker", "error")
+
+    def __init__(self, payload, status_code, length, hit, worker, error=None):
+        self.payload = payload
+        self.status_code = status_code
+        self.length = length
+        self.hit = hit
+        self.worker = worker
+        # repr() of the exception for failed requests
+        self.error = error
+
+    def __bool__(self):
+        return self.hit
+
+    def __repr__(self):
+        return (f"Outcome(status_code={self.status_code}, length={self.length}, "
+                f"hit={self.hit}, worker={self.worker}, payload={self.payload!r})")
+
+
+def _split(payloads, index, count):
+    """The index-th of count disjoint parts of a payload source."""
+    if hasattr(payloads, "shard"):
+        try:
+            return payloads.shard(index, count)
+        except TypeError:
+            pass
+    # Every worker walks the whole sequence but only sends its stride of it
+    return islice(iter(payloads), index, None, count)
+
+
+def _summarize(payload, response, hit, worker):
+    if isinstance(response, BaseException):
+        return Outcome(payload, None, None, False, worker, repr(response))
+    length = response_length(response, response_body(response))
+    return Outcome(payload, response.status_code, length, hit, worker)
+
+
+async def _work(template, payloads, index, stop, results, options):
+    hit = options["hit"]
+    matcher = options["matcher"]
+    client = options["client_factory"]() if options["client_factory"] else None
+    batch = []
+    sent = 0
+
+    def flush():
+        if batch:
+            results.put(("results", index, list(batch)))
+            batch.clear()
+
+    responses = run_async(template, payloads, options["concurrency"], client=client,
+                          return_exceptions=True, matcher=matcher, **options["kwargs"])
+    try:
+        async for payload, response in responses:
+            sent += 1
+            if isinstance(response, BaseException):
+                found = False
+            elif hit is not None:
+                found = bool(hit(response))
+            else:
+                found = matcher is not None and bool(response)
+            batch.append(_summarize(payload, response, found, index))
+
+            if found:
+                flush()
+                if options["stop_on_hit"]:
+                    stop.set()
+            elif len(batch) >= options["batch_size"]:
+                flush()
+            if stop.is_set():
+                break
+    finally:
+        await responses.aclose()
+        if client is not None:
+            await client.aclose()
+        flush()
+    return sent
+
+
+def _worker(template, payloads, index, count, stop, results, options):
+    """Entry point of a worker process: send its part of the payloads."""
+    try:
+        part = _split(payloads, index, count)
+        sent = asyncio.run(_work(template, part, index, stop, results, options))
+        results.put(("done", index, sent))
+    except KeyboardInterrupt:
+        # Ctrl-C reaches the whole process group; the coordinator handles it
+        pass
+    except BaseException:
+        stop.set()
+        results.put(("error", index, traceback.format_exc()))
+
+
+class Coordinator:
+    """Fan a campaign out over worker processes, each with its own event loop.
+
+    A single process runs out of CPU on rendering, TLS and response
+    matching long before the network is the limit. The coordinator splits
+    the payloads into one disjoint part per worker process, and every
+    worker runs run_async() with its own connection pools. Workers report
+    compact Outcome objects back over a queue, in batches. When a worker
+    finds a hit, a shared event stops every worker.
+
+    With the default "fork" start method, workers inherit the compiled
+    template and payload source without copying or pickling. Under
+    "spawn", the template, payloads, hit function and client factory must
+    be picklable.
+
+    Example:
+        coordinator = burpr.Coordinator(workers=8, concurrency=50)
+        for outcome in coordinator.run(template, attack, hit=lambda res: res.status_code == 302):
+            if outcome:
+                print("found", outcome.payload)
+    """
+
+    def __init__(self, workers=None, concurrency=10, start_method=None, batch_size=256):
+        """
+        Args:
+            workers: Number of worker processes (default: os.cpu_count())
+            concurrency: Requests in flight per worker (default: 10)
+            start_method: multiprocessing start method (default: "fork"
+                          where available, otherwise "spawn")
+            batch_size: Outcomes a worker collects before sending them to the
+                        coordinator; hits are sent at once (default: 256)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        if start_method is None:
+            start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self.start_method = start_method
+        self.batch_size = batch_size
+
+        # Filled in by run()
+        self.sent = {}
+        self.hits = 0
+        self.elapsed = None
+
+    def run(self, template, payloads, hit=None, matcher=None, stop_on_hit=True,
+            client_factory=None, **kwargs):
+        """Send every payload from the worker processes and stream back outcomes.
+
+        Payload sources with a shard() method (Attack, Wordlist-backed attacks)
+        are split into contiguous shards. Anything else is split by striding,
+        which requires the "fork" start method for one-shot iterators.
+
+        Args:
+            template: BurpTemplate (or BurpRequest, compiled on the fly)
+            payloads: Attack or iterable of mappings of placeholder to value
+            hit: Optional callable response -> bool run in the workers
+            matcher: Optional ResponseMatcher run in the workers; its verdict
+                     marks hits unless a hit function is given
+            stop_on_hit: Stop every worker at the first hit (default: True)
+            client_factory: Optional callable returning an httpx.AsyncClient,
+                            called once in each worker (e.g. for proxies)
+            **kwargs: Additional arguments to pass to run_async
+
+        Yields:
+            Outcome objects, truthy for hits, as worker batches arrive
+        """
+        context = multiprocessing.get_context(self.start_method)
+        stop = context.Event()
+        results = context.Queue()
+        options = {
+            "concurrency": self.concurrency,
+            "hit": hit,
+            "matcher": matcher,
+            "stop_on_hit": stop_on_hit,
+            "client_factory": client_factory,
+            "batch_size": self.batch_size,
+            "kwargs": kwargs,
+        }
+        template = as_template(template)
+        processes = [
+            context.Process(target=_worker, args=(template, payloads, index, self.workers, stop, results, options),
+                            name=f"burpr-worker-{index}", daemon=True)
+            for index in range(self.workers)
+        ]
+
+        self.sent = {}
+        self.hits = 0
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+
+        running = set(range(self.workers))
+        try:
+            while running:
+                try:
+                    kind, index, data = results.get(timeout=0.1)
+                except queue.Empty:
+                    # A worker killed outright never reports back
+                    for index in running:
+                        if processes[index].exitcode not in (None, 0):
+                            raise RuntimeError(f"Worker {index} exited with code {processes[index].exitcode}")
+                    continue
+
+                if kind == "results":
+                    for outcome in data:
+                        self.hits += outcome.hit
+                        yield outcome
+                elif kind == "done":
+                    self.sent[index] = data
+                    running.discard(index)
+                else:
+                    raise RuntimeError(f"Worker {index} failed:\n{data}")
+        finally:
+            stop.set()
+            self._drain(processes, results)
+            self.elapsed = time.perf_counter() - started
+
+    @staticmethod
+    def _drain(processes, results):
+        # Keep the queue moving so workers blocked on put() can exit
+        deadline = time.monotonic() + 5
+        while any(process.is_alive() for process in processes) and time.monotonic() < deadline:
+            try:
+                results.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        results.close()
+
+    def __repr__(self):
+        return f"Coordinator(workers={self.workers}, concurrency={self.concurrency})"
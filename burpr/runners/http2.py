@@ -0,0 +1,235 @@
+from burpr.enums.TransportEnum import TransportEnum
+from burpr.runners.base import RawResponse, RawSender
+
+# Connection-specific headers are not allowed in HTTP/2 (RFC 9113, 8.2.2)
+CONNECTION_HEADERS = frozenset((
+    "host", "connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"
+))
+
+# Stream identifiers are 31 bits; reconnect well before they run out
+MAX_STREAM_ID = 2 ** 31 - 1024
+
+
+def _h2():
+    try:
+        import h2.config
+        import h2.connection
+        import h2.events
+    except ImportError:
+        raise ImportError("h2 is required for HTTP/2 support. Install with: pip install h2")
+    return h2
+
+
+class HeaderBlock:
+    """HTTP/2 header list for a template, with the static part built once.
+
+    Headers without placeholders are lower-cased and encoded a single time;
+    only the pseudo-headers and placeholder headers are rebuilt per request.
+    """
+
+    def __init__(self, template):
+        self.scheme = str(template.transport or TransportEnum.HTTPS).encode('latin-1')
+        self.static = []
+        self.dynamic = []
+        for key, value in template.request().headers.items():
+            name = key.lower()
+            if name in CONNECTION_HEADERS or name == "content-length":
+                continue
+            if key in template.dynamic_headers:
+                self.dynamic.append((key, name.encode('latin-1')))
+            else:
+                self.static.append((name.encode('latin-1'), value.encode('latin-1')))
+
+    def build(self, req, content_length):
+        headers = [
+            (b":method", req.method.encode('latin-1')),
+            (b":scheme", self.scheme),
+            (b":authority", req.host.encode('latin-1')),
+            (b":path", req.path.encode('latin-1')),
+        ]
+        headers.extend(self.static)
+        for key, name in self.dynamic:
+            headers.append((name, req.headers[key].encode('latin-1')))
+        if content_length is not None:
+            headers.append((b"content-length", str(content_length).encode('latin-1')))
+        return headers
+
+
+def request_headers(req, content_length=None):
+    """Build the HTTP/2 header list for a single request."""
+    scheme = str(req.transport or TransportEnum.HTTPS).encode('latin-1')
+    headers = [
+        (b":method", req.method.encode('latin-1')),
+        (b":scheme", scheme),
+        (b":authority", req.host.encode('latin-1')),
+        (b":path", req.path.encode('latin-1')),
+    ]
+    for key, value in req.headers.items():
+        name = key.lower()
+        if name not in CONNECTION_HEADERS and name != "content-length":
+            headers.append((name.encode('latin-1'), value.encode('latin-1')))
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode('latin-1')))
+    return headers
+
+
+class Stream:
+    """Response state of a single HTTP/2 stream."""
+
+    __slots__ = ("item", "status_code", "headers", "body", "pending")
+
+    def __init__(self, item, pending=b""):
+        self.item = item
+        self.status_code = None
+        self.headers = {}
+        self.body = bytearray()
+        # Request body bytes still waiting for flow-control window
+        self.pending = pending
+
+    def add_headers(self, headers):
+        for name, value in headers:
+            name = name.decode('latin-1')
+            value = value.decode('latin-1')
+            if name == ":status":
+                self.status_code = int(value)
+            elif name in self.headers:
+                self.headers[name] += ", " + value
+            else:
+                self.headers[name] = value
+
+    def response(self):
+        return RawResponse(self.status_code, "", "HTTP/2", self.headers, bytes(self.body))
+
+
+class Http2Sender(RawSender):
+    """Send rendered requests as many concurrent streams over few HTTP/2 connections.
+
+    Each connection keeps up to `max_streams` streams open, further bounded
+    by the server's SETTINGS_MAX_CONCURRENT_STREAMS. HTTPS targets negotiate
+    h2 with ALPN; plain HTTP targets use h2c with prior knowledge.
+
+    Example:
+        sender = Http2Sender(connections=2, max_streams=256)
+        async for payload, res in sender.run(template, payloads):
+            print(res.status_code, payload)
+    """
+
+    alpn_protocols = ["h2"]
+
+    def __init__(self, connections=1, max_streams=100, ssl=None, max_retries=3, read_size=65536):
+        """
+        Args:
+            connections: Number of HTTP/2 connections to open (default: 1)
+            max_streams: Maximum concurrent streams per connection (default: 100)
+            ssl: Optional ssl.SSLContext for HTTPS targets. Defaults to a
+                 context that offers h2 and does not verify certificates.
+            max_retries: Times an unanswered request is re-sent after a
+                         connection closes (default: 3)
+            read_size: Bytes requested per socket read (default: 65536)
+        """
+        if max_streams < 1:
+            raise ValueError("max_streams must be at least 1")
+
+        super().__init__(connections, ssl, max_retries, read_size)
+        self.max_streams = max_streams
+
+    async def connection(self, campaign, auto_prepare):
+        h2 = _h2()
+        template = campaign.template
+        block = getattr(campaign, "h2_headers", None)
+        if block is None:
+            block = campaign.h2_headers = HeaderBlock(template)
+
+        reader, writer = await self.open_connection(template.request())
+        config = h2.config.H2Configuration(client_side=True, header_encoding=None)
+        conn = h2.connection.H2Connection(config=config)
+        conn.initiate_connection()
+        streams = {}
+        accepting = True
+        settings = False
+
+        def send_pending(stream_id):
+            stream = streams[stream_id]
+            while stream.pending:
+                window = min(
+                    conn.local_flow_control_window(stream_id),
+                    conn.max_outbound_frame_size
+                )
+                if window <= 0:
+                    return
+                chunk = stream.pending[:window]
+                stream.pending = stream.pending[window:]
+                conn.send_data(stream_id, chunk, end_stream=not stream.pending)
+
+        try:
+            while True:
+                # Open new streams up to our limit and the server's, once known
+                limit = min(self.max_streams, conn.remote_settings.max_concurrent_streams)
+                while settings and accepting and len(streams) < limit:
+                    if conn.highest_outbound_stream_id and conn.highest_outbound_stream_id > MAX_STREAM_ID:
+                        accepting = False
+                        break
+                    item = campaign.next()
+                    if item is None:
+                        break
+                    req = template.render(item[0])
+                    body = req._content() or b""
+                    if auto_prepare:
+                        content_length = len(body)
+                    else:
+                        # Keep whatever the template declared, even if it lies
+                        content_length = next((value for key, value in req.headers.items()
+                                               if key.lower() == "content-length"), None)
+
+                    stream_id = conn.get_next_available_stream_id()
+                    streams[stream_id] = Stream(item, body)
+                    conn.send_headers(stream_id, block.build(req, content_length), end_stream=not body)
+                    send_pending(stream_id)
+
+                data = conn.data_to_send()
+                if data:
+                    writer.write(data)
+                    await writer.drain()
+
+                if settings and not streams:
+                    conn.close_connection()
+                    writer.write(conn.data_to_send())
+                    return
+
+                data = await reader.read(self.read_size)
+                if not data:
+                    return
+
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RemoteSettingsChanged):
+                        settings = True
+                    elif isinstance(event, h2.events.ResponseReceived):
+                        streams[event.stream_id].add_headers(event.headers)
+                    elif isinstance(event, h2.events.DataReceived):
+                        if event.stream_id in streams:
+                            streams[event.stream_id].body += event.data
+                        conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        stream = streams.pop(event.stream_id)
+                        await campaign.put(stream.item[0], stream.response())
+                    elif isinstance(event, h2.events.StreamReset):
+                        stream = streams.pop(event.stream_id, None)
+                        if stream is not None:
+                            await campaign.retry([stream.item])
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        targets = [event.stream_id] if event.stream_id else list(streams)
+                        for stream_id in targets:
+                            if stream_id in streams:
+                                send_pending(stream_id)
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        # GOAWAY: streams above last_stream_id were never processed
+                        accepting = False
+                        unprocessed = [stream_id for stream_id in sorted(streams)
+                                       if event.error_code or stream_id > (event.last_stream_id or 0)]
+                        await campaign.retry([streams.pop(stream_id).item for stream_id in unprocessed])
+                        if not streams:
+                            return
+        finally:
+            writer.close()
+            # Unanswered streams go back to the front of the queue
+            await campaign.retry([streams[stream_id].item for stream_id in sorted(streams)])
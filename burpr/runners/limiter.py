@@ -0,0 +1,185 @@
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+BACKOFF_STATUSES = frozenset((429, 503))
+
+
+def retry_after_seconds(value):
+    """Parse a Retry-After header (delay seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    """AIMD controller for the request rate and concurrency of a batch run.
+
+    Sends are paced at `rate` requests per second with at most `concurrency`
+    requests in flight. Every `window` completions the window is checked: if
+    its p95 latency and error rate are healthy, concurrency grows by one and
+    the rate by `rate_increase` (additive increase). A 429 or 503, a
+    Retry-After header, or an unhealthy window cuts both by `decrease`
+    (multiplicative decrease). Retry-After also pauses sending for the
+    requested time.
+
+    Example:
+        limiter = AdaptiveLimiter(rate=50, concurrency=10)
+        async for payload, res in run_async(template, payloads, limiter=limiter):
+            print(limiter.setpoint, res.status_code)
+    """
+
+    def __init__(self, rate=20.0, concurrency=10, min_rate=1.0, max_rate=None,
+                 min_concurrency=1, max_concurrency=256, rate_increase=None,
+                 decrease=0.5, window=20, latency_target=None, latency_factor=2.0,
+                 error_threshold=0.1, max_retry_after=60.0, clock=time.monotonic):
+        """
+        Args:
+            rate: Starting requests per second, or None to only limit concurrency (default: 20.0)
+            concurrency: Starting number of requests in flight (default: 10)
+            min_rate: Lowest rate backoff may reach (default: 1.0)
+            max_rate: Highest rate additive increase may reach (default: unbounded)
+            min_concurrency: Lowest concurrency backoff may reach (default: 1)
+            max_concurrency: Highest concurrency additive increase may reach (default: 256)
+            rate_increase: Requests per second added per healthy window
+                           (default: 10% of the starting rate)
+            decrease: Factor applied to rate and concurrency on backoff (default: 0.5)
+            window: Completions per health check (default: 20)
+            latency_target: p95 latency in seconds above which a window is
+                            unhealthy. Defaults to `latency_factor` times the
+                            best p95 seen so far.
+            latency_factor: Allowed p95 growth over the best seen, when no
+                            latency_target is given (default: 2.0)
+            error_threshold: Error rate (exceptions and 5xx) above which a
+                             window is unhealthy (default: 0.1)
+            max_retry_after: Longest pause honoured from Retry-After, in seconds (default: 60.0)
+            clock: Monotonic time source (default: time.monotonic)
+        """
+        if concurrency < 1 or min_concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+
+        self.rate = rate
+        self.concurrency = concurrency
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.rate_increase = rate_increase if rate_increase is not None else (rate or 0) * 0.1
+        self.decrease = decrease
+        self.window = window
+        self.latency_target = latency_target
+        self.latency_factor = latency_factor
+        self.error_threshold = error_threshold
+        self.max_retry_after = max_retry_after
+        self.clock = clock
+
+        # Last completed window, for monitoring
+        self.p95 = None
+        self.error_rate = None
+
+        self._samples = deque(maxlen=window)
+        self._best_p95 = None
+        self._next_send = 0.0
+        self._paused_until = 0.0
+        self._decreased_at = float("-inf")
+
+    @property
+    def setpoint(self):
+        """Current rate, concurrency and pause, with the last window's health."""
+        return {
+            "rate": self.rate,
+            "concurrency": self.concurrency,
+            "paused_for": max(0.0, self._paused_until - self.clock()),
+            "p95": self.p95,
+            "error_rate": self.error_rate,
+        }
+
+    def reserve(self):
+        """Claim the next send slot.
+
+        Returns:
+            0 if a request may be sent now, otherwise the seconds to wait
+            before asking again
+        """
+        now = self.clock()
+        wait = self._paused_until - now
+        if self.rate is not None:
+            wait = max(wait, self._next_send - now)
+        if wait > 0:
+            return wait
+
+        if self.rate is not None:
+            self._next_send = max(now, self._next_send) + 1 / self.rate
+        return 0
+
+    def record(self, response, latency, sent_at):
+        """Feed back the outcome of one request.
+
+        Args:
+            response: Response object (anything with status_code and headers),
+                      or the exception the request raised
+            latency: Seconds from send to response
+            sent_at: Clock value when the request was sent
+        """
+        status = getattr(response, "status_code", None)
+        error = isinstance(response, BaseException) or (status is not None and status >= 500)
+
+        if status is not None and status >= 400:
+            retry_after = retry_after_seconds(response.headers.get("retry-after"))
+            if retry_after is not None:
+                pause = min(retry_after, self.max_retry_after)
+                self._paused_until = max(self._paused_until, self.clock() + pause)
+            if retry_after is not None or status in BACKOFF_STATUSES:
+                self._backoff(sent_at)
+                return
+
+        # Results of requests sent under an older setpoint say nothing about the current one
+        if sent_at < self._decreased_at:
+            return
+        self._samples.append((latency, error))
+        if len(self._samples) == self.window:
+            self._check_window()
+
+    def _check_window(self):
+        latencies = sorted(latency for latency, _ in self._samples)
+        self.p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        self.error_rate = sum(error for _, error in self._samples) / len(self._samples)
+        self._samples.clear()
+
+        target = self.latency_target
+        if target is None and self._best_p95 is not None:
+            target = self._best_p95 * self.latency_factor
+        if self._best_p95 is None or self.p95 < self._best_p95:
+            self._best_p95 = self.p95
+
+        if self.error_rate > self.error_threshold or (target is not None and self.p95 > target):
+            self._backoff(self.clock())
+            return
+
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+        if self.rate is not None:
+            self.rate += self.rate_increase
+            if self.max_rate is not None:
+                self.rate = min(self.max_rate, self.rate)
+
+    def _backoff(self, sent_at):
+        # Requests sent before the last cut already saw the old setpoint
+        if sent_at < self._decreased_at:
+            return
+        self._decreased_at = self.clock()
+        self._samples.clear()
+
+        self.concurrency = max(self.min_concurrency, int(self.concurrency * self.decrease))
+        if self.rate is not None:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+    def __repr__(self):
+        return f"AdaptiveLimiter(rate={self.rate}, concurrency={self.concurrency})"
@@ -0,0 +1,229 @@
+from collections import deque
+from burpr import burpr
+from burpr.enums.ProtocolEnum import ProtocolEnum
+from burpr.runners.base import RawResponse, RawSender
+
+
+class ResponseParser:
+    """Incremental HTTP/1.x response parser for pipelined connections.
+
+    Call expect() with the method of every request written to the
+    connection, feed() with bytes as they arrive, and feed_eof() once the
+    peer closes. Completed responses are returned in request order.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._methods = deque()
+        self._response = None
+        self._remaining = None
+        self._chunked = False
+        self._until_eof = False
+        self._closing = False
+        self._body = bytearray()
+
+    def expect(self, method):
+        self._methods.append(method)
+
+    @property
+    def keep_alive(self):
+        """False once a parsed response asked for the connection to be closed."""
+        return not self._closing
+
+    def feed(self, data):
+        self._buffer += data
+        responses = []
+        while True:
+            response = self._next()
+            if response is None:
+                return responses
+            responses.append(response)
+
+    def feed_eof(self):
+        """Complete a body delimited by connection close, if one is pending."""
+        if self._response is not None and self._until_eof:
+            self._body += self._buffer
+            self._buffer.clear()
+            return [self._finish()]
+        return []
+
+    def _next(self):
+        if self._response is None and not self._parse_head():
+            return None
+        if self._until_eof:
+            return None
+        if self._chunked:
+            return self._parse_chunks()
+
+        if len(self._buffer) < self._remaining:
+            return None
+        self._body += self._buffer[:self._remaining]
+        del self._buffer[:self._remaining]
+        return self._finish()
+
+    def _parse_head(self):
+        end = self._buffer.find(b"\r\n\r\n")
+        if end < 0:
+            return False
+
+        lines = bytes(self._buffer[:end]).decode('latin-1').split("\r\n")
+        del self._buffer[:end + 4]
+
+        parts = lines[0].split(" ", 2)
+        http_version = parts[0]
+        status_code = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ""
+
+        headers = {}
+        for line in lines[1:]:
+            key, _, value = line.partition(":")
+            key = key.strip().lower()
+            value = value.strip()
+            headers[key] = f"{headers[key]}, {value}" if key in headers else value
+
+        # Interim responses carry no body and do not answer the request
+        if 100 <= status_code < 200 and status_code != 101:
+            return self._parse_head()
+
+        method = self._methods.popleft() if self._methods else "GET"
+        self._response = RawResponse(status_code, reason, http_version, headers)
+        self._body = bytearray()
+        self._chunked = False
+        self._until_eof = False
+
+        if "close" in headers.get("connection", "").lower():
+            self._closing = True
+
+        if method == "HEAD" or status_code in (204, 304):
+            self._remaining = 0
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            self._chunked = True
+            self._remaining = None
+        elif "content-length" in headers:
+            self._remaining = int(headers["content-length"].split(",")[0])
+        else:
+            self._until_eof = True
+        return True
+
+    def _parse_chunks(self):
+        while True:
+            if self._remaining is None:
+                end = self._buffer.find(b"\r\n")
+                if end < 0:
+                    return None
+                size = int(bytes(self._buffer[:end]).split(b";")[0], 16)
+                del self._buffer[:end + 2]
+                self._remaining = size
+                if size == 0:
+                    self._remaining = -1
+
+            if self._remaining == -1:
+                # Skip trailers up to the terminating empty line
+                end = self._buffer.find(b"\r\n")
+                if end < 0:
+                    return None
+                del self._buffer[:end + 2]
+                if end == 0:
+                    return self._finish()
+                continue
+
+            if len(self._buffer) < self._remaining + 2:
+                return None
+            self._body += self._buffer[:self._remaining]
+            del self._buffer[:self._remaining + 2]
+            self._remaining = None
+
+    def _finish(self):
+        response = self._response
+        response.content = bytes(self._body)
+        self._response = None
+        self._remaining = None
+        self._body = bytearray()
+        return response
+
+
+def _keep_alive(req):
+    """Make a rendered request safe to pipeline.
+
+    Burp captures often carry Connection: close, and HTTP/1.0 requests close
+    by default; either makes the server hang up after the first response,
+    so every request pipelined behind it would fail. The request is sent as
+    HTTP/1.1 without the closing Connection header instead.
+    """
+    if req.protocol == ProtocolEnum.HTTP1_0:
+        req.protocol = ProtocolEnum.HTTP1_1
+    for key in [key for key in req.headers if key.lower() == "connection"]:
+        if "close" in req.headers[key].lower():
+            del req.headers[key]
+    return req
+
+
+class PipelineSender(RawSender):
+    """Send rendered requests as raw bytes, pipelined over keep-alive sockets.
+
+    Each connection keeps up to `depth` requests written ahead of the
+    responses it has read, bypassing the requests/httpx object layers.
+    Requests still unanswered when the server closes a connection are
+    re-sent on a fresh connection. Requests are always sent as keep-alive
+    HTTP/1.1, even if the template says HTTP/1.0 or Connection: close.
+
+    Example:
+        sender = PipelineSender(connections=4, depth=64)
+        async for payload, res in sender.run(template, payloads):
+            print(res.status_code, payload)
+    """
+
+    def __init__(self, connections=4, depth=32, ssl=None, max_retries=3, read_size=65536):
+        """
+        Args:
+            connections: Number of keep-alive sockets to open (default: 4)
+            depth: Maximum pipelined requests awaiting a response per socket (default: 32)
+            ssl: Optional ssl.SSLContext for HTTPS targets. Defaults to a
+                 context that does not verify certificates.
+            max_retries: Times an unanswered request is re-sent after a
+                         connection closes (default: 3)
+            read_size: Bytes requested per socket read (default: 65536)
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+
+        super().__init__(connections, ssl, max_retries, read_size)
+        self.depth = depth
+
+    async def connection(self, campaign, auto_prepare):
+        reader, writer = await self.open_connection(campaign.template.request())
+        parser = ResponseParser()
+        outstanding = deque()
+        try:
+            while True:
+                # Fill the pipeline up to the configured depth
+                chunks = []
+                while parser.keep_alive and len(outstanding) < self.depth:
+                    item = campaign.next()
+                    if item is None:
+                        break
+                    req = _keep_alive(campaign.template.render(item[0]))
+                    if auto_prepare:
+                        burpr.prepare(req)
+                    parser.expect(req.method)
+                    outstanding.append(item)
+                    chunks.append(burpr.to_bytes(req))
+                if chunks:
+                    writer.write(b"".join(chunks))
+                    await writer.drain()
+
+                if not outstanding:
+                    return
+
+                data = await reader.read(self.read_size)
+                responses = parser.feed(data) if data else parser.feed_eof()
+                for response in responses:
+                    payload, _ = outstanding.popleft()
+                    await campaign.put(payload, response)
+
+                if not data or not parser.keep_alive:
+                    return
+        finally:
+            writer.close()
+            # Unanswered requests go back to the front of the queue
+            await campaign.retry(outstanding)
@@ -0,0 +1,264 @@
+import asyncio
+import time
+from burpr import burpr
+from burpr.runners.http2 import Http2Sender, Stream, request_headers, _h2
+from burpr.runners.pipeline import PipelineSender, ResponseParser
+
+MODES = ("h2-single-packet", "h1-last-byte")
+
+
+class RaceResult:
+    """Outcome and timestamps of one request sent in a race.
+
+    Timestamps are time.perf_counter() values, so only differences between
+    them are meaningful.
+    """
+
+    __slots__ = ("request", "response", "sent_at", "first_byte_at", "received_at")
+
+    def __init__(self, request):
+        self.request = request
+        # RawResponse, or the exception raised while waiting for it
+        self.response = None
+        self.sent_at = None
+        self.first_byte_at = None
+        self.received_at = None
+
+    def __repr__(self):
+        return f"RaceResult(request={self.request}, response={self.response!r})"
+
+
+class RaceResults(list):
+    """List of RaceResult objects with spread statistics."""
+
+    def __init__(self, results=(), single_packet=False):
+        super().__init__(results)
+        # Every final byte left in one write, so there is no send spread to measure
+        self.single_packet = single_packet
+
+    @staticmethod
+    def _spread(values):
+        values = [value for value in values if value is not None]
+        return max(values) - min(values) if values else None
+
+    @property
+    def send_spread(self):
+        """Seconds between the first and the last final byte leaving the client.
+
+        None in h2-single-packet mode: all final frames go out in a single
+        write, so every request shares one sent_at and there is nothing to
+        measure. Use receive_spread to judge how tight the race was.
+        """
+        if self.single_packet:
+            return None
+        return self._spread(result.sent_at for result in self)
+
+    @property
+    def receive_spread(self):
+        """Seconds between the first and the last response starting to arrive."""
+        return self._spread(result.first_byte_at for result in self)
+
+
+def _same_target(requests):
+    targets = {(str(req.transport), req.host) for req in requests}
+    if len(targets) > 1:
+        raise ValueError("All raced requests must target the same host and transport")
+
+
+async def _race_h2(requests, ssl, auto_prepare, warmup, timeout):
+    h2 = _h2()
+    sender = Http2Sender(ssl=ssl)
+    results = RaceResults((RaceResult(req) for req in requests), single_packet=True)
+
+    reader, writer = await sender.open_connection(requests[0])
+    config = h2.config.H2Configuration(client_side=True, header_encoding=None)
+    conn = h2.connection.H2Connection(config=config)
+    conn.initiate_connection()
+    writer.write(conn.data_to_send())
+    streams = {}
+
+    def handle(events):
+        now = time.perf_counter()
+        for event in events:
+            stream = streams.get(getattr(event, "stream_id", None))
+            if stream is None:
+                continue
+            result = stream.item
+            if isinstance(event, h2.events.ResponseReceived):
+                result.first_byte_at = now
+                stream.add_headers(event.headers)
+            elif isinstance(event, h2.events.DataReceived):
+                stream.body += event.data
+                conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                result.received_at = now
+                result.response = stream.response()
+                del streams[event.stream_id]
+            elif isinstance(event, h2.events.StreamReset):
+                result.response = ConnectionError(f"Stream reset with error code {event.error_code}")
+                del streams[event.stream_id]
+
+    try:
+        # The server's SETTINGS tell us how many streams we may open
+        settings = False
+        while not settings:
+            data = await asyncio.wait_for(reader.read(65536), timeout)
+            if not data:
+                raise ConnectionError("Connection closed during HTTP/2 handshake")
+            events = conn.receive_data(data)
+            settings = any(isinstance(event, h2.events.RemoteSettingsChanged) for event in events)
+        if len(requests) > conn.remote_settings.max_concurrent_streams:
+            raise ValueError("More requests than the server's SETTINGS_MAX_CONCURRENT_STREAMS")
+
+        # Bodies must fit the flow-control windows to be held back in full
+        bodies = [result.request.content_length for result in results]
+        if (max(bodies) > conn.remote_settings.initial_window_size
+                or sum(bodies) > conn.outbound_flow_control_window):
+            raise ValueError("Request bodies exceed the HTTP/2 flow-control window")
+
+        # Send everything except the final byte of every stream
+        finals = []
+        for result in results:
+            req = result.request
+            if auto_prepare:
+                burpr.prepare(req)
+            body = req._content() or b""
+            content_length = next((value for key, value in req.headers.items()
+                                   if key.lower() == "content-length"), None)
+
+            stream_id = conn.get_next_available_stream_id()
+            streams[stream_id] = Stream(result)
+            conn.send_headers(stream_id, request_headers(req, content_length))
+            if len(body) > 1:
+                conn.send_data(stream_id, body[:-1])
+            finals.append((stream_id, body[-1:]))
+
+        writer.write(conn.data_to_send())
+        await writer.drain()
+        await asyncio.sleep(warmup)
+
+        # Release every stream in a single write
+        for stream_id, last in finals:
+            conn.send_data(stream_id, last, end_stream=True)
+        packet = conn.data_to_send()
+        sent_at = time.perf_counter()
+        writer.write(packet)
+        for result in results:
+            result.sent_at = sent_at
+        await writer.drain()
+
+        async def receive():
+            while streams:
+                data = await reader.read(65536)
+                if not data:
+                    return
+                handle(conn.receive_data(data))
+                writer.write(conn.data_to_send())
+
+        try:
+            await asyncio.wait_for(receive(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        for stream in streams.values():
+            stream.item.response = asyncio.TimeoutError("No complete response before timeout")
+        return results
+    finally:
+        writer.close()
+
+
+async def _race_h1(requests, ssl, auto_prepare, warmup, timeout):
+    sender = PipelineSender(ssl=ssl)
+    results = RaceResults(RaceResult(req) for req in requests)
+
+    payloads = []
+    for req in requests:
+        if auto_prepare:
+            burpr.prepare(req)
+        payloads.append(burpr.to_bytes(req))
+
+    connections = await asyncio.gather(*(sender.open_connection(req) for req in requests))
+    try:
+        # Send everything except the final byte on one connection per request
+        for (_, writer), data in zip(connections, payloads):
+            writer.write(data[:-1])
+        await asyncio.gather(*(writer.drain() for _, writer in connections))
+        await asyncio.sleep(warmup)
+
+        # Release the last bytes back to back, without yielding to the loop
+        for result, (_, writer), data in zip(results, connections, payloads):
+            writer.write(data[-1:])
+            result.sent_at = time.perf_counter()
+
+        async def receive(result, reader):
+            parser = ResponseParser()
+            parser.expect(result.request.method)
+            while True:
+                data = await reader.read(65536)
+                if result.first_byte_at is None and data:
+                    result.first_byte_at = time.perf_counter()
+                responses = parser.feed(data) if data else parser.feed_eof()
+                if responses:
+                    result.received_at = time.perf_counter()
+                    result.response = responses[0]
+                    return
+                if not data:
+                    result.response = ConnectionError("Connection closed before response")
+                    return
+
+        async def receive_with_timeout(result, reader):
+            try:
+                await asyncio.wait_for(receive(result, reader), timeout)
+            except asyncio.TimeoutError as exc:
+                result.response = exc
+
+        await asyncio.gather(*(receive_with_timeout(result, reader)
+                               for result, (reader, _) in zip(results, connections)))
+        return results
+    finally:
+        for _, writer in connections:
+            writer.close()
+
+
+async def arace(requests, mode="h2-single-packet", ssl=None, auto_prepare=True,
+                warmup=0.1, timeout=10.0):
+    """Send requests so that they all complete at the target at the same moment.
+
+    Everything except the final byte (h1-last-byte) or final DATA frame
+    (h2-single-packet) of each request is sent first. After a short warm-up
+    the remaining bytes of all requests are released together, in a single
+    write for HTTP/2.
+
+    Args:
+        requests: Iterable of BurpRequest objects aimed at the same host
+        mode: "h2-single-packet" (one HTTP/2 connection, default) or
+              "h1-last-byte" (one HTTP/1.1 connection per request)
+        ssl: Optional ssl.SSLContext for HTTPS targets
+        auto_prepare: Whether to automatically calculate Content-Length (default: True)
+        warmup: Seconds to wait between the partial sends and the release (default: 0.1)
+        timeout: Seconds to wait for responses after the release (default: 10.0)
+
+    Returns:
+        RaceResults list with one RaceResult per request, in request order
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown race mode: {mode}. Expected one of {', '.join(MODES)}")
+
+    requests = list(requests)
+    if not requests:
+        return RaceResults()
+    _same_target(requests)
+
+    if mode == "h2-single-packet":
+        return await _race_h2(requests, ssl, auto_prepare, warmup, timeout)
+    return await _race_h1(requests, ssl, auto_prepare, warmup, timeout)
+
+
+def race(requests, mode="h2-single-packet", ssl=None, auto_prepare=True,
+         warmup=0.1, timeout=10.0):
+    """Synchronous wrapper around arace().
+
+    Example:
+        results = burpr.race([burpr.clone(req) for _ in range(20)])
+        print(results.receive_spread, [r.response.status_code for r in results])
+    """
+    return asyncio.run(arace(requests, mode, ssl, auto_prepare, warmup, timeout))
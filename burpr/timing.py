@@ -0,0 +1,242 @@
+import asyncio
+import math
+import random
+import time
+from burpr.models.StreamBody import StreamBody
+
+ALTERNATIVES = ("greater", "less", "two-sided")
+
+
+def median(values):
+    """Median of a non-empty sequence."""
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[mid]
+    return (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def trimmed_mean(values, proportion=0.1):
+    """Mean after dropping `proportion` of the values from each end.
+
+    Args:
+        values: Non-empty sequence of numbers
+        proportion: Fraction cut from each tail, below 0.5 (default: 0.1)
+    """
+    if not 0 <= proportion < 0.5:
+        raise ValueError("proportion must be between 0 and 0.5")
+    ordered = sorted(values)
+    cut = int(len(ordered) * proportion)
+    kept = ordered[cut:len(ordered) - cut]
+    return sum(kept) / len(kept)
+
+
+def mann_whitney(a, b, alternative="greater"):
+    """Mann-Whitney U test, with the normal approximation and tie correction.
+
+    Args:
+        a: Sample of candidate timings
+        b: Sample of baseline timings
+        alternative: "greater" (a tends to be slower than b, default),
+                     "less" or "two-sided"
+
+    Returns:
+        Tuple (U statistic of a, p-value)
+    """
+    if alternative not in ALTERNATIVES:
+        raise ValueError(f"Unknown alternative: {alternative}. Expected one of {', '.join(ALTERNATIVES)}")
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        raise ValueError("Both samples must be non-empty")
+
+    # Rank the pooled sample, averaging the ranks of ties
+    pooled = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    rank_sum = 0.0
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        rank_sum += rank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0
+    if variance <= 0:
+        return u, 1.0
+
+    # Continuity-corrected z score
+    mean = n1 * n2 / 2
+    if alternative == "greater":
+        z = (u - mean - 0.5) / math.sqrt(variance)
+        p = _normal_sf(z)
+    elif alternative == "less":
+        z = (u - mean + 0.5) / math.sqrt(variance)
+        p = _normal_sf(-z)
+    else:
+        z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+        p = min(1.0, 2 * _normal_sf(z))
+    return u, p
+
+
+def _normal_sf(z):
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class TimingResult:
+    """Outcome of a timing comparison between a candidate and a baseline request."""
+
+    def __init__(self, significant, p_value, candidate, baseline, alpha, alternative):
+        self.significant = significant
+        self.p_value = p_value
+        # Send-to-first-byte timings in seconds, in send order
+        self.candidate = candidate
+        self.baseline = baseline
+        self.alpha = alpha
+        self.alternative = alternative
+
+    @property
+    def requests(self):
+        """Measured requests sent (warm-up requests excluded)."""
+        return len(self.candidate) + len(self.baseline)
+
+    @property
+    def delta(self):
+        """Difference of the medians, candidate minus baseline, in seconds."""
+        return median(self.candidate) - median(self.baseline)
+
+    def summary(self, proportion=0.1):
+        """Median and trimmed mean of both samples.
+
+        Returns:
+            Dictionary with candidate/baseline medians and trimmed means
+        """
+        return {
+            "candidate_median": median(self.candidate),
+            "baseline_median": median(self.baseline),
+            "candidate_trimmed_mean": trimmed_mean(self.candidate, proportion),
+            "baseline_trimmed_mean": trimmed_mean(self.baseline, proportion),
+        }
+
+    def __bool__(self):
+        return self.significant
+
+    def __repr__(self):
+        return (f"TimingResult(significant={self.significant}, p_value={self.p_value:.4g}, "
+                f"delta={self.delta * 1000:.2f}ms, requests={self.requests})")
+
+
+async def time_to_first_byte(req, client, auto_prepare=True, **kwargs):
+    """Send a request and time it from send until the response head arrives.
+
+    The body is read afterwards so the connection can be reused, outside
+    the measured interval.
+
+    Returns:
+        Seconds from send to first byte (time.perf_counter resolution)
+    """
+    if auto_prepare:
+        from burpr import burpr
+        burpr.prepare(req)
+
+    content = req._content(stream=True)
+    if isinstance(content, StreamBody):
+        content = content.aiter()
+
+    started = time.perf_counter()
+    async with client.stream(req.method, req.url, headers=req.headers, content=content, **kwargs) as res:
+        elapsed = time.perf_counter() - started
+        await res.aread()
+    return elapsed
+
+
+async def acompare(candidate, baseline, client=None, batch=5, min_samples=10,
+                   max_samples=100, alpha=0.01, alternative="greater", warmup=2,
+                   seed=None, **kwargs):
+    """Decide whether a candidate request is slower than a baseline request.
+
+    Requests are sent one at a time in batches of candidate/baseline pairs,
+    each pair in random order, so drift in network or server load hits both
+    samples alike. After every batch, once `min_samples` pairs are in, a
+    Mann-Whitney U test is run on the send-to-first-byte timings and the
+    comparison stops as soon as it is significant. Each look is tested at
+    `alpha` divided by the number of possible looks, so stopping early does
+    not inflate the false positive rate.
+
+    Args:
+        candidate: BurpRequest under test (e.g. a SLEEP payload, a valid username)
+        baseline: BurpRequest known to take the normal path
+        client: Optional httpx.AsyncClient. A single-connection client is
+                created and closed if omitted, so every request reuses the
+                same connection.
+        batch: Pairs sent between two looks (default: 5)
+        min_samples: Pairs collected before the first look (default: 10)
+        max_samples: Pairs after which the comparison gives up (default: 100)
+        alpha: Overall false positive rate (default: 0.01)
+        alternative: "greater" (candidate slower, default), "less" or "two-sided"
+        warmup: Unmeasured baseline requests sent first to open the connection (default: 2)
+        seed: Optional seed for the pair order
+        **kwargs: Additional arguments to pass to httpx
+
+    Returns:
+        TimingResult, truthy when the difference is significant
+    """
+    if alternative not in ALTERNATIVES:
+        raise ValueError(f"Unknown alternative: {alternative}. Expected one of {', '.join(ALTERNATIVES)}")
+    if batch < 1 or min_samples < 2 or max_samples < min_samples:
+        raise ValueError("Expected batch >= 1 and 2 <= min_samples <= max_samples")
+
+    owns_client = client is None
+    if owns_client:
+        import httpx
+        limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+        client = httpx.AsyncClient(http2=candidate.is_http2, limits=limits)
+
+    looks = 1 + math.ceil((max_samples - min_samples) / batch)
+    threshold = alpha / looks
+    order = random.Random(seed)
+    timings = ([], [])
+    p_value = 1.0
+
+    try:
+        for _ in range(warmup):
+            await time_to_first_byte(baseline, client, **kwargs)
+
+        while len(timings[0]) < max_samples:
+            for _ in range(min(batch, max_samples - len(timings[0]))):
+                pair = [0, 1]
+                order.shuffle(pair)
+                for which in pair:
+                    req = candidate if which == 0 else baseline
+                    timings[which].append(await time_to_first_byte(req, client, **kwargs))
+
+            if len(timings[0]) >= min_samples:
+                _, p_value = mann_whitney(timings[0], timings[1], alternative)
+                if p_value < threshold:
+                    break
+    finally:
+        if owns_client:
+            await client.aclose()
+
+    return TimingResult(p_value < threshold, p_value, timings[0], timings[1], alpha, alternative)
+
+
+def compare(candidate, baseline, client=None, batch=5, min_samples=10,
+            max_samples=100, alpha=0.01, alternative="greater", warmup=2,
+            seed=None, **kwargs):
+    """Synchronous wrapper around acompare().
+
+    Example:
+        login = burpr.compile(req)
+        valid = burpr.timing.compare(login.render({"%USER%": "carlos"}),
+                                     login.render({"%USER%": "zz-no-such-user"}))
+        if valid:
+            print(f"carlos exists ({valid.delta * 1000:.1f}ms slower)")
+    """
+    return asyncio.run(acompare(candidate, baseline, client, batch, min_samples, max_samples,
+                                alpha, alternative, warmup, seed, **kwargs))
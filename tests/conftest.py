@@ -0,0 +1,40 @@
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import requests
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Echo the request body, report the client port and cookie, and set a session cookie."""
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Client-Port", str(self.client_address[1]))
+        self.send_header("X-Cookie", self.headers.get("Cookie", ""))
+        self.send_header("Set-Cookie", "session=admin; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def echo_server():
+    """Run a local keep-alive HTTP/1.1 server for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def real_requests(monkeypatch):
+    """Undo the requests module mocking done by other test modules."""
+    monkeypatch.setitem(sys.modules, "requests", requests)
@@ -0,0 +1,191 @@
+"""Local asyncio stand-in servers used by the tests."""
+import asyncio
+import time
+
+
+class H1Server:
+    """Minimal keep-alive HTTP/1.1 server that echoes request bodies.
+    
+    Handles pipelined requests in order. Every response carries the
+    connection number and the request's position on that connection.
+    """
+    
+    def __init__(self, close_after=None, chunked=False):
+        self.close_after = close_after
+        self.chunked = chunked
+        self.connections = 0
+        self.requests = 0
+        # perf_counter() times at which each request was fully received
+        self.received = []
+        self.server = None
+        self.port = None
+    
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+    
+    @property
+    def host(self):
+        return f"127.0.0.1:{self.port}"
+    
+    def respond(self, method, body, connection, served, close):
+        headers = [
+            "HTTP/1.1 200 OK",
+            f"X-Connection: {connection}",
+            f"X-Served: {served}",
+        ]
+        if close:
+            headers.append("Connection: close")
+        if method == "HEAD":
+            headers.append(f"Content-Length: {len(body)}")
+            body = b""
+        elif self.chunked:
+            headers.append("Transfer-Encoding: chunked")
+            half = len(body) // 2
+            chunks = [body[:half], body[half:]]
+            body = b"".join(b"%x;ext=1\r\n%s\r\n" % (len(c), c) for c in chunks if c)
+            body += b"0\r\nX-Trailer: 1\r\n\r\n"
+        else:
+            headers.append(f"Content-Length: {len(body)}")
+        return ("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + body
+    
+    async def handle(self, reader, writer):
+        self.connections += 1
+        connection = self.connections
+        served = 0
+        try:
+            while True:
+                head = (await reader.readuntil(b"\r\n\r\n")).decode('latin-1')
+                method, _, version = head.split("\r\n", 1)[0].split(" ", 2)
+                length = 0
+                # Honour the client asking to close, as real servers do
+                wants_close = version == "HTTP/1.0"
+                for line in head.split("\r\n")[1:]:
+                    key, _, value = line.partition(":")
+                    if key.lower() == "content-length":
+                        length = int(value)
+                    elif key.lower() == "connection":
+                        wants_close = "close" in value.lower()
+                body = await reader.readexactly(length)
+                self.received.append(time.perf_counter())
+                
+                served += 1
+                self.requests += 1
+                close = wants_close or (self.close_after is not None and served >= self.close_after)
+                writer.write(self.respond(method, body, connection, served, close))
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class H2Server:
+    """Minimal cleartext HTTP/2 (h2c prior knowledge) server echoing request bodies.
+    
+    Responses are delayed so that concurrent streams pile up, and the peak
+    number of streams open at once on any connection is recorded.
+    """
+    
+    def __init__(self, max_concurrent_streams=100, delay=0.005, goaway_after=None):
+        self.max_concurrent_streams = max_concurrent_streams
+        self.delay = delay
+        self.goaway_after = goaway_after
+        self.connections = 0
+        self.requests = 0
+        self.peak_streams = 0
+        # perf_counter() times at which each request was fully received
+        self.received = []
+        self.server = None
+        self.port = None
+    
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+    
+    @property
+    def host(self):
+        return f"127.0.0.1:{self.port}"
+    
+    async def handle(self, reader, writer):
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.settings
+        
+        self.connections += 1
+        connection = self.connections
+        config = h2.config.H2Configuration(client_side=False, header_encoding=None)
+        conn = h2.connection.H2Connection(config=config)
+        conn.local_settings = h2.settings.Settings(client=False, initial_values={
+            h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: self.max_concurrent_streams,
+        })
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        
+        bodies = {}
+        tasks = set()
+        state = {"served": 0, "closed": False}
+        
+        async def respond(stream_id, headers, body):
+            await asyncio.sleep(self.delay)
+            if state["closed"]:
+                return
+            length = str(len(body)).encode()
+            # Only echo bodies that fit in a single frame and window
+            if len(body) > 16384:
+                body = b""
+            conn.send_headers(stream_id, [
+                (b":status", b"200"),
+                (b"x-connection", str(connection).encode()),
+                (b"x-path", headers[b":path"]),
+                (b"x-body-length", length),
+                (b"content-length", str(len(body)).encode()),
+            ])
+            conn.send_data(stream_id, body, end_stream=True)
+            self.requests += 1
+            state["served"] += 1
+            if self.goaway_after is not None and state["served"] >= self.goaway_after:
+                state["closed"] = True
+                conn.close_connection(last_stream_id=stream_id)
+            writer.write(conn.data_to_send())
+            if state["closed"]:
+                writer.close()
+        
+        try:
+            while not state["closed"]:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        bodies[event.stream_id] = (dict(event.headers), bytearray())
+                        self.peak_streams = max(self.peak_streams, len(bodies))
+                    elif isinstance(event, h2.events.DataReceived):
+                        bodies[event.stream_id][1].extend(event.data)
+                        conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2.events.StreamEnded):
+                        self.received.append(time.perf_counter())
+                        headers, body = bodies[event.stream_id]
+                        task = asyncio.ensure_future(respond(event.stream_id, headers, bytes(body)))
+                        task.add_done_callback(lambda _, stream_id=event.stream_id: bodies.pop(stream_id, None))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                writer.write(conn.data_to_send())
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
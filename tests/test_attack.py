@@ -0,0 +1,144 @@
+import itertools
+import json
+import tracemalloc
+import pytest
+from burpr import burpr
+from burpr.attack import Attack
+
+
+TEMPLATE = """POST /login HTTP/1.1
+Host: example.com
+X-Csrf: %CSRF%
+
+username=%USER%&password=%PASS%"""
+
+
+@pytest.fixture
+def template():
+    return burpr.compile(burpr.parse_string(TEMPLATE))
+
+
+class TestAttack:
+    """Test the Intruder-style attack modes."""
+    
+    def test_sniper(self, template):
+        """Test each position is attacked in turn, others taking defaults."""
+        attack = Attack(template, ["%USER%", "%PASS%"], [["a", "b"]],
+                        defaults={"%USER%": "admin", "%PASS%": "x", "%CSRF%": "t"})
+        
+        assert list(attack) == [
+            {"%USER%": "a", "%PASS%": "x", "%CSRF%": "t"},
+            {"%USER%": "b", "%PASS%": "x", "%CSRF%": "t"},
+            {"%USER%": "admin", "%PASS%": "a", "%CSRF%": "t"},
+            {"%USER%": "admin", "%PASS%": "b", "%CSRF%": "t"},
+        ]
+        assert len(attack) == 4
+    
+    def test_battering_ram(self, template):
+        """Test the same value goes into every position at once."""
+        attack = Attack(template, ["%USER%", "%PASS%"], [iter(["a", "b"])], mode="battering-ram")
+        
+        assert list(attack) == [{"%USER%": "a", "%PASS%": "a"}, {"%USER%": "b", "%PASS%": "b"}]
+    
+    def test_pitchfork(self, template):
+        """Test sources advance together and stop at the shortest."""
+        attack = Attack(template, ["%USER%", "%PASS%"], [["a", "b", "c"], ["1", "2"]], mode="pitchfork")
+        
+        assert list(attack) == [{"%USER%": "a", "%PASS%": "1"}, {"%USER%": "b", "%PASS%": "2"}]
+        assert len(attack) == 2
+    
+    def test_cluster_bomb(self, template):
+        """Test every combination is produced, first position fastest."""
+        attack = Attack(template, ["%USER%", "%PASS%", "%CSRF%"],
+                        [["a", "b"], ["1", "2", "3"], (v for v in "xy")], mode="cluster-bomb")
+        
+        payloads = [(p["%USER%"], p["%PASS%"], p["%CSRF%"]) for p in attack]
+        expected = [(u, p, c) for c in "xy" for p in "123" for u in "ab"]
+        assert payloads == expected
+        
+        assert list(Attack(template, ["%USER%", "%PASS%"], [["a"], []], mode="cluster-bomb")) == []
+        assert len(Attack(template, ["%USER%", "%PASS%"], [["a", "b"], ["1", "2", "3"]], mode="cluster-bomb")) == 6
+    
+    def test_cluster_bomb_constant_memory(self, template):
+        """Test a 100k x 100k cluster-bomb never materialises its product."""
+        attack = Attack(template, ["%USER%", "%PASS%"], [range(100000), range(100000)], mode="cluster-bomb")
+        assert len(attack) == 10 ** 10
+        
+        tracemalloc.start()
+        try:
+            for _ in itertools.islice(attack, 200000):
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        assert peak < 64 * 1024
+    
+    def test_requests(self, template):
+        """Test rendered requests carry the payload values."""
+        attack = Attack(template, ["%USER%", "%PASS%"], [["a"], ["1"]], mode="pitchfork")
+        
+        req = next(attack.requests())
+        
+        assert req.body == "username=a&password=1"
+        assert req.headers["X-Csrf"] == "%CSRF%"
+    
+    @pytest.mark.parametrize("mode, sources", [
+        ("sniper", [["a", "b", "c"]]),
+        ("battering-ram", [["a", "b", "c"]]),
+        ("pitchfork", [["a", "b", "c"], range(5)]),
+        ("cluster-bomb", [["a", "b", "c"], range(4)]),
+    ])
+    def test_cursor_resumes_anywhere(self, template, mode, sources):
+        """Test a cursor restored from its JSON state continues exactly where it stopped."""
+        attack = Attack(template, ["%USER%", "%PASS%"], sources, mode=mode, defaults={"%CSRF%": "t"})
+        expected = list(attack)
+        
+        for stop in range(len(expected) + 1):
+            cursor = attack.cursor()
+            head = list(itertools.islice(cursor, stop))
+            state = json.loads(json.dumps(cursor.state()))
+            assert head + list(attack.cursor(state)) == expected
+        
+        with pytest.raises(ValueError):
+            Attack(template, ["%USER%"], [["a"]], mode="battering-ram").cursor({"mode": "cluster-bomb"})
+    
+    @pytest.mark.parametrize("mode, sources", [
+        ("sniper", [list("abcdefg")]),
+        ("battering-ram", [range(10)]),
+        ("pitchfork", [list("abcdefg"), range(9)]),
+        ("cluster-bomb", [["a", "b", "c"], range(5)]),
+    ])
+    def test_shard(self, template, mode, sources):
+        """Test shards split an attack into disjoint parts that together cover it."""
+        attack = Attack(template, ["%USER%", "%PASS%"], sources, mode=mode)
+        shards = [list(attack.shard(i, 3)) for i in range(3)]
+        
+        assert sorted(map(repr, itertools.chain(*shards))) == sorted(map(repr, attack))
+        assert all(shards)
+        
+        with pytest.raises(ValueError):
+            attack.shard(3, 3)
+        with pytest.raises(TypeError):
+            Attack(template, ["%USER%"], [iter("abc")]).shard(0, 2)
+    
+    def test_positions_after_url_escape(self, template):
+        """Test attacks compile for their positions, not every %XX% lookalike."""
+        req = burpr.parse_string("POST /login?q=caf%E9%USER% HTTP/1.1\nHost: example.com\n\n")
+        
+        for source in (req, burpr.compile(req)):
+            attack = Attack(source, ["%USER%"], [["bob"]])
+            assert [attack.template.render(p).path for p in attack] == ["/login?q=caf%E9bob"]
+    
+    def test_validation(self, template):
+        """Test bad modes, positions and source counts are rejected."""
+        with pytest.raises(ValueError, match="Unknown attack mode"):
+            Attack(template, ["%USER%"], [["a"]], mode="shotgun")
+        with pytest.raises(ValueError, match="not found in template: %NOPE%"):
+            Attack(template, ["%NOPE%"], [["a"]])
+        with pytest.raises(ValueError, match="one payload source per position"):
+            Attack(template, ["%USER%", "%PASS%"], [["a"]], mode="pitchfork")
+        with pytest.raises(ValueError, match="exactly one payload source"):
+            Attack(template, ["%USER%"], [["a"], ["b"]])
+        with pytest.raises(TypeError, match="re-iterable"):
+            Attack(template, ["%USER%", "%PASS%"], [iter("ab"), ["1"]], mode="cluster-bomb")
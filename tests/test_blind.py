@@ -0,0 +1,112 @@
+import asyncio
+import re
+import httpx
+import pytest
+from burpr import burpr, blind
+from burpr.matchers import Contains, ResponseMatcher
+
+
+TEMPLATE = """POST /filter HTTP/1.1
+Host: example.com
+
+q=%COND%"""
+
+SECRET = "s3cr3t-P@ss"
+
+
+def length_payload(n):
+    return {"%COND%": f"LEN>{n}"}
+
+
+def char_payload(position, code):
+    return {"%COND%": f"CHR{position}>{code}"}
+
+
+class Target:
+    """Mock target answering "Welcome back" when the injected condition holds."""
+    
+    def __init__(self, secret=SECRET):
+        self.secret = secret
+        self.requests = 0
+        self.in_flight = 0
+        self.peak = 0
+    
+    def holds(self, condition):
+        match = re.fullmatch(r"LEN>(\d+)", condition)
+        if match:
+            return len(self.secret) > int(match.group(1))
+        position, code = map(int, re.fullmatch(r"CHR(\d+)>(\d+)", condition).groups())
+        return ord(self.secret[position - 1]) > code
+    
+    async def handler(self, request):
+        self.requests += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        condition = request.content.decode().split("=", 1)[1]
+        return httpx.Response(200, text="Welcome back" if self.holds(condition) else "Hello")
+    
+    def client(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+class TestBlindExtraction:
+    """Test bisection-based blind extraction."""
+    
+    def test_extract(self):
+        """Test the secret is recovered in about 7 requests per character."""
+        target = Target()
+        found = []
+        
+        secret = blind.extract(burpr.parse_string(TEMPLATE), lambda res: "Welcome back" in res.text,
+                               char_payload, length_payload, concurrency=4, client=target.client(),
+                               callback=lambda position, char: found.append(position))
+        
+        assert secret == SECRET
+        assert sorted(found) == list(range(1, len(SECRET) + 1))
+        assert target.peak == 4
+        # 4 + 3 for the length, ceil(log2(95)) = 7 per character
+        assert target.requests <= 7 + 7 * len(SECRET)
+    
+    def test_find_length(self):
+        """Test exponential-then-binary search across lengths, including 0."""
+        for length in (0, 1, 2, 3, 31, 32, 33, 256):
+            target = Target("x" * length)
+            
+            async def ask(payload):
+                return target.holds(payload["%COND%"])
+            
+            assert asyncio.run(blind.find_length(ask, length_payload)) == length
+        
+        with pytest.raises(ValueError, match="max_length"):
+            asyncio.run(blind.find_length(ask, length_payload, max_length=100))
+    
+    def test_known_length_and_matcher_oracle(self):
+        """Test a ResponseMatcher oracle and a given length skip the length search."""
+        target = Target("abc")
+        matcher = ResponseMatcher(Contains("Welcome back"))
+        
+        async def main():
+            async with target.client() as client:
+                return await blind.aextract(burpr.compile(burpr.parse_string(TEMPLATE)),
+                                            matcher, char_payload, length=3, low=97, high=122,
+                                            client=client)
+        
+        assert asyncio.run(main()) == "abc"
+        assert target.requests <= 3 * 5
+    
+    def test_async_oracle(self):
+        """Test awaitable oracle verdicts are awaited."""
+        target = Target("ok")
+        
+        async def oracle(res):
+            return "Welcome back" in res.text
+        
+        assert blind.extract(burpr.parse_string(TEMPLATE), oracle, char_payload, length_payload,
+                             client=target.client()) == "ok"
+    
+    def test_validation(self):
+        """Test a length or a length payload is required."""
+        with pytest.raises(ValueError, match="length_payload"):
+            blind.extract(burpr.parse_string(TEMPLATE), bool, char_payload)
@@ -1,6 +1,9 @@
+import asyncio
+import json
 import pytest
 from burpr import burpr
 from burpr.models.BurpRequest import BurpRequest
+from burpr.models.StreamBody import FileBody, IterBody
 from burpr.enums.TransportEnum import TransportEnum
 from burpr.enums.ProtocolEnum import ProtocolEnum
 
@@ -285,6 +288,51 @@ Host: %HOST%
         assert req.path == "/api/v2/users"
         assert req.headers["Host"] == "example.com"
         assert req.host == "example.com"
+    
+    def test_bind_many(self):
+        """Test binding several placeholders in one call."""
+        request = """%METHOD% %ENDPOINT% HTTP/1.1
+Host: %HOST%
+Authorization: Bearer %TOKEN%
+
+{"token": "%TOKEN%", "name": "%NAME%"}"""
+        
+        req = burpr.parse_string(request)
+        result = req.bind_many({
+            "%METHOD%": "POST",
+            "%ENDPOINT%": "/api/users",
+            "%HOST%": "api.example.com",
+            "%TOKEN%": "abc",
+            "%NAME%": 42
+        })
+        
+        assert result is req
+        assert req.method == "POST"
+        assert req.path == "/api/users"
+        assert req.host == "api.example.com"
+        assert req.headers["Host"] == "api.example.com"
+        assert req.headers["Authorization"] == "Bearer abc"
+        assert req.body == '{"token": "abc", "name": "42"}'
+    
+    def test_bind_many_is_order_independent(self):
+        """Test values containing other placeholders are not rebound."""
+        request = """GET /%A%/%B% HTTP/1.1
+Host: example.com
+
+"""
+        req1 = burpr.parse_string(request).bind_many({"%A%": "%B%", "%B%": "b"})
+        req2 = burpr.parse_string(request).bind_many({"%B%": "b", "%A%": "%B%"})
+        
+        assert req1.path == req2.path == "/%B%/b"
+    
+    def test_bind_many_overlapping_placeholders(self):
+        """Test the longest placeholder wins when tokens share a prefix."""
+        request = """GET /?a=$ID$&b=$ID$2 HTTP/1.1
+Host: example.com
+
+"""
+        req = burpr.parse_string(request).bind_many({"$ID$": "1", "$ID$2": "2"})
+        assert req.path == "/?a=1&b=2"
 
 
 class TestCurlParsing:
@@ -429,6 +477,53 @@ X-Custom: %VALUE%
         assert req2.headers["X-Custom"] == "modified"
         assert "changed" in req2.body
     
+    def test_clone_shares_headers_until_written(self):
+        """Test clone is copy-on-write for headers on either side."""
+        req1 = burpr.parse_string("GET / HTTP/1.1\nHost: example.com\nX-Token: %TOKEN%\n\n")
+        req2 = burpr.clone(req1)
+        req3 = burpr.clone(req1)
+        
+        assert req2.headers._data is req1.headers._data
+        
+        # Binding a placeholder that is absent leaves the headers shared
+        req2.bind("%OTHER%", "x")
+        assert req2.headers._data is req1.headers._data
+        
+        req2.set_header("X-Token", "abc")
+        req1.set_header("X-Extra", "1")
+        del req3.headers["X-Token"]
+        
+        assert req1.headers == {"Host": "example.com", "X-Token": "%TOKEN%", "X-Extra": "1"}
+        assert req2.headers == {"Host": "example.com", "X-Token": "abc"}
+        assert req3.headers == {"Host": "example.com"}
+    
+    def test_headers_dict_uses(self):
+        """Test common dict uses of req.headers still work, without leaking into clones."""
+        req = burpr.parse_string("GET / HTTP/1.1\nHost: example.com\nX-Token: abc\n\n")
+        clone = burpr.clone(req)
+        headers = req.headers
+        
+        assert json.dumps(dict(headers)) == '{"Host": "example.com", "X-Token": "abc"}'
+        assert {**headers} == dict(headers.items()) == headers
+        assert list(headers) == ["Host", "X-Token"] and "Host" in headers
+        assert headers.get("Missing", "-") == "-"
+        
+        headers.update({"X-Extra": "1"})
+        assert headers.setdefault("X-Extra", "2") == "1"
+        assert headers.pop("X-Token") == "abc"
+        assert headers == {"Host": "example.com", "X-Extra": "1"}
+        assert clone.headers == {"Host": "example.com", "X-Token": "abc"}
+    
+    def test_request_slots(self):
+        """Test requests use slots and wrap plain header dicts."""
+        req = BurpRequest(host="example.com", headers={"Host": "example.com"})
+        
+        assert not hasattr(req, "__dict__")
+        with pytest.raises(AttributeError):
+            req.extra = 1
+        assert dict(req.headers) == {"Host": "example.com"}
+        assert BurpRequest().headers == {}
+    
     def test_prepare_content_length(self):
         """Test prepare function sets Content-Length."""
         req = BurpRequest(
@@ -458,6 +553,439 @@ X-Custom: %VALUE%
         assert req.headers["Content-Length"] == "0"
 
 
+class TestBytesBodies:
+    """Test bytes-native request bodies."""
+    
+    UPLOAD = (b"POST /upload HTTP/1.1\r\n"
+              b"Host: files.example.com\r\n"
+              b"Content-Type: application/octet-stream\r\n"
+              b"\r\n"
+              b"\x00\xff\r\n\r\nPK\x03\x04%NAME%")
+    
+    def test_parse_bytes_keeps_raw_body(self):
+        """Test the body is kept byte-for-byte and decoded only on demand."""
+        req = burpr.parse_bytes(self.UPLOAD)
+        
+        assert req.method == "POST"
+        assert req.headers["Content-Type"] == "application/octet-stream"
+        assert req.raw_body == b"\x00\xff\r\n\r\nPK\x03\x04%NAME%"
+        assert req._body is None
+        assert req.body == "\x00\xff\r\n\r\nPK\x03\x04%NAME%"
+    
+    def test_parse_bytes_memoryview_is_zero_copy(self):
+        """Test memoryview input yields a memoryview body."""
+        data = bytearray(self.UPLOAD)
+        req = burpr.parse_bytes(memoryview(data))
+        
+        assert isinstance(req.raw_body, memoryview)
+        data[-6:] = b"NAMED%"
+        assert bytes(req.raw_body).endswith(b"NAMED%")
+    
+    def test_parse_bytes_errors(self):
+        """Test parse errors match parse_string."""
+        with pytest.raises(burpr.BurpParseError, match="Empty request string"):
+            burpr.parse_bytes(b"  \r\n ")
+        with pytest.raises(burpr.BurpParseError, match="Missing required Host header"):
+            burpr.parse_bytes(b"GET / HTTP/1.1\r\nAccept: */*\r\n\r\n")
+    
+    def test_prepare_and_serialize_without_decoding(self):
+        """Test Content-Length and wire bytes come straight from the raw body."""
+        req = burpr.parse_bytes(self.UPLOAD)
+        burpr.prepare(req)
+        
+        assert req.headers["Content-Length"] == "16"
+        assert burpr.to_bytes(req).endswith(b"\r\n\r\n\x00\xff\r\n\r\nPK\x03\x04%NAME%")
+        assert req._body is None
+    
+    def test_bind_raw_body(self):
+        """Test binding into a raw body keeps it as bytes, with bind and bind_many."""
+        req = burpr.parse_bytes(self.UPLOAD)
+        req.bind("%NAME%", "shell.php")
+        
+        assert req._body is None
+        assert req.raw_body.endswith(b"PK\x03\x04shell.php")
+        
+        req.bind_many({"%MISSING%": "x"})
+        assert req._body is None
+        
+        req = burpr.parse_bytes(self.UPLOAD).bind_many({"%NAME%": "a.php", "%MISSING%": "x"})
+        assert req._body is None
+        assert req.raw_body.endswith(b"PK\x03\x04a.php")
+        
+        # Values outside latin-1 fall back to a str body, as bind() does
+        req = burpr.parse_bytes(self.UPLOAD).bind_many({"%NAME%": "\u2603"})
+        assert req.body.endswith("PK\x03\x04\u2603")
+    
+    def test_none_body_is_empty(self):
+        """Test a None body behaves as an empty one."""
+        req = BurpRequest("example.com", "/", "HTTP/1.1", "GET", {"Host": "example.com"}, None, "https")
+        burpr.prepare(req)
+        
+        assert req.headers["Content-Length"] == "0"
+        assert req._content() is None
+        assert burpr.to_burp_format(req).startswith("GET / HTTP/1.1")
+        assert "body=0 items" in repr(req)
+        
+        req.set_body(b"x")
+        req.set_body(None)
+        assert req.body == "" and req.content_length == 0
+        req.raw_body = None
+        assert req.raw_body == b""
+    
+    def test_body_views_stay_in_sync(self):
+        """Test setting either view replaces the other."""
+        req = burpr.parse_bytes(self.UPLOAD)
+        req.body = "text"
+        assert req.raw_body == b"text"
+        
+        req.set_body(b"\xe9")
+        assert req.body == "\xe9"
+        assert req.content_length == 1
+        
+        clone = burpr.clone(req)
+        assert clone.raw_body == b"\xe9"
+
+
+class TestFileParsing:
+    """Test parsing requests from files."""
+    
+    REQUEST = (b"POST /upload HTTP/1.1\r\n"
+               b"Host: files.example.com\r\n"
+               b"Content-Type: multipart/form-data; boundary=x\r\n"
+               b"\r\n"
+               b"--x\r\nContent-Disposition: form-data; name=f\r\n\r\n\x89PNG\r\n\x1a\n\r\n--x--\r\n")
+    
+    def test_parse_file(self, tmp_path):
+        """Test CRLFs inside the body are preserved byte-for-byte."""
+        path = tmp_path / "request.txt"
+        path.write_bytes(self.REQUEST)
+        
+        req = burpr.parse_file(str(path))
+        
+        assert req.headers["Host"] == "files.example.com"
+        assert req.raw_body == self.REQUEST.split(b"\r\n\r\n", 1)[1]
+    
+    def test_parse_file_mmap(self, tmp_path):
+        """Test memory-mapped parsing exposes the body as a zero-copy view."""
+        path = tmp_path / "request.txt"
+        path.write_bytes(self.REQUEST)
+        
+        req = burpr.parse_file(str(path), use_mmap=True)
+        
+        assert isinstance(req.raw_body, memoryview)
+        assert req.headers["Content-Type"] == "multipart/form-data; boundary=x"
+        assert bytes(req.raw_body) == self.REQUEST.split(b"\r\n\r\n", 1)[1]
+        
+        burpr.prepare(req)
+        assert req.headers["Content-Length"] == str(len(req.raw_body))
+        assert burpr.to_bytes(req).endswith(b"\x89PNG\r\n\x1a\n\r\n--x--\r\n")
+    
+    def test_parse_file_mmap_empty(self, tmp_path):
+        """Test empty files raise the usual parse error."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        
+        with pytest.raises(burpr.BurpParseError, match="Empty request string"):
+            burpr.parse_file(str(path), use_mmap=True)
+        
+        path.write_bytes(b"\r\n")
+        with pytest.raises(burpr.BurpParseError, match="Empty request string"):
+            burpr.parse_file(str(path), use_mmap=True)
+    
+    def test_parse_string_keeps_body_line_endings(self):
+        """Test only the header block is CRLF-normalised."""
+        req = burpr.parse_string("POST / HTTP/1.1\r\nHost: example.com\r\n\r\na\r\nb\n")
+        
+        assert req.headers["Host"] == "example.com"
+        assert req.body == "a\r\nb\n"
+
+
+@pytest.mark.usefixtures("real_requests")
+class TestStreamBodies:
+    """Test file-backed and iterator bodies streamed to the clients."""
+    
+    @pytest.fixture
+    def upload(self, tmp_path, echo_server):
+        path = tmp_path / "upload.bin"
+        path.write_bytes(bytes(range(256)) * 1024)
+        req = burpr.parse_string(f"POST /upload HTTP/1.1\nHost: {echo_server}\n\n")
+        req.transport = TransportEnum.HTTP
+        return req, path
+    
+    def test_file_body_region(self, tmp_path):
+        """Test FileBody reads only the requested region in chunks."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"0123456789")
+        
+        body = FileBody(str(path), offset=2, length=5, chunk_size=2)
+        
+        assert len(body) == 5
+        assert list(body) == [b"23", b"45", b"6"]
+        assert list(FileBody(str(path), offset=4)) == [b"456789"]
+    
+    def test_prepare_and_placeholders(self, tmp_path):
+        """Test stream bodies set Content-Length and are never scanned or rendered."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"%TOKEN%")
+        req = burpr.parse_string("POST /%TOKEN% HTTP/1.1\nHost: example.com\n\n")
+        req.set_body(FileBody(str(path)))
+        
+        burpr.prepare(req)
+        req.bind("%TOKEN%", "abc")
+        
+        assert req.is_streaming
+        assert req.path == "/abc"
+        assert req.headers["Content-Length"] == "7"
+        assert req.body == "%TOKEN%"
+        assert burpr.to_bytes(req).endswith(b"\r\n\r\n%TOKEN%")
+        
+        template = burpr.compile(req)
+        assert template.render({"%TOKEN%": "x"}).raw_body is req.raw_body
+    
+    def test_iter_body_is_single_use(self):
+        """Test iterator bodies encode str chunks and refuse a second read."""
+        body = IterBody(iter(["ab", b"cd"]), 4)
+        
+        assert body.load() == b"abcd"
+        with pytest.raises(RuntimeError, match="already been consumed"):
+            body.load()
+    
+    def test_make_request_streams_file(self, upload):
+        """Test requests sends the file with a Content-Length, not chunked."""
+        req, path = upload
+        req.set_body(FileBody(str(path), chunk_size=4096))
+        
+        res = req.make_request()
+        
+        assert res.status_code == 200
+        assert res.content == path.read_bytes()
+    
+    def test_make_httpx_request_streams_iterator(self, upload):
+        """Test httpx sends iterator bodies with the declared length."""
+        req, path = upload
+        data = path.read_bytes()
+        req.set_body(IterBody((data[i:i + 1000] for i in range(0, len(data), 1000)), len(data)))
+        
+        res = req.make_httpx_request()
+        
+        assert res.content == data
+    
+    def test_amake_request_streams_file(self, upload):
+        """Test async requests read file bodies without blocking the loop."""
+        req, path = upload
+        req.set_body(FileBody(str(path)))
+        
+        res = asyncio.run(req.amake_request())
+        
+        assert res.content == path.read_bytes()
+
+
+class TestCompiledTemplate:
+    """Test compiled request templates."""
+    
+    def test_render_all_components(self):
+        """Test rendering placeholders in host, path, headers and body."""
+        request = """POST /api/%VERSION%/login HTTP/1.1
+Host: %HOST%
+Authorization: Bearer %TOKEN%
+X-Static: unchanged
+
+user=%USER%&token=%TOKEN%"""
+        
+        template = burpr.compile(burpr.parse_string(request))
+        req = template.render({
+            "%VERSION%": "v2",
+            "%HOST%": "example.com",
+            "%TOKEN%": "abc",
+            "%USER%": "admin"
+        })
+        
+        assert template.placeholders == {"%VERSION%", "%HOST%", "%TOKEN%", "%USER%"}
+        assert req.path == "/api/v2/login"
+        assert req.host == "example.com"
+        assert req.headers["Host"] == "example.com"
+        assert req.headers["Authorization"] == "Bearer abc"
+        assert req.headers["X-Static"] == "unchanged"
+        assert req.body == "user=admin&token=abc"
+    
+    def test_render_matches_bind(self):
+        """Test rendering produces the same request as clone and bind."""
+        request = """POST /login2 HTTP/2
+Host: example.com
+Cookie: verify=carlos
+
+mfa-code=%MFA_CODE%"""
+        
+        base = burpr.parse_string(request)
+        template = burpr.compile(base)
+        
+        for pin in ("0000", "1234", 9999):
+            rendered = template.render({"%MFA_CODE%": pin})
+            bound = burpr.clone(base).bind("%MFA_CODE%", pin)
+            assert burpr.to_burp_format(rendered) == burpr.to_burp_format(bound)
+            assert rendered.is_http2
+    
+    def test_renders_are_independent(self):
+        """Test rendered requests do not share state with the template."""
+        template = burpr.compile(burpr.parse_string("""GET /%ID% HTTP/1.1
+Host: example.com
+X-Id: %ID%
+
+"""))
+        
+        req1 = template.render({"%ID%": "1"})
+        req1.set_header("X-Id", "changed")
+        req2 = template.render({"%ID%": "2"})
+        
+        assert req2.headers["X-Id"] == "2"
+        assert template.request().path == "/%ID%"
+    
+    def test_unbound_placeholders_are_kept(self):
+        """Test placeholders without a value are left untouched."""
+        template = burpr.compile(burpr.parse_string("""GET /?a=%A%&b=%B% HTTP/1.1
+Host: example.com
+
+"""))
+        
+        req = template.render({"%A%": "1", "%UNKNOWN%": "x"})
+        assert req.path == "/?a=1&b=%B%"
+    
+    def test_explicit_placeholders(self):
+        """Test compiling with custom placeholder formats."""
+        request = """POST /api HTTP/1.1
+Host: example.com
+
+{"code": "$2FA_CODE$", "pct": "%20%41"}"""
+        
+        template = burpr.compile(burpr.parse_string(request), ["$2FA_CODE$"])
+        req = template.render({"$2FA_CODE$": "123456"})
+        
+        assert template.placeholders == {"$2FA_CODE$"}
+        assert req.body == '{"code": "123456", "pct": "%20%41"}'
+    
+    def test_render_method(self):
+        """Test rendering placeholders in the request method."""
+        template = burpr.compile(burpr.parse_string("""%METHOD% /api HTTP/1.1
+Host: example.com
+
+"""))
+        
+        assert template.method == "%METHOD%"
+        assert template.render({"%METHOD%": "DELETE"}).method == "DELETE"
+    
+    def test_value_containing_placeholder_is_not_rebound(self):
+        """Test values are inserted verbatim, not scanned for placeholders."""
+        template = burpr.compile(burpr.parse_string("""GET /%A%/%B% HTTP/1.1
+Host: example.com
+
+"""))
+        
+        req = template.render({"%A%": "%B%", "%B%": "b"})
+        assert req.path == "/%B%/b"
+    
+    def test_placeholder_after_url_escape(self):
+        """Test a placeholder right after a %XX escape is still bound."""
+        req = burpr.parse_string("""GET /?q=caf%E9%USER% HTTP/1.1
+Host: example.com
+
+""")
+        template = burpr.compile(req)
+        assert template.placeholders == {"%E9%"}
+        assert template.render({"%USER%": "bob"}).path == "/?q=caf%E9bob"
+        
+        template = burpr.compile(req, ["%USER%"])
+        assert template.placeholders == {"%USER%"}
+        assert template.render({"%USER%": "bob"}).path == "/?q=caf%E9bob"
+        assert burpr.clone(req).bind_many({"%USER%": "bob"}).path == "/?q=caf%E9bob"
+
+
+class TestBurpXmlExport:
+    """Test streaming Burp Suite XML exports."""
+    
+    EXPORT = """<?xml version="1.0"?>
+<!DOCTYPE items [
+<!ELEMENT items (item*)>
+<!ATTLIST items burpVersion CDATA "">
+]>
+<items burpVersion="2023.10" exportTime="Mon Jan 01 00:00:00 UTC 2024">
+  <item>
+    <time>Mon Jan 01 00:00:00 UTC 2024</time>
+    <url><![CDATA[https://example.com:8443/login]]></url>
+    <host ip="10.0.0.1">example.com</host>
+    <port>8443</port>
+    <protocol>https</protocol>
+    <method><![CDATA[POST]]></method>
+    <path><![CDATA[/login]]></path>
+    <extension>null</extension>
+    <request base64="true"><![CDATA[%s]]></request>
+    <status>302</status>
+    <responselength>40</responselength>
+    <mimetype></mimetype>
+    <response base64="true"><![CDATA[%s]]></response>
+    <comment>creds</comment>
+  </item>
+  <item>
+    <url><![CDATA[http://example.com/]]></url>
+    <host ip="10.0.0.1">example.com</host>
+    <port>80</port>
+    <protocol>http</protocol>
+    <method><![CDATA[GET]]></method>
+    <path><![CDATA[/]]></path>
+    <request base64="false"><![CDATA[GET / HTTP/1.1
+Host: example.com
+
+]]></request>
+    <status></status>
+    <responselength></responselength>
+    <response base64="false"></response>
+  </item>
+</items>
+"""
+    
+    def write_export(self, tmp_path):
+        import base64
+        request = b"POST /login HTTP/1.1\r\nHost: example.com\r\n\r\nuser=admin&pass=\xff"
+        response = b"HTTP/1.1 302 Found\r\nLocation: /home\r\n\r\n"
+        path = tmp_path / "export.xml"
+        path.write_text(self.EXPORT % (
+            base64.b64encode(request).decode(),
+            base64.b64encode(response).decode()
+        ))
+        return path
+    
+    def test_iter_burp_xml(self, tmp_path):
+        """Test requests and metadata are read from every item."""
+        items = list(burpr.iter_burp_xml(str(self.write_export(tmp_path))))
+        
+        assert len(items) == 2
+        req, item = items[0]
+        assert req.method == "POST"
+        assert req.url == "https://example.com:8443/login"
+        assert req.body == "user=admin&pass=\xff"
+        assert item.ip == "10.0.0.1"
+        assert item.port == 8443
+        assert item.status == 302
+        assert item.response_length == 40
+        assert item.comment == "creds"
+        assert item.response.startswith(b"HTTP/1.1 302 Found")
+        
+        req, item = items[1]
+        assert req.url == "http://example.com/"
+        assert item.status is None
+        assert item.response is None
+    
+    def test_iter_burp_xml_is_lazy(self, tmp_path):
+        """Test items are yielded one at a time from a file object."""
+        with open(self.write_export(tmp_path), "rb") as f:
+            items = burpr.iter_burp_xml(f)
+            req, _ = next(items)
+            assert req.method == "POST"
+            req, _ = next(items)
+            assert req.method == "GET"
+            with pytest.raises(StopIteration):
+                next(items)
+
+
 class TestRequestsLibraryParsing:
     """Test parsing requests library objects."""
     
@@ -660,18 +1188,18 @@ class TestRequestMethods:
         import warnings
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            
+        
             # Mock the requests module
             import sys
             from unittest.mock import MagicMock
             mock_requests = MagicMock()
             sys.modules['requests'] = mock_requests
-            
+        
             try:
                 req.make_request()
             except:
                 pass
-            
+        
             assert len(w) == 1
             assert "HTTP/2" in str(w[0].message)
             assert "httpx" in str(w[0].message)
@@ -709,6 +1237,22 @@ Invalid Header Without Colon
         with pytest.raises(burpr.BurpParseError, match="Invalid header format"):
             burpr.parse_string(request)
     
+    def test_empty_header_name(self):
+        """Test a header line starting with a colon raises error."""
+        with pytest.raises(burpr.BurpParseError, match="Invalid header format: :value"):
+            burpr.parse_string("GET / HTTP/1.1\nHost: example.com\n:value\n\n")
+        
+        with pytest.raises(burpr.BurpParseError, match="Empty request string"):
+            burpr.parse_string(" \r\n\t")
+    
+    def test_header_values_keep_colons_and_whitespace(self):
+        """Test only the first colon and one leading space are consumed."""
+        req = burpr.parse_string("GET /a\tb HTTP/1.0\r\nHost: example.com\r\nX-Time:  12:30:00 \r\n\r\n")
+        
+        assert req.path == "/a%20b"
+        assert req.protocol == ProtocolEnum.HTTP1_0
+        assert req.headers["X-Time"] == " 12:30:00 "
+    
     def test_curl_no_url(self):
         """Test curl without URL raises error."""
         with pytest.raises(burpr.BurpParseError, match="No URL found"):
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import httpx
+import pytest
+from collections.abc import Sequence
+from burpr import burpr
+from burpr.attack import Attack
+from burpr.checkpoint import Checkpoint, resume
+from burpr.payloads import Wordlist
+
+
+TEMPLATE = """POST /login HTTP/1.1
+Host: example.com
+
+user=%USER%&pin=%PIN%"""
+
+
+class CountingList(Sequence):
+    """List recording which indices were read."""
+    
+    def __init__(self, items):
+        self.items = list(items)
+        self.reads = 0
+    
+    def __getitem__(self, index):
+        self.reads += 1
+        return self.items[index]
+    
+    def __len__(self):
+        return len(self.items)
+
+
+def mock_client(sent, fail_on=None):
+    async def handler(request):
+        body = request.content.decode()
+        if body == fail_on:
+            raise httpx.ConnectError("connection reset")
+        sent.append(body)
+        await asyncio.sleep(0)
+        return httpx.Response(200)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def run(attack, state, sent, stop_after=None, fail_on=None, concurrency=8, **kwargs):
+    """Run (or resume) an attack, returning the payloads yielded."""
+    async def main():
+        results = []
+        async for payload, res in resume(attack, state, concurrency=concurrency,
+                                         client=mock_client(sent, fail_on), **kwargs):
+            results.append(payload)
+            if len(results) == stop_after:
+                break
+        return results
+    return asyncio.run(main())
+
+
+def make_attack(users=("carlos", "wiener"), pins=range(100)):
+    template = burpr.compile(burpr.parse_string(TEMPLATE))
+    return Attack(template, ["%USER%", "%PIN%"], [list(users), [f"{pin:04d}" for pin in pins]],
+                  mode="cluster-bomb")
+
+
+def key(payload):
+    return payload["%USER%"], payload["%PIN%"]
+
+
+class TestCheckpoint:
+    """Test checkpointed attack runs and exact resume."""
+    
+    def test_stop_and_resume(self, tmp_path):
+        """Test a run stopped early resumes without repeating completed attempts."""
+        state = tmp_path / "run.state"
+        attack = make_attack()
+        sent = []
+        
+        first = run(attack, state, sent, stop_after=50)
+        saved = json.loads(state.read_text())
+        assert saved["completed"] == 50 and not saved["done"]
+        assert 0 < len(saved["in_flight"]) <= 8
+        
+        second = run(attack, state, sent)
+        assert json.loads(state.read_text())["done"]
+        
+        yielded = [key(p) for p in first + second]
+        assert len(yielded) == len(set(yielded)) == len(attack)
+        # Only the cancelled in-flight requests can have been sent twice
+        assert len(sent) - len(attack) <= 8
+        
+        # A finished run yields nothing more
+        assert run(attack, state, sent) == []
+    
+    def test_resume_with_lower_concurrency(self, tmp_path):
+        """Test saved in-flight payloads survive a restart that stops before re-sending them all."""
+        state = tmp_path / "run.state"
+        attack = make_attack()
+        sent = []
+        
+        first = run(attack, state, sent, stop_after=5, concurrency=20)
+        assert len(json.loads(state.read_text())["in_flight"]) > 1
+        second = run(attack, state, sent, stop_after=1, concurrency=1)
+        third = run(attack, state, sent)
+        
+        yielded = [key(p) for p in first + second + third]
+        assert len(yielded) == len(set(yielded)) == len(attack)
+    
+    def test_resume_after_failure(self, tmp_path):
+        """Test the failed and in-flight attempts are retried after an error."""
+        state = tmp_path / "run.state"
+        attack = make_attack()
+        sent = []
+        
+        with pytest.raises(httpx.ConnectError):
+            run(attack, state, sent, fail_on="user=wiener&pin=0000")
+        failed = json.loads(state.read_text())
+        assert {"%USER%": "wiener", "%PIN%": "0000"} in failed["in_flight"]
+        
+        rest = run(attack, state, sent)
+        assert failed["completed"] + len(rest) == len(attack)
+        assert "user=wiener&pin=0000" in sent
+    
+    def test_restart_is_constant_time(self, tmp_path):
+        """Test resuming seeks into sources instead of replaying them."""
+        state = tmp_path / "run.state"
+        wordlist = tmp_path / "pins.txt"
+        wordlist.write_text("".join(f"{pin:05d}\n" for pin in range(5000)))
+        users = CountingList(["carlos", "wiener", "peter"])
+        template = burpr.compile(burpr.parse_string(TEMPLATE))
+        attack = Attack(template, ["%USER%", "%PIN%"], [users, Wordlist(str(wordlist))], mode="cluster-bomb")
+        
+        run(attack, state, [], stop_after=9000)
+        cursor = json.loads(state.read_text())["cursor"]
+        # Next line's byte offset in the wordlist: 6 bytes per line
+        assert cursor["positions"][1] % 6 == 0 and cursor["positions"][1] >= 6 * 2999
+        
+        users.reads = 0
+        next(iter(attack.cursor(cursor)))
+        assert users.reads <= 3
+    
+    def test_periodic_saves(self, tmp_path):
+        """Test interval=0 checkpoints after every completed attempt."""
+        saves = []
+        
+        class Recording(Checkpoint):
+            def save(self, state):
+                saves.append(state["completed"])
+                super().save(state)
+        
+        attack = make_attack(pins=range(10))
+        run(attack, Recording(tmp_path / "run.state", interval=0), [])
+        assert saves == list(range(1, 21)) + [20]
+    
+    def test_rejects_other_attack(self, tmp_path):
+        """Test a state file is only resumed by the attack that wrote it."""
+        state = tmp_path / "run.state"
+        run(make_attack(), state, [], stop_after=5)
+        with pytest.raises(ValueError):
+            template = burpr.compile(burpr.parse_string(TEMPLATE.replace("/login", "/login2")))
+            run(Attack(template, ["%USER%", "%PIN%"], [["a"], ["1"]], mode="cluster-bomb"), state, [])
@@ -0,0 +1,114 @@
+import pytest
+from burpr import burpr, clients
+from burpr.enums.TransportEnum import TransportEnum
+
+
+REQUEST = """POST /echo HTTP/1.1
+Host: %HOST%
+
+data=%DATA%"""
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    """Start and finish every test with an empty client registry."""
+    clients.close_clients()
+    yield
+    clients.close_clients()
+
+
+def make_request(host, data="x"):
+    req = burpr.parse_string(REQUEST).bind_many({"%HOST%": host, "%DATA%": data})
+    req.transport = TransportEnum.HTTP
+    return req
+
+
+@pytest.mark.usefixtures("real_requests")
+class TestClientRegistry:
+    """Test the shared connection-pool registry."""
+    
+    def test_clients_are_keyed_by_transport_host_and_protocol(self):
+        """Test one client is cached per (transport, host, is_http2)."""
+        req1 = make_request("a.example.com")
+        req2 = make_request("a.example.com")
+        req3 = make_request("b.example.com")
+        
+        assert clients.get_httpx_client(req1) is clients.get_httpx_client(req2)
+        assert clients.get_httpx_client(req1) is not clients.get_httpx_client(req3)
+        
+        req2.transport = TransportEnum.HTTPS
+        assert clients.get_httpx_client(req1) is not clients.get_httpx_client(req2)
+        
+        req2.protocol = "HTTP/2"
+        assert clients.get_session(req1) is clients.get_session(make_request("a.example.com"))
+        assert clients.get_session(req1) is not clients.get_session(req2)
+    
+    def test_close_clients(self):
+        """Test closing the registry closes and forgets every client."""
+        req = make_request("a.example.com")
+        client = clients.get_httpx_client(req)
+        
+        clients.close_clients()
+        
+        assert client.is_closed
+        assert clients.get_httpx_client(req) is not client
+    
+    def test_configure_clients(self):
+        """Test pool limits apply to newly created clients."""
+        clients.configure_clients(max_connections=7, keepalive_expiry=1.5)
+        try:
+            client = clients.get_httpx_client(make_request("a.example.com"))
+            pool = client._transport._pool
+            assert pool._max_connections == 7
+            assert pool._keepalive_expiry == 1.5
+        finally:
+            clients.configure_clients(max_connections=100, keepalive_expiry=5.0)
+    
+    def test_registry_is_bounded(self):
+        """Test the least recently used client is closed once the registry is full."""
+        clients.configure_clients(max_clients=3)
+        try:
+            first = clients.get_httpx_client(make_request("a.example.com"))
+            second = clients.get_httpx_client(make_request("b.example.com"))
+            clients.get_httpx_client(make_request("c.example.com"))
+            # Using the first client again makes the second the oldest
+            assert clients.get_httpx_client(make_request("a.example.com")) is first
+        
+            clients.get_httpx_client(make_request("d.example.com"))
+            assert second.is_closed and not first.is_closed
+        
+            for i in range(10):
+                clients.get_httpx_client(make_request(f"fuzz{i}.example.com"))
+        
+            assert len(clients._clients) == 3
+            assert second.is_closed and first.is_closed
+        finally:
+            clients.configure_clients(max_clients=64)
+        
+        with pytest.raises(ValueError):
+            clients.configure_clients(max_clients=0)
+    
+    def test_default_paths_reuse_connections(self, echo_server):
+        """Test make_request and make_httpx_request reuse warm connections."""
+        ports = set()
+        for i in range(5):
+            res = make_request(echo_server, i).make_request()
+            assert res.text == f"data={i}"
+            ports.add(res.headers["X-Client-Port"])
+        assert len(ports) == 1
+        
+        ports = set()
+        for i in range(5):
+            res = make_request(echo_server, i).make_httpx_request()
+            assert res.text == f"data={i}"
+            ports.add(res.headers["X-Client-Port"])
+        assert len(ports) == 1
+    
+    def test_shared_clients_do_not_keep_cookies(self, echo_server):
+        """Test a cookie set by one response is not sent with the next request."""
+        for send in ("make_request", "make_httpx_request"):
+            first = getattr(make_request(echo_server), send)()
+            second = getattr(make_request(echo_server), send)()
+        
+            assert first.headers["Set-Cookie"] == "session=admin; Path=/"
+            assert second.headers["X-Cookie"] == ""
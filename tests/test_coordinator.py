@@ -0,0 +1,97 @@
+import asyncio
+import os
+import httpx
+import pytest
+from burpr import burpr
+from burpr.attack import Attack
+from burpr.matchers import Status, ResponseMatcher
+from burpr.payloads import Wordlist
+from burpr.runners import Coordinator
+
+
+TEMPLATE = """POST /login2 HTTP/1.1
+Host: example.com
+
+mfa-code=%PIN%"""
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="workers are forked")
+
+
+def mock_client(secret=None, delay=0.0):
+    """Client answering 302 for the secret PIN and 200 otherwise, with the worker's pid."""
+    async def handler(request):
+        await asyncio.sleep(delay)
+        status = 302 if secret and request.content == f"mfa-code={secret}".encode() else 200
+        return httpx.Response(status, text=str(os.getpid()))
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def template():
+    return burpr.compile(burpr.parse_string(TEMPLATE))
+
+
+class TestCoordinator:
+    """Test fanning campaigns out over worker processes."""
+    
+    def test_shards_attack_across_workers(self, template, tmp_path):
+        """Test every payload is sent exactly once, spread over every worker process."""
+        pins = tmp_path / "pins.txt"
+        pins.write_text("".join(f"{pin:04d}\n" for pin in range(400)))
+        attack = Attack(template, ["%PIN%"], [Wordlist(str(pins))])
+        
+        coordinator = Coordinator(workers=4, concurrency=5, batch_size=16)
+        outcomes = list(coordinator.run(template, attack, client_factory=mock_client))
+        
+        assert sorted(o.payload["%PIN%"] for o in outcomes) == [f"{pin:04d}" for pin in range(400)]
+        assert {o.worker for o in outcomes} == {0, 1, 2, 3}
+        assert len({o.length for o in outcomes}) == 1
+        assert sum(coordinator.sent.values()) == 400
+        assert coordinator.hits == 0
+    
+    def test_hit_stops_every_worker(self, template):
+        """Test the first hit stops the campaign in all workers."""
+        payloads = [{"%PIN%": f"{pin:04d}"} for pin in range(10000)]
+        coordinator = Coordinator(workers=3, concurrency=4)
+        
+        hits = []
+        outcomes = 0
+        for outcome in coordinator.run(template, payloads, hit=lambda res: res.status_code == 302,
+                                       client_factory=lambda: mock_client("0042", delay=0.001)):
+            outcomes += 1
+            if outcome:
+                hits.append(outcome.payload)
+        
+        assert hits == [{"%PIN%": "0042"}]
+        assert outcomes < 10000
+        assert len(coordinator.sent) == 3
+    
+    def test_matcher_hits_and_errors(self, template):
+        """Test matcher verdicts mark hits and failures are reported, not raised."""
+        def failing_client():
+            def handler(request):
+                if request.content == b"mfa-code=3":
+                    raise httpx.ConnectError("refused")
+                return httpx.Response(302 if request.content == b"mfa-code=5" else 200, content=b"x" * 5000)
+            return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        coordinator = Coordinator(workers=2)
+        outcomes = list(coordinator.run(template, [{"%PIN%": str(pin)} for pin in range(8)],
+                                        matcher=ResponseMatcher(Status(302)), stop_on_hit=False,
+                                        client_factory=failing_client))
+        
+        assert len(outcomes) == 8
+        # Decided by status, so the length comes from Content-Length
+        assert {o.length for o in outcomes if not o.error} == {5000}
+        assert [o.payload for o in outcomes if o] == [{"%PIN%": "5"}]
+        failed = [o for o in outcomes if o.error]
+        assert [o.payload for o in failed] == [{"%PIN%": "3"}]
+        assert "ConnectError" in failed[0].error
+    
+    def test_worker_failure(self, template):
+        """Test an exception in a worker is raised by the coordinator."""
+        def broken_client():
+            raise RuntimeError("no proxy")
+        
+        with pytest.raises(RuntimeError, match="no proxy"):
+            list(Coordinator(workers=2).run(template, [{"%PIN%": "1"}], client_factory=broken_client))
@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from burpr import burpr
+from burpr.enums.TransportEnum import TransportEnum
+from burpr.runners.http2 import Http2Sender, HeaderBlock
+from tests.servers import H2Server
+
+
+TEMPLATE = """POST /login2?pin=%PIN% HTTP/2
+Host: %HOST%
+Connection: keep-alive
+Content-Type: application/x-www-form-urlencoded
+X-Pin: %PIN%
+
+mfa-code=%PIN%"""
+
+
+def run_sender(server_options, count, **sender_options):
+    """Send `count` requests to a local stand-in HTTP/2 server."""
+    async def main():
+        async with H2Server(**server_options) as server:
+            req = burpr.parse_string(TEMPLATE).bind("%HOST%", server.host)
+            req.transport = TransportEnum.HTTP
+            payloads = ({"%PIN%": f"{pin:04d}"} for pin in range(count))
+            
+            sender = Http2Sender(**sender_options)
+            results = [item async for item in sender.run(burpr.compile(req), payloads)]
+            return server, results
+    return asyncio.run(main())
+
+
+class TestHttp2Sender:
+    """Test the multiplexed HTTP/2 sender."""
+    
+    def test_header_block(self):
+        """Test static headers are prebuilt and connection headers dropped."""
+        template = burpr.compile(burpr.parse_string(TEMPLATE))
+        block = HeaderBlock(template)
+        
+        assert block.static == [(b"content-type", b"application/x-www-form-urlencoded")]
+        assert block.dynamic == [("X-Pin", b"x-pin")]
+        
+        req = template.render({"%HOST%": "example.com", "%PIN%": "1"})
+        assert block.build(req, 10) == [
+            (b":method", b"POST"),
+            (b":scheme", b"https"),
+            (b":authority", b"example.com"),
+            (b":path", b"/login2?pin=1"),
+            (b"content-type", b"application/x-www-form-urlencoded"),
+            (b"x-pin", b"1"),
+            (b"content-length", b"10"),
+        ]
+    
+    def test_multiplexes_streams(self):
+        """Test many streams share one connection and are paired correctly."""
+        server, results = run_sender({}, 150, connections=1, max_streams=50)
+        
+        assert len(results) == 150
+        assert server.connections == 1
+        assert server.peak_streams == 50
+        for payload, res in results:
+            assert res.status_code == 200
+            assert res.http_version == "HTTP/2"
+            assert res.text == f"mfa-code={payload['%PIN%']}"
+            assert res.headers["x-path"] == f"/login2?pin={payload['%PIN%']}"
+    
+    def test_respects_server_stream_limit(self):
+        """Test SETTINGS_MAX_CONCURRENT_STREAMS caps streams in flight."""
+        server, results = run_sender({"max_concurrent_streams": 7}, 60, connections=2, max_streams=100)
+        
+        assert len(results) == 60
+        assert server.connections == 2
+        assert server.peak_streams == 7
+    
+    def test_retries_after_goaway(self):
+        """Test streams dropped by a GOAWAY are re-sent on a new connection."""
+        server, results = run_sender({"goaway_after": 10}, 45, connections=1, max_streams=20)
+        
+        assert sorted(p["%PIN%"] for p, _ in results) == [f"{pin:04d}" for pin in range(45)]
+        assert all(res.text == f"mfa-code={payload['%PIN%']}" for payload, res in results)
+        assert server.connections >= 5
+    
+    def test_large_body_flow_control(self):
+        """Test request bodies larger than the flow-control window are streamed."""
+        async def main():
+            async with H2Server() as server:
+                req = burpr.parse_string(TEMPLATE).bind("%HOST%", server.host)
+                req.transport = TransportEnum.HTTP
+                req.body = "A" * 200000 + "%PIN%"
+                payloads = [{"%PIN%": "1"}, {"%PIN%": "2"}]
+                return [item async for item in Http2Sender().run(req, payloads)]
+        
+        results = asyncio.run(main())
+        
+        assert [res.headers["x-body-length"] for _, res in results] == ["200001", "200001"]
+    
+    def test_invalid_options(self):
+        """Test max_streams must be positive."""
+        with pytest.raises(ValueError):
+            Http2Sender(max_streams=0)
@@ -0,0 +1,113 @@
+import asyncio
+import httpx
+import pytest
+from burpr import burpr
+from burpr.enums.TransportEnum import TransportEnum
+from burpr.instrument import Profile, RequestTiming, PHASES
+from burpr.matchers import Contains, ResponseMatcher
+from burpr.runners import run_async
+from tests.servers import H1Server
+
+
+TEMPLATE = """POST /login HTTP/1.1
+Host: %HOST%
+Content-Type: application/x-www-form-urlencoded
+
+pin=%PIN%"""
+
+
+def local_template(server):
+    req = burpr.parse_string(TEMPLATE).bind("%HOST%", server.host)
+    req.transport = TransportEnum.HTTP
+    return burpr.compile(req)
+
+
+class TestInstrumentation:
+    """Test per-request phase timings from httpx trace events."""
+    
+    def test_amake_request_phases(self):
+        """Test a new connection reports connect, and a reused one does not."""
+        timings = []
+        
+        async def main():
+            async with H1Server() as server:
+                template = local_template(server)
+                async with httpx.AsyncClient() as client:
+                    for pin in ("0001", "0002"):
+                        req = template.render({"%PIN%": pin})
+                        await req.amake_request(client, instrument=timings.append)
+        
+        asyncio.run(main())
+        
+        first, second = timings
+        assert first.status_code == 200
+        assert first.connect is not None and first.connect >= 0
+        assert first.tls is None
+        assert second.connect is None
+        for timing in timings:
+            for phase in ("queue", "write", "ttfb", "read", "total"):
+                assert getattr(timing, phase) is not None
+            assert timing.queue + timing.write + timing.ttfb + timing.read <= timing.total + 1e-6
+    
+    def test_run_async_tags_payload_and_template(self):
+        """Test batch events carry the payload and template id, with and without a matcher."""
+        profile = Profile(keep=True)
+        matched = []
+        
+        async def main():
+            async with H1Server() as server:
+                template = local_template(server)
+                payloads = [{"%PIN%": f"{pin:04d}"} for pin in range(20)]
+                async for _ in run_async(template, payloads, concurrency=4, instrument=profile):
+                    pass
+                matcher = ResponseMatcher(Contains("pin=0003"))
+                async for payload, result in run_async(template, payloads[:5], matcher=matcher,
+                                                       instrument=profile):
+                    if result:
+                        matched.append(payload)
+                return template, server.connections
+        
+        template, connections = asyncio.run(main())
+        
+        assert matched == [{"%PIN%": "0003"}]
+        assert profile.count == 25 and profile.errors == 0
+        assert {t.template_id for t in profile.timings} == {template.id}
+        assert sorted(t.payload["%PIN%"] for t in profile.timings[:20]) == [f"{pin:04d}" for pin in range(20)]
+        summary = profile.summary()
+        assert summary["total"]["count"] == 25
+        # One connect per connection opened, not per request
+        assert summary["connect"]["count"] == connections < 25
+        assert "tls" not in summary
+        assert summary["ttfb"]["p50"] <= summary["ttfb"]["p95"] <= summary["ttfb"]["max"]
+    
+    def test_without_trace_events(self):
+        """Test transports without trace hooks still report status, errors and totals."""
+        timings = []
+        
+        def handler(request):
+            if b"fail" in request.content:
+                raise httpx.ConnectError("refused")
+            return httpx.Response(201)
+        
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        req = burpr.parse_string(TEMPLATE.replace("%HOST%", "example.com"))
+        
+        req.make_httpx_request(client, instrument=timings.append, extensions={"timeout": {}})
+        with pytest.raises(httpx.ConnectError):
+            req.bind("%PIN%", "fail").make_httpx_request(client, instrument=timings.append)
+        
+        assert timings[0].status_code == 201
+        assert timings[0].total is not None and timings[0].connect is None
+        assert isinstance(timings[1].error, httpx.ConnectError)
+        assert set(timings[1].as_dict()) == {"payload", "template_id", "status_code", "error", *PHASES}
+    
+    def test_template_id(self):
+        """Test template ids are stable for equal templates and differ otherwise."""
+        a = burpr.compile(burpr.parse_string(TEMPLATE))
+        b = burpr.compile(burpr.parse_string(TEMPLATE))
+        c = burpr.compile(burpr.parse_string(TEMPLATE.replace("/login", "/login2")))
+        
+        assert a.id == b.id
+        assert a.id != c.id
+        assert len(a.id) == 12
+        assert repr(RequestTiming(status_code=200, total=0.5)) == "RequestTiming(status_code=200, total=500.00ms)"
@@ -0,0 +1,150 @@
+import asyncio
+import time
+import httpx
+import pytest
+from burpr import burpr
+from burpr.runners import run_async
+from burpr.runners.limiter import AdaptiveLimiter, retry_after_seconds
+
+
+TEMPLATE = """POST /login2 HTTP/1.1
+Host: example.com
+
+mfa-code=%MFA_CODE%"""
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self):
+        return self.now
+
+
+def ok(status=200, headers=None):
+    return httpx.Response(status, headers=headers)
+
+
+def collect(agen):
+    """Drain an async generator into a list."""
+    async def drain():
+        return [item async for item in agen]
+    return asyncio.run(drain())
+
+
+class TestAdaptiveLimiter:
+    """Test the AIMD rate and concurrency controller."""
+    
+    def test_pacing(self):
+        """Test sends are spaced 1/rate apart and paused by Retry-After."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(rate=10, clock=clock)
+        
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(0.1)
+        clock.now += 0.1
+        assert limiter.reserve() == 0
+        
+        limiter.record(ok(429, {"Retry-After": "3"}), 0.01, clock.now)
+        assert limiter.setpoint["paused_for"] == pytest.approx(3)
+        assert limiter.reserve() == pytest.approx(3)
+    
+    def test_additive_increase(self):
+        """Test healthy windows raise concurrency by one and rate additively."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(rate=20, concurrency=4, window=5, clock=clock)
+        
+        for _ in range(10):
+            limiter.record(ok(), 0.05, clock.now)
+        
+        assert limiter.setpoint["concurrency"] == 6
+        assert limiter.setpoint["rate"] == pytest.approx(24)
+        assert limiter.setpoint["p95"] == pytest.approx(0.05)
+        assert limiter.setpoint["error_rate"] == 0
+    
+    def test_multiplicative_decrease_once_per_generation(self):
+        """Test a burst of 429s from in-flight requests only halves once."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(rate=40, concurrency=16, clock=clock)
+        sent_at = clock.now
+        clock.now += 1
+        
+        for _ in range(5):
+            limiter.record(ok(429), 0.05, sent_at)
+        assert (limiter.concurrency, limiter.rate) == (8, 20)
+        
+        # A request sent after the cut can cut again, down to the floors
+        limiter.record(ok(503), 0.05, clock.now)
+        assert (limiter.concurrency, limiter.rate) == (4, 10)
+    
+    def test_unhealthy_windows(self):
+        """Test latency spikes and error rates trigger backoff."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(rate=None, concurrency=10, window=4, clock=clock)
+        
+        for latency in (0.1, 0.1, 0.1, 0.1, 0.5, 0.5, 0.5, 0.5):
+            clock.now += 1
+            limiter.record(ok(), latency, clock.now)
+        assert limiter.concurrency == 5
+        assert limiter.rate is None
+        
+        for response in (ok(), ok(500), ConnectionError(), ok()):
+            clock.now += 1
+            limiter.record(response, 0.1, clock.now)
+        assert limiter.concurrency == 2
+        assert limiter.error_rate == 0.5
+    
+    def test_retry_after_formats(self):
+        """Test delay-seconds and HTTP-date Retry-After values."""
+        assert retry_after_seconds("120") == 120
+        assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        future = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 30))
+        assert 25 < retry_after_seconds(future) <= 30
+        assert retry_after_seconds("soon") is None
+        assert retry_after_seconds(None) is None
+    
+    def test_run_async_backs_off(self):
+        """Test run_async follows the limiter's concurrency through 429s."""
+        in_flight = 0
+        peaks = []
+        calls = 0
+        
+        async def handler(request):
+            nonlocal in_flight, calls
+            calls += 1
+            in_flight += 1
+            peaks.append(in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(429 if calls <= 8 else 200)
+        
+        limiter = AdaptiveLimiter(rate=None, concurrency=8, window=1000)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        payloads = ({"%MFA_CODE%": str(pin)} for pin in range(40))
+        
+        results = collect(run_async(burpr.parse_string(TEMPLATE), payloads,
+                                    concurrency=32, client=client, limiter=limiter))
+        
+        assert len(results) == 40
+        assert limiter.concurrency == 4
+        assert max(peaks[8:]) <= 8
+        assert max(peaks[-20:]) == 4
+    
+    def test_run_async_paces_rate(self):
+        """Test run_async never sends faster than the limiter's rate."""
+        sent = []
+        
+        def handler(request):
+            sent.append(time.monotonic())
+            return httpx.Response(200)
+        
+        limiter = AdaptiveLimiter(rate=100, concurrency=4, window=1000)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        payloads = [{"%MFA_CODE%": str(pin)} for pin in range(11)]
+        
+        results = collect(run_async(burpr.parse_string(TEMPLATE), payloads, client=client, limiter=limiter))
+        
+        assert len(results) == 11
+        assert sent[-1] - sent[0] >= 0.095
@@ -0,0 +1,142 @@
+import asyncio
+import httpx
+import pytest
+from burpr import burpr
+from burpr.matchers import Contains, Header, Length, Regex, ResponseMatcher, Status
+from burpr.runners import run_async
+from burpr.runners.base import RawResponse
+
+
+TEMPLATE = """POST /login HTTP/1.1
+Host: example.com
+
+password=%PASS%"""
+
+
+class Page:
+    """Streamed response body of 1 KiB chunks that records how many were read."""
+    
+    def __init__(self, chunks=100, needle_at=None, needle=b"Welcome back"):
+        self.chunks = chunks
+        self.needle_at = needle_at
+        self.needle = needle
+        self.read = 0
+    
+    def _chunk(self, i):
+        self.read += 1
+        chunk = bytearray(b"." * 1024)
+        if i == self.needle_at:
+            # Straddle the boundary with the next chunk
+            chunk[-5:] = self.needle[:5]
+        if self.needle_at is not None and i == self.needle_at + 1:
+            chunk[:len(self.needle) - 5] = self.needle[5:]
+        return bytes(chunk)
+    
+    def __iter__(self):
+        for i in range(self.chunks):
+            yield self._chunk(i)
+    
+    async def __aiter__(self):
+        for i in range(self.chunks):
+            yield self._chunk(i)
+
+
+def client_for(page, status=200, headers=None):
+    def handler(request):
+        return httpx.Response(status, headers=headers, content=iter(page))
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestResponseMatcher:
+    """Test streaming response matchers."""
+    
+    def test_stops_reading_once_matched(self):
+        """Test a body match across a chunk boundary closes the stream early."""
+        page = Page(needle_at=3)
+        req = burpr.parse_string(TEMPLATE)
+        
+        result = ResponseMatcher(Status(200), Contains("Welcome back")).match(req, client_for(page))
+        
+        assert result
+        assert page.read == 5
+        assert not result.complete
+        assert len(result.body) == 5 * 1024
+    
+    def test_head_verdict_skips_body(self):
+        """Test status and header mismatches never read the body."""
+        page = Page(needle_at=3)
+        req = burpr.parse_string(TEMPLATE)
+        
+        result = ResponseMatcher(Status(302), Contains("Welcome back")).match(req, client_for(page))
+        assert not result and page.read == 0
+        assert not result.complete and result.body == b""
+        
+        empty = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(404, headers={"Content-Length": "0"})))
+        assert ResponseMatcher(Status(302)).match(req, empty).complete
+        assert not ResponseMatcher(Status(302)).check(httpx.Response(404, content=b"x" * 5000)).complete
+        
+        matcher = ResponseMatcher(Header("Location", "/home"), Contains("x"), mode="any")
+        assert matcher.match(req, client_for(page, 302, {"Location": "/home"}))
+        assert page.read == 0
+    
+    def test_byte_cap(self):
+        """Test undecided matchers give up at max_bytes."""
+        page = Page()
+        req = burpr.parse_string(TEMPLATE)
+        
+        result = ResponseMatcher(Contains("Welcome back"), max_bytes=4096).match(req, client_for(page))
+        
+        assert not result
+        assert page.read == 4
+        assert len(result.body) == 4096
+    
+    def test_length(self):
+        """Test length ranges from Content-Length or by counting."""
+        req = burpr.parse_string(TEMPLATE)
+        
+        page = Page(chunks=3)
+        assert ResponseMatcher(Length(min=3072, max=3072)).match(req, client_for(page))
+        
+        page = Page(chunks=100)
+        assert not ResponseMatcher(Length(max=2000)).match(req, client_for(page))
+        assert page.read == 2
+        
+        declared = client_for(Page(chunks=100), headers={"Content-Length": "102400"})
+        assert not ResponseMatcher(Length(max=2000), Contains("x")).match(req, declared)
+    
+    def test_regex_and_check(self):
+        """Test regexes and matching already downloaded responses."""
+        raw = RawResponse(200, "OK", "HTTP/1.1", {"set-cookie": "session=abc"}, b"<p>user id: 42</p>")
+        
+        assert ResponseMatcher(Regex(rb"user id: \d+"), Header("Set-Cookie", "session=")).check(raw)
+        assert not ResponseMatcher(Regex("admin"), Status(500), mode="any").check(raw)
+    
+    def test_validation(self):
+        """Test bad modes and empty matcher lists are rejected."""
+        with pytest.raises(ValueError, match="Unknown match mode"):
+            ResponseMatcher(Status(200), mode="none")
+        with pytest.raises(ValueError, match="At least one matcher"):
+            ResponseMatcher()
+    
+    def test_run_async_with_matcher(self):
+        """Test run_async yields MatchResults from streamed responses."""
+        pages = []
+        
+        def handler(request):
+            page = Page(needle_at=1 if request.content.endswith(b"=2") else None)
+            pages.append(page)
+            # httpx takes anything iterable as a sync stream, so hand it the async one
+            return httpx.Response(200, content=page.__aiter__())
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        matcher = ResponseMatcher(Contains("Welcome back"), max_bytes=8192)
+        payloads = [{"%PASS%": str(i)} for i in range(4)]
+        
+        async def main():
+            req = burpr.parse_string(TEMPLATE)
+            return [item async for item in run_async(req, payloads, client=client, matcher=matcher)]
+        
+        results = asyncio.run(main())
+        
+        assert [payload for payload, result in results if result] == [{"%PASS%": "2"}]
+        assert sorted(page.read for page in pages) == [3, 8, 8, 8]
@@ -0,0 +1,93 @@
+import pytest
+from burpr import burpr
+from burpr.attack import Attack
+from burpr.payloads import Wordlist
+
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_bytes(b"admin\r\npassword\n\n123456\nqwerty\xe9\nletmein")
+    return str(path)
+
+
+class TestWordlist:
+    """Test memory-mapped wordlist payload sources."""
+    
+    def test_iterates_lines(self, wordlist):
+        """Test CRLF/LF endings are stripped and bytes pass through as latin-1."""
+        words = Wordlist(wordlist)
+        
+        assert list(words) == ["admin", "password", "", "123456", "qwerty\xe9", "letmein"]
+        assert list(words) == list(words)
+        assert len(words) == 6
+    
+    def test_encoding(self, tmp_path):
+        """Test lines can be decoded with another encoding."""
+        path = tmp_path / "utf8.txt"
+        path.write_bytes("zażółć\nok\n".encode("utf-8"))
+        
+        words = Wordlist(str(path), encoding="utf-8")
+        
+        assert list(words) == ["zażółć", "ok"]
+        assert len(words) == 2
+    
+    def test_empty_file(self, tmp_path):
+        """Test empty wordlists yield nothing and shard cleanly."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        
+        words = Wordlist(str(path))
+        
+        assert list(words) == []
+        assert len(words) == 0
+        assert list(words.shard(1, 3)) == []
+    
+    @pytest.mark.parametrize("count", [1, 2, 3, 7, 50])
+    def test_shards_are_disjoint_and_complete(self, tmp_path, count):
+        """Test shards partition the lines, whatever the shard count."""
+        path = tmp_path / "big.txt"
+        lines = [f"word{i}" * (i % 5 + 1) for i in range(500)]
+        path.write_bytes("\n".join(lines).encode())
+        words = Wordlist(str(path))
+        
+        shards = [words.shard(i, count) for i in range(count)]
+        
+        assert [line for shard in shards for line in shard] == lines
+        assert sum(len(shard) for shard in shards) == len(lines)
+        assert list(shards[0].shard(0, 1)) == list(shards[0])
+        
+        with pytest.raises(ValueError, match="Shard index"):
+            words.shard(count, count)
+    
+    def test_chunk_boundaries(self, tmp_path, monkeypatch):
+        """Test reading and counting across chunk boundaries, and the sampled estimate."""
+        monkeypatch.setattr("burpr.payloads.COUNT_CHUNK", 7)
+        monkeypatch.setattr("burpr.payloads.READ_CHUNK", 7)
+        path = tmp_path / "words.txt"
+        path.write_bytes(b"".join(b"%05d\r\n" % i for i in range(1000)))
+        words = Wordlist(str(path))
+        
+        assert words.estimate(sample=700) == 1000
+        assert len(words) == 1000
+        assert list(words) == ["%05d" % i for i in range(1000)]
+        assert [line for i in range(3) for line in words.shard(i, 3)] == list(words)
+    
+    def test_iter_from(self, wordlist):
+        """Test iteration resumes from any returned offset."""
+        words = Wordlist(wordlist)
+        pairs = list(words.iter_from())
+        
+        assert [line for line, _ in pairs] == list(words)
+        for i, (_, offset) in enumerate(pairs):
+            assert [line for line, _ in words.iter_from(offset)] == list(words)[i + 1:]
+    
+    def test_attack_reiterates_wordlists(self, wordlist):
+        """Test wordlists work as re-iterable Attack sources."""
+        template = burpr.compile(burpr.parse_string("POST / HTTP/1.1\nHost: x\n\nu=%USER%&p=%PASS%"))
+        words = Wordlist(wordlist)
+        
+        attack = Attack(template, ["%USER%", "%PASS%"], [words, words], mode="cluster-bomb")
+        
+        assert len(attack) == 36
+        assert sum(1 for _ in attack) == 36
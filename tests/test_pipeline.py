@@ -0,0 +1,131 @@
+import asyncio
+import pytest
+from burpr import burpr
+from burpr.enums.TransportEnum import TransportEnum
+from burpr.runners.pipeline import PipelineSender, ResponseParser
+from tests.servers import H1Server
+
+
+TEMPLATE = """POST /login HTTP/1.1
+Host: %HOST%
+Content-Type: application/x-www-form-urlencoded
+
+pin=%PIN%"""
+
+
+def run_sender(server_options, count, template=TEMPLATE, **sender_options):
+    """Pipeline `count` requests to a local stand-in server."""
+    async def main():
+        async with H1Server(**server_options) as server:
+            req = burpr.parse_string(template).bind("%HOST%", server.host)
+            req.transport = TransportEnum.HTTP
+            payloads = ({"%PIN%": f"{pin:04d}"} for pin in range(count))
+            
+            sender = PipelineSender(**sender_options)
+            results = [item async for item in sender.run(burpr.compile(req), payloads)]
+            return server, results
+    return asyncio.run(main())
+
+
+class TestResponseParser:
+    """Test the incremental HTTP/1.x response parser."""
+    
+    def test_split_across_reads(self):
+        """Test responses are assembled from arbitrarily split reads."""
+        data = (b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello"
+                b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+        parser = ResponseParser()
+        parser.expect("GET")
+        parser.expect("GET")
+        
+        responses = []
+        for i in range(len(data)):
+            responses.extend(parser.feed(data[i:i + 1]))
+        
+        assert [r.status_code for r in responses] == [200, 404]
+        assert responses[0].content == b"hello"
+        assert responses[1].reason == "Not Found"
+    
+    def test_chunked_interim_and_head(self):
+        """Test chunked bodies, 100 Continue and bodiless HEAD responses."""
+        parser = ResponseParser()
+        parser.expect("HEAD")
+        parser.expect("POST")
+        
+        responses = parser.feed(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n"
+            b"HTTP/1.1 100 Continue\r\n\r\n"
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\nSet-Cookie: a=1\r\nSet-Cookie: b=2\r\n\r\n"
+            b"3\r\nabc\r\n2;x=y\r\nde\r\n0\r\nTrailer: 1\r\n\r\n"
+        )
+        
+        assert [r.content for r in responses] == [b"", b"abcde"]
+        assert responses[1].headers["set-cookie"] == "a=1, b=2"
+    
+    def test_body_until_eof(self):
+        """Test bodies without framing end when the connection closes."""
+        parser = ResponseParser()
+        parser.expect("GET")
+        
+        assert parser.feed(b"HTTP/1.0 200 OK\r\nConnection: close\r\n\r\npartial") == []
+        responses = parser.feed_eof()
+        
+        assert responses[0].text == "partial"
+        assert not parser.keep_alive
+
+
+class TestPipelineSender:
+    """Test the raw-socket pipelined HTTP/1.1 sender."""
+    
+    def test_to_bytes(self):
+        """Test requests serialise to CRLF wire format."""
+        req = burpr.parse_string(TEMPLATE).bind_many({"%HOST%": "example.com", "%PIN%": "1"})
+        burpr.prepare(req)
+        
+        assert burpr.to_bytes(req) == (
+            b"POST /login HTTP/1.1\r\nHost: example.com\r\n"
+            b"Content-Type: application/x-www-form-urlencoded\r\n"
+            b"Content-Length: 5\r\n\r\npin=1"
+        )
+    
+    def test_pipelines_over_few_connections(self):
+        """Test every payload is paired with its own response."""
+        server, results = run_sender({}, 200, connections=2, depth=16)
+        
+        assert len(results) == 200
+        assert server.connections == 2
+        for payload, res in results:
+            assert res.status_code == 200
+            assert res.text == f"pin={payload['%PIN%']}"
+    
+    def test_chunked_responses(self):
+        """Test chunked responses are decoded while pipelining."""
+        _, results = run_sender({"chunked": True}, 50, connections=1, depth=8)
+        
+        assert len(results) == 50
+        assert all(res.text == f"pin={payload['%PIN%']}" for payload, res in results)
+    
+    def test_resends_after_connection_close(self):
+        """Test unanswered requests are re-sent when the server closes early."""
+        server, results = run_sender({"close_after": 7}, 60, connections=2, depth=10)
+        
+        assert sorted(p["%PIN%"] for p, _ in results) == [f"{pin:04d}" for pin in range(60)]
+        assert all(res.text == f"pin={payload['%PIN%']}" for payload, res in results)
+        assert server.connections >= 60 // 7
+    
+    @pytest.mark.parametrize("template", [
+        TEMPLATE.replace("Host: %HOST%", "Host: %HOST%\nConnection: close"),
+        TEMPLATE.replace("HTTP/1.1", "HTTP/1.0"),
+    ])
+    def test_closing_templates_stay_pipelined(self, template):
+        """Test Connection: close and HTTP/1.0 templates are sent as keep-alive."""
+        server, results = run_sender({}, 100, template, connections=2, depth=16, max_retries=0)
+        
+        assert all(res.text == f"pin={payload['%PIN%']}" for payload, res in results)
+        assert len(results) == 100
+        assert server.connections == 2
+    
+    def test_invalid_options(self):
+        """Test connections and depth must be positive."""
+        with pytest.raises(ValueError):
+            PipelineSender(connections=0)
@@ -0,0 +1,76 @@
+import asyncio
+import pytest
+from burpr import burpr
+from burpr.enums.TransportEnum import TransportEnum
+from burpr.runners.race import arace, race
+from tests.servers import H1Server, H2Server
+
+
+TEMPLATE = """POST /redeem HTTP/2
+Host: %HOST%
+Content-Type: application/x-www-form-urlencoded
+
+coupon=%COUPON%"""
+
+
+def run_race(server_class, count, **options):
+    """Race `count` requests against a local stand-in server."""
+    async def main():
+        async with server_class() as server:
+            req = burpr.parse_string(TEMPLATE).bind("%HOST%", server.host)
+            req.transport = TransportEnum.HTTP
+            template = burpr.compile(req)
+            reqs = [template.render({"%COUPON%": f"C{i}"}) for i in range(count)]
+            results = await arace(reqs, **options)
+            return server, results
+    return asyncio.run(main())
+
+
+class TestRace:
+    """Test the single-packet and last-byte-sync race modes."""
+    
+    def test_h2_single_packet(self):
+        """Test all streams complete together and in request order."""
+        server, results = run_race(H2Server, 20, mode="h2-single-packet", warmup=0.1)
+        
+        assert [res.response.text for res in results] == [f"coupon=C{i}" for i in range(20)]
+        assert server.connections == 1
+        assert results.send_spread is None
+        assert len({r.sent_at for r in results}) == 1
+        assert max(server.received) - min(server.received) < 0.05
+        assert all(r.sent_at <= r.first_byte_at <= r.received_at for r in results)
+    
+    def test_h1_last_byte(self):
+        """Test every request is held back until its last byte is released."""
+        server, results = run_race(H1Server, 10, mode="h1-last-byte", warmup=0.1)
+        
+        assert [res.response.text for res in results] == [f"coupon=C{i}" for i in range(10)]
+        assert server.connections == 10
+        assert max(server.received) - min(server.received) < 0.05
+        assert results.receive_spread is not None
+    
+    def test_sync_wrapper_and_empty_bodies(self):
+        """Test the synchronous wrapper and requests without a body."""
+        async def serve(results):
+            async with H2Server() as server:
+                req = burpr.parse_string(f"GET / HTTP/2\nHost: {server.host}\n\n")
+                req.transport = TransportEnum.HTTP
+                await asyncio.sleep(0)
+                results.extend(await asyncio.get_running_loop().run_in_executor(
+                    None, lambda: race([burpr.clone(req) for _ in range(3)], warmup=0)))
+        
+        results = []
+        asyncio.run(serve(results))
+        
+        assert [r.response.status_code for r in results] == [200, 200, 200]
+    
+    def test_invalid_arguments(self):
+        """Test unknown modes and mixed targets are rejected."""
+        req1 = burpr.parse_string("GET / HTTP/2\nHost: a.example.com\n\n")
+        req2 = burpr.parse_string("GET / HTTP/2\nHost: b.example.com\n\n")
+        
+        with pytest.raises(ValueError):
+            race([req1], mode="h3")
+        with pytest.raises(ValueError):
+            race([req1, req2])
+        assert race([]) == []
@@ -0,0 +1,127 @@
+import httpx
+import pytest
+from burpr import burpr
+from burpr.matchers import Contains, MatchResult, ResponseMatcher, Status
+from burpr.results import ResultLog, ResultRecord, iter_results, response_hash, HEADER
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def write_log(path, count, **options):
+    with ResultLog(path, **options) as log:
+        for i in range(count):
+            log.append(i, 200 if i % 10 else 302, length=100 + i, latency=0.25, matched=(i == 7) if i < 10 else None)
+    return path
+
+
+class TestResultLog:
+    """Test the append-only binary result log."""
+    
+    def test_roundtrip_and_filters(self, tmp_path):
+        """Test records read back in order and filter by status and verdict."""
+        path = write_log(tmp_path / "run.log", 1000, batch_size=64)
+        
+        records = list(iter_results(path))
+        assert len(records) == 1000
+        assert records[7] == ResultRecord(7, 200, 107, 0.25, True, None)
+        assert records[8].matched is False and records[500].matched is None
+        
+        assert [r.payload_id for r in iter_results(path, matched=True)] == [7]
+        assert len(list(iter_results(path, status=302))) == 100
+        assert len(list(iter_results(path, status=(200, 302), where=lambda r: r.length > 1000))) == 99
+        assert [r.payload_id for r in iter_results(path, start=995)] == [995, 996, 997, 998, 999]
+    
+    def test_compact_records(self, tmp_path):
+        """Test records are fixed-size: 19 bytes plus the hash."""
+        path = write_log(tmp_path / "plain.log", 100)
+        assert path.stat().st_size == HEADER.size + 100 * 19
+        
+        hashed = write_log(tmp_path / "hashed.log", 100, hash_size=8)
+        assert hashed.stat().st_size == HEADER.size + 100 * 27
+    
+    def test_batched_writes_and_fsync(self, tmp_path):
+        """Test records are written in batches or once the fsync interval passes."""
+        path = tmp_path / "run.log"
+        clock = FakeClock()
+        log = ResultLog(path, batch_size=10, fsync_interval=5.0, clock=clock)
+        
+        for i in range(9):
+            log.append(i, 200)
+        assert len(log) == 9
+        assert len(list(iter_results(path))) == 0
+        
+        log.append(9, 200)
+        assert len(list(iter_results(path))) == 10
+        
+        clock.now += 5
+        log.append(10, 200)
+        assert len(list(iter_results(path))) == 11
+        log.close()
+    
+    def test_reopen_appends_and_drops_torn_record(self, tmp_path):
+        """Test reopening keeps the hash size and drops a half-written record."""
+        path = write_log(tmp_path / "run.log", 5, hash_size=16)
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 10)
+        
+        assert len(list(iter_results(path))) == 5
+        with ResultLog(path) as log:
+            assert log.hash_size == 16
+            assert len(log) == 5
+            log.append(5, 404, body_hash=response_hash(b"body"))
+        
+        records = list(iter_results(path))
+        assert [r.payload_id for r in records] == [0, 1, 2, 3, 4, 5]
+        assert records[5].hash == response_hash(b"body")
+        assert records[0].hash == bytes(16)
+    
+    def test_add_responses(self, tmp_path):
+        """Test responses, MatchResults and exceptions are summarised."""
+        path = tmp_path / "run.log"
+        with ResultLog(path, hash_size=16) as log:
+            log.add(1, httpx.Response(200, content=b"hello"), latency=0.5)
+            log.add(2, MatchResult(True, 302, {"content-length": "9000"}, b"partial", False))
+            log.add(3, ConnectionError())
+        
+        first, second, third = iter_results(path)
+        assert (first.status, first.length, first.latency, first.matched) == (200, 5, 0.5, None)
+        assert first.hash == response_hash(b"hello")
+        assert (second.status, second.length, second.matched) == (302, 9000, True)
+        assert second.hash == bytes(16)
+        assert (third.status, third.length) == (0, 0)
+    
+    def test_add_head_verdict(self, tmp_path):
+        """Test a MatchResult decided by its status logs Content-Length and no hash."""
+        client = httpx.Client(transport=httpx.MockTransport(
+            lambda request: httpx.Response(404, content=b"x" * 5000)))
+        req = burpr.parse_string("GET / HTTP/1.1\nHost: example.com\n\n")
+        result = ResponseMatcher(Status(200), Contains("x")).match(req, client)
+        
+        path = tmp_path / "run.log"
+        with ResultLog(path, hash_size=8) as log:
+            log.add(1, result)
+        
+        record, = iter_results(path)
+        assert (record.status, record.length, record.matched) == (404, 5000, False)
+        assert record.hash == bytes(8)
+    
+    def test_validation(self, tmp_path):
+        """Test bad hash sizes and foreign files are rejected."""
+        with pytest.raises(ValueError):
+            ResultLog(tmp_path / "a.log", hash_size=5)
+        with ResultLog(tmp_path / "b.log", hash_size=8) as log:
+            with pytest.raises(ValueError):
+                log.append(1, 200, body_hash=b"short")
+        
+        other = tmp_path / "other.txt"
+        other.write_bytes(b"not a result log")
+        with pytest.raises(ValueError):
+            list(iter_results(other))
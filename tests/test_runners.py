@@ -0,0 +1,164 @@
+import asyncio
+import httpx
+import pytest
+import requests
+from burpr import burpr
+from burpr.runners import run_async, ThreadedRunner
+
+
+TEMPLATE = """POST /login2 HTTP/1.1
+Host: example.com
+Content-Type: application/x-www-form-urlencoded
+
+mfa-code=%MFA_CODE%"""
+
+
+def collect(agen):
+    """Drain an async generator into a list."""
+    async def drain():
+        return [item async for item in agen]
+    return asyncio.run(drain())
+
+
+class TestAsyncRunner:
+    """Test the asyncio batch execution engine."""
+    
+    def test_amake_request(self):
+        """Test sending a single request asynchronously."""
+        seen = []
+        
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, text="ok")
+        
+        async def main():
+            req = burpr.parse_string(TEMPLATE).bind("%MFA_CODE%", "1234")
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await req.amake_request(client)
+        
+        res = asyncio.run(main())
+        
+        assert res.status_code == 200
+        assert seen[0].url == "https://example.com/login2"
+        assert seen[0].content == b"mfa-code=1234"
+        assert seen[0].headers["Content-Length"] == "13"
+    
+    def test_run_async_yields_every_payload(self):
+        """Test each payload is rendered, sent and paired with its response."""
+        def handler(request):
+            return httpx.Response(200, text=request.content.decode())
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        template = burpr.compile(burpr.parse_string(TEMPLATE))
+        payloads = [{"%MFA_CODE%": f"{pin:04d}"} for pin in range(25)]
+        
+        results = collect(run_async(template, payloads, concurrency=5, client=client))
+        
+        assert len(results) == 25
+        for payload, res in results:
+            assert res.text == f"mfa-code={payload['%MFA_CODE%']}"
+    
+    def test_run_async_bounds_concurrency(self):
+        """Test no more than `concurrency` requests are ever in flight."""
+        in_flight = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        payloads = ({"%MFA_CODE%": str(pin)} for pin in range(40))
+        req = burpr.parse_string(TEMPLATE)
+        
+        results = collect(run_async(req, payloads, concurrency=8, client=client))
+        
+        assert len(results) == 40
+        assert peak == 8
+    
+    def test_run_async_exceptions(self):
+        """Test failed requests raise by default or are yielded on request."""
+        def handler(request):
+            if request.content.endswith(b"=2"):
+                raise httpx.ConnectError("refused")
+            return httpx.Response(200)
+        
+        template = burpr.compile(burpr.parse_string(TEMPLATE))
+        payloads = [{"%MFA_CODE%": str(pin)} for pin in range(4)]
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        results = collect(run_async(template, payloads, client=client, return_exceptions=True))
+        errors = [payload for payload, res in results if isinstance(res, Exception)]
+        assert errors == [{"%MFA_CODE%": "2"}]
+        
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with pytest.raises(httpx.ConnectError):
+            collect(run_async(template, payloads, client=client))
+    
+    def test_run_async_invalid_concurrency(self):
+        """Test concurrency must be positive."""
+        with pytest.raises(ValueError):
+            collect(run_async(burpr.parse_string(TEMPLATE), [], concurrency=0))
+
+
+@pytest.mark.usefixtures("real_requests")
+class TestThreadedRunner:
+    """Test the thread-pool executor for the requests backend."""
+    
+    def make_requests(self, host, count):
+        template = burpr.compile(burpr.parse_string(TEMPLATE.replace("example.com", host)))
+        for pin in range(count):
+            req = template.render({"%MFA_CODE%": f"{pin:04d}"})
+            req.transport = "http"
+            yield req
+    
+    def test_run_reuses_worker_sessions(self, echo_server):
+        """Test every request is answered over a small set of reused connections."""
+        with ThreadedRunner(workers=4) as runner:
+            results = list(runner.run(self.make_requests(echo_server, 40)))
+        
+        assert len(results) == 40
+        for req, res in results:
+            assert res.status_code == 200
+            assert res.text == req.body
+        
+        ports = {res.headers["X-Client-Port"] for _, res in results}
+        assert len(ports) <= 4
+    
+    def test_run_ordered(self, echo_server):
+        """Test results can be streamed back in submission order."""
+        with ThreadedRunner(workers=4) as runner:
+            bodies = [res.text for _, res in runner.run(self.make_requests(echo_server, 20), ordered=True)]
+        
+        assert bodies == [f"mfa-code={pin:04d}" for pin in range(20)]
+    
+    def test_run_return_exceptions(self):
+        """Test connection errors are yielded when requested."""
+        reqs = list(self.make_requests("127.0.0.1:1", 2))
+        
+        with ThreadedRunner(workers=2) as runner:
+            results = list(runner.run(reqs, return_exceptions=True))
+            assert all(isinstance(res, requests.ConnectionError) for _, res in results)
+            
+            with pytest.raises(requests.ConnectionError):
+                list(runner.run(reqs))
+    
+    def test_session_factory(self, echo_server):
+        """Test a custom session factory is used once per worker thread."""
+        created = []
+        
+        def factory():
+            session = requests.Session()
+            session.headers["X-Custom"] = "1"
+            created.append(session)
+            return session
+        
+        with ThreadedRunner(workers=2, session_factory=factory) as runner:
+            results = list(runner.run(self.make_requests(echo_server, 10)))
+        
+        assert len(results) == 10
+        assert 1 <= len(created) <= 2
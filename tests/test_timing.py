@@ -0,0 +1,95 @@
+import asyncio
+import httpx
+import pytest
+from burpr import burpr, timing
+
+
+TEMPLATE = """POST /login HTTP/1.1
+Host: example.com
+
+username=%USER%&password=x"""
+
+
+def login(user):
+    return burpr.compile(burpr.parse_string(TEMPLATE)).render({"%USER%": user})
+
+
+def slow_for(user, delay):
+    """Mock transport taking `delay` longer to answer for one username."""
+    seen = []
+
+    async def handler(request):
+        seen.append(request.content)
+        if f"username={user}&".encode() in request.content:
+            await asyncio.sleep(delay)
+        return httpx.Response(200, text="Invalid username or password")
+
+    return seen, httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestStatistics:
+    """Test the robust statistics behind the timing harness."""
+    
+    def test_median_and_trimmed_mean(self):
+        """Test the median and trimmed mean ignore outliers."""
+        values = [1, 2, 3, 4, 100]
+        assert timing.median(values) == 3
+        assert timing.median([1, 2, 3, 4]) == 2.5
+        assert timing.trimmed_mean(values, 0.2) == 3
+        assert timing.trimmed_mean(values, 0) == 22
+        with pytest.raises(ValueError):
+            timing.trimmed_mean(values, 0.5)
+    
+    def test_mann_whitney(self):
+        """Test the U statistic and one- and two-sided p-values."""
+        slow = [10, 11, 12, 13, 14, 15, 16, 17]
+        fast = [1, 2, 3, 4, 5, 6, 7, 8]
+        
+        u, p = timing.mann_whitney(slow, fast)
+        assert u == 64
+        assert p < 0.001
+        assert timing.mann_whitney(slow, fast, "less")[1] > 0.99
+        assert timing.mann_whitney(fast, slow, "two-sided")[1] == pytest.approx(2 * p)
+        
+        # Identical samples are all ties: no evidence either way
+        assert timing.mann_whitney([5] * 6, [5] * 6) == (18, 1.0)
+        with pytest.raises(ValueError):
+            timing.mann_whitney(slow, fast, "sideways")
+
+
+class TestCompare:
+    """Test interleaved candidate/baseline timing comparisons."""
+    
+    def test_detects_slow_candidate_early(self):
+        """Test a consistently slower candidate is found before max_samples."""
+        seen, client = slow_for("carlos", 0.02)
+        
+        result = timing.compare(login("carlos"), login("nobody"), client=client,
+                                min_samples=6, batch=3, max_samples=60, seed=1)
+        
+        assert result
+        assert result.p_value < 0.01
+        assert len(result.candidate) == len(result.baseline) < 60
+        assert result.delta > 0.015
+        assert result.summary()["candidate_median"] > result.summary()["baseline_median"]
+        # Warm-up requests plus the measured pairs
+        assert len(seen) == result.requests + 2
+    
+    def test_interleaves_pairs(self):
+        """Test candidates and baselines alternate within every pair."""
+        seen, client = slow_for("carlos", 0)
+        
+        result = timing.compare(login("carlos"), login("nobody"), client=client,
+                                min_samples=4, max_samples=8, batch=2, warmup=0, seed=3)
+        
+        assert not result
+        assert result.requests == 16
+        for i in range(0, len(seen), 2):
+            assert {b"carlos" in seen[i], b"carlos" in seen[i + 1]} == {True, False}
+    
+    def test_validation(self):
+        """Test invalid sampling parameters are rejected."""
+        with pytest.raises(ValueError):
+            timing.compare(login("a"), login("b"), min_samples=10, max_samples=5)
+        with pytest.raises(ValueError):
+            timing.compare(login("a"), login("b"), alternative="sideways")